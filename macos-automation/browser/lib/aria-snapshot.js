@@ -300,9 +300,13 @@
       interactiveOnly = true,  // Only include interactive elements
       maxDepth = 10,           // Maximum nesting depth
       maxElements = 200,       // Maximum elements to include
-      includeValues = true     // Include current values
+      includeValues = true,    // Include current values
+      startRef = 1,            // First ref to include in the output
+      endRef = null            // Last ref to include (default: startRef + maxElements - 1)
     } = options;
 
+    const lastRef = endRef !== null ? endRef : startRef + maxElements - 1;
+
     // Clear previous refs
     elementRefs.clear();
 
@@ -310,9 +314,10 @@
     const refs = {};
     let refCounter = 1;
     let elementCount = 0;
+    let truncated = false;
 
     function processElement(el, depth = 0) {
-      if (elementCount >= maxElements) return;
+      if (truncated) return;
       if (depth > maxDepth) return;
       if (!isVisible(el)) return;
 
@@ -336,16 +341,33 @@
         return;
       }
 
-      const name = getAccessibleName(el);
-      const value = includeValues ? getValue(el) : null;
+      if (refCounter > lastRef) {
+        truncated = true;
+        return;
+      }
 
       // Generate ref ID
       const ref = `e${refCounter++}`;
-      elementCount++;
 
       // Store element for later interaction
       elementRefs.set(ref, el);
 
+      // Refs before the requested window keep their numbering (so they stay
+      // usable) but are not described in the output
+      if (refCounter <= startRef) {
+        if (!interactiveOnly || CONTENT_ROLES.has(role)) {
+          for (const child of el.children) {
+            processElement(child, depth + 1);
+          }
+        }
+        return;
+      }
+
+      elementCount++;
+
+      const name = getAccessibleName(el);
+      const value = includeValues ? getValue(el) : null;
+
       // Build line
       const indent = '  '.repeat(depth);
       let line = `${indent}[${ref}] ${role || 'element'}`;
@@ -400,8 +422,16 @@
     // Start from body
     processElement(document.body);
 
+    if (startRef > 1) {
+      lines.unshift(`[refs e1-e${Math.min(startRef, refCounter) - 1} omitted]`);
+    }
+    if (truncated) {
+      lines.push(`[refs after e${lastRef} trimmed]`);
+    }
+
     return {
       snapshot: lines.join('\n'),
+      truncated: truncated,
       refs: refs,
       url: window.location.href,
       title: document.title,
@@ -0,0 +1,65 @@
+/**
+ * Long-lived JavaScript evaluation worker for Safari (JXA).
+ *
+ * Keeps a single osascript process around so that simple page evaluations
+ * do not pay for bash + osascript startup on every call.
+ *
+ * Protocol (one JSON object per line):
+ *   stdin:  {"code": "<javascript to run in the current tab>"}
+ *   stdout: {"success": true, "result": <value>}
+ *           {"success": false, "error": "<message>"}
+ *
+ * The worker exits when stdin is closed.
+ *
+ * Usage:
+ *   osascript -l JavaScript js-worker.js
+ */
+
+ObjC.import('Foundation');
+
+function run() {
+  const safari = Application('Safari');
+  const stdin = $.NSFileHandle.fileHandleWithStandardInput;
+  const stdout = $.NSFileHandle.fileHandleWithStandardOutput;
+
+  function write(response) {
+    const line = $(JSON.stringify(response) + '\n');
+    stdout.writeData(line.dataUsingEncoding($.NSUTF8StringEncoding));
+  }
+
+  function evaluate(request) {
+    if (safari.windows.length === 0) {
+      return { success: false, error: 'No Safari window open' };
+    }
+    try {
+      const value = safari.doJavaScript(request.code, { in: safari.windows[0].currentTab });
+      return { success: true, result: value === undefined ? null : value };
+    } catch (e) {
+      return { success: false, error: 'JavaScript error: ' + e.message };
+    }
+  }
+
+  let buffer = '';
+  while (true) {
+    // Blocks until input is available; empty data means stdin was closed
+    const data = stdin.availableData;
+    if (data.length === 0) break;
+    buffer += $.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding).js;
+
+    let newline;
+    while ((newline = buffer.indexOf('\n')) >= 0) {
+      const line = buffer.slice(0, newline);
+      buffer = buffer.slice(newline + 1);
+      if (!line) continue;
+
+      let request;
+      try {
+        request = JSON.parse(line);
+      } catch (e) {
+        write({ success: false, error: 'Invalid request: ' + e.message });
+        continue;
+      }
+      write(evaluate(request));
+    }
+  }
+}
@@ -14,10 +14,13 @@
 #   ./navigate.sh <url>
 #   ./navigate.sh --new-tab <url>
 #   ./navigate.sh --timeout 30 <url>
+#   ./navigate.sh --skip-inject <url>
 #
 # Options:
 #   --new-tab       Open URL in a new tab
 #   --timeout <s>   Wait timeout in seconds (default: 20)
+#   --skip-inject   Only inject the ARIA library if the page does not
+#                   already have it (e.g. same-document navigation)
 #
 # Output:
 #   JSON with success status and page info
@@ -35,6 +38,7 @@ fi
 # Default values
 NEW_TAB=false
 TIMEOUT=20
+SKIP_INJECT=false
 URL=""
 
 # Parse arguments
@@ -48,8 +52,12 @@ while [[ $# -gt 0 ]]; do
             TIMEOUT="$2"
             shift 2
             ;;
+        --skip-inject)
+            SKIP_INJECT=true
+            shift
+            ;;
         -h|--help)
-            head -30 "$0" | tail -25
+            head -33 "$0" | tail -28
             exit 0
             ;;
         -*)
@@ -77,6 +85,7 @@ set targetUrl to "$URL"
 set newTab to "$NEW_TAB"
 set timeoutSec to $TIMEOUT
 set libPath to "$ARIA_LIB_PATH"
+set skipInject to "$SKIP_INJECT"
 
 tell application "Safari"
     activate
@@ -129,13 +138,24 @@ tell application "Safari"
     -- Longer delay for dynamic content (helps avoid bot detection)
     delay 1.5
 
-    -- Inject ARIA snapshot library by reading from file
-    try
-        set ariaLib to read POSIX file libPath
-        do JavaScript ariaLib in current tab of front window
-    on error errMsg
-        return "{\"success\": false, \"error\": \"Failed to inject ARIA library: " & errMsg & "\"}"
-    end try
+    -- Inject ARIA snapshot library by reading from file, unless asked to
+    -- reuse a library that survived the navigation
+    set needsInject to true
+    if skipInject is "true" then
+        try
+            set hasLib to do JavaScript "typeof window.__ariaSnapshot === 'function'" in current tab of front window
+            if hasLib is true then set needsInject to false
+        end try
+    end if
+
+    if needsInject then
+        try
+            set ariaLib to read POSIX file libPath
+            do JavaScript ariaLib in current tab of front window
+        on error errMsg
+            return "{\"success\": false, \"error\": \"Failed to inject ARIA library: " & errMsg & "\"}"
+        end try
+    end if
 
     -- Wait for page stability (dynamic content to finish loading)
     delay 0.5
@@ -8,9 +8,12 @@
 # Usage:
 #   ./screenshot.sh
 #   ./screenshot.sh --output /path/to/screenshot.png
+#   ./screenshot.sh --output /path/to/screenshot.png --no-interactive
 #
 # Options:
-#   --output <path>   Save screenshot to file (default: stdout as base64)
+#   --output <path>    Save screenshot to file (default: stdout as base64)
+#   --no-interactive   If the Safari window can't be captured directly, fail
+#                      instead of waiting for a window to be clicked
 #
 # Output:
 #   JSON with base64 screenshot data or file path
@@ -25,6 +28,7 @@ else
 fi
 
 OUTPUT=""
+INTERACTIVE=true
 
 while [[ $# -gt 0 ]]; do
     case $1 in
@@ -32,8 +36,12 @@ while [[ $# -gt 0 ]]; do
             OUTPUT="$2"
             shift 2
             ;;
+        --no-interactive)
+            INTERACTIVE=false
+            shift
+            ;;
         -h|--help)
-            head -20 "$0" | tail -15
+            head -21 "$0" | tail -16
             exit 0
             ;;
         *)
@@ -60,8 +68,10 @@ if [[ -n "$OUTPUT" ]]; then
 
     if [[ -f "$OUTPUT" ]]; then
         echo "{\"success\": true, \"path\": \"$OUTPUT\"}"
+    elif [[ "$INTERACTIVE" != true ]]; then
+        echo "{\"success\": false, \"error\": \"Failed to capture screenshot\"}"
     else
-        # Fallback: use window capture
+        # Fallback: let the user click the window to capture
         screencapture -w "$OUTPUT" 2>/dev/null
         if [[ -f "$OUTPUT" ]]; then
             echo "{\"success\": true, \"path\": \"$OUTPUT\"}"
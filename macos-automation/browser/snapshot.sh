@@ -15,14 +15,17 @@
 #   ./snapshot.sh --inject
 #   ./snapshot.sh --all          # Include non-interactive elements
 #   ./snapshot.sh --max 100      # Limit number of elements
+#   ./snapshot.sh --start-ref 201 --end-ref 400
 #
 # Options:
 #   --inject            Inject ARIA library before snapshot
 #   --all               Include all elements, not just interactive
 #   --max <n>           Maximum elements to include (default: 200)
+#   --start-ref <n>     First ref to include (default: 1)
+#   --end-ref <n>       Last ref to include (default: start + max - 1)
 #
 # Output:
-#   JSON with snapshot text and refs mapping
+#   JSON with snapshot text, refs mapping and a truncated flag
 # ==============================================================================
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
@@ -38,6 +41,8 @@ fi
 INJECT=false
 INTERACTIVE_ONLY=true
 MAX_ELEMENTS=200
+START_REF=1
+END_REF=null
 
 # Parse arguments
 while [[ $# -gt 0 ]]; do
@@ -54,8 +59,16 @@ while [[ $# -gt 0 ]]; do
             MAX_ELEMENTS="$2"
             shift 2
             ;;
+        --start-ref)
+            START_REF="$2"
+            shift 2
+            ;;
+        --end-ref)
+            END_REF="$2"
+            shift 2
+            ;;
         -h|--help)
-            head -32 "$0" | tail -27
+            head -35 "$0" | tail -30
             exit 0
             ;;
         *)
@@ -72,6 +85,8 @@ osascript << EOF
 set shouldInject to "$INJECT"
 set interactiveOnly to $INTERACTIVE_ONLY
 set maxElements to $MAX_ELEMENTS
+set startRef to $START_REF
+set endRef to "$END_REF"
 set libPath to "$ARIA_LIB_PATH"
 
 tell application "Safari"
@@ -103,7 +118,7 @@ tell application "Safari"
     end try
 
     -- Generate snapshot
-    set jsOptions to "{ interactiveOnly: " & interactiveOnly & ", maxElements: " & maxElements & " }"
+    set jsOptions to "{ interactiveOnly: " & interactiveOnly & ", maxElements: " & maxElements & ", startRef: " & startRef & ", endRef: " & endRef & " }"
     set jsCode to "JSON.stringify(window.__ariaSnapshot(" & jsOptions & "))"
 
     try
@@ -4,29 +4,43 @@
 Used by search-emails.sh to surface links that are lost when
 Mail.app renders HTML emails as plain text.
 """
-import email
+import html
 import re
 import sys
+from collections.abc import Iterator
+from email.message import Message
+from email.parser import BytesParser
+from email.policy import compat32
 
+_HREF_RE = re.compile(rb'href=["\']?(https?://[^"\'\s>]+)')
 
-def extract_links(source_file: str) -> list[str]:
-    with open(source_file) as f:
-        msg = email.message_from_file(f)
 
-    urls: list[str] = []
-    seen: set[str] = set()
+def _iter_urls(msg: Message) -> Iterator[str]:
+    """Yield href URLs from the text/html parts of a message, in order."""
     for part in msg.walk():
-        if part.get_content_type() == "text/html":
-            payload = part.get_payload(decode=True)
-            if payload:
-                charset = part.get_content_charset() or "utf-8"
-                html = payload.decode(charset, errors="replace")
-                for url in re.findall(r'href=["\']?(https?://[^"\'\s>]+)', html):
-                    url = url.replace("&amp;", "&")
-                    if url not in seen:
-                        seen.add(url)
-                        urls.append(url)
-    return urls
+        # Only text/html parts carry hrefs; skip attachments before decoding
+        if part.get_content_type() != "text/html":
+            continue
+        payload = part.get_payload(decode=True)
+        if not payload:
+            continue
+        charset = part.get_content_charset() or "utf-8"
+        # The bytes scan needs an ASCII-compatible encoding; transcode
+        # the rare UTF-16/32 bodies so their hrefs are still found.
+        if charset.startswith(("utf-16", "utf-32")):
+            payload = payload.decode(charset, errors="replace").encode("utf-8")
+            charset = "utf-8"
+        for m in _HREF_RE.findall(payload):
+            url = m.decode(charset, errors="replace")
+            yield html.unescape(url) if "&" in url else url
+
+
+def extract_links(source_file: str) -> list[str]:
+    with open(source_file, "rb") as f:
+        msg = BytesParser(policy=compat32).parse(f)
+
+    # dict.fromkeys dedups in C while keeping first-seen order
+    return list(dict.fromkeys(_iter_urls(msg)))
 
 
 if __name__ == "__main__":
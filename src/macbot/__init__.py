@@ -1,14 +1,28 @@
 """MacBot - A modular agent loop with scheduled LLM-powered tasks."""
 
 from importlib.metadata import version, PackageNotFoundError
+from typing import TYPE_CHECKING, Any
 
 try:
     __version__ = version("sonofsimon")
 except PackageNotFoundError:
     __version__ = "0.0.0-dev"
 
-from macbot.core.agent import Agent
-from macbot.core.scheduler import TaskScheduler
-from macbot.core.task import Task, TaskRegistry
+if TYPE_CHECKING:
+    from macbot.core.agent import Agent
+    from macbot.core.scheduler import TaskScheduler
+    from macbot.core.task import Task, TaskRegistry
 
 __all__ = ["Agent", "TaskScheduler", "Task", "TaskRegistry"]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolved lazily so that `import macbot.<submodule>` (e.g. the CLI)
+    # does not pull in the agent and its LLM provider SDKs up front.
+    if name in __all__:
+        import macbot.core
+
+        value = getattr(macbot.core, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
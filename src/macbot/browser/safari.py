@@ -1,14 +1,22 @@
 """Safari browser controller using ARIA-based automation."""
 
 import asyncio
+import functools
+import hashlib
 import json
 import logging
 import os
 import shlex
 import sys
-from typing import Any
+import tempfile
+import uuid
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any, TypeVar, cast
+from urllib.parse import urlsplit
 
 from macbot.browser.types import BrowserResult, Snapshot
+from macbot.utils.jsonio import json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -16,18 +24,76 @@ logger = logging.getLogger(__name__)
 if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
     SCRIPTS_BASE = os.path.join(sys._MEIPASS, "macos-automation", "browser")
 else:
-    _PACKAGE_DIR = os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    )
+    # src/macbot/browser/safari.py -> repository root
+    _PACKAGE_DIR = str(Path(__file__).resolve().parents[3])
     SCRIPTS_BASE = os.path.join(_PACKAGE_DIR, "macos-automation", "browser")
 
 
+# Script paths already checked to exist, keyed by script name
+_SCRIPT_PATHS: dict[str, str] = {}
+
+# Returned by a registered-function call when the page no longer defines it
+_JS_MISSING = "__macbot_fn_missing__"
+
+# Largest single response line accepted from the JavaScript worker. Results
+# such as the text of a large page easily exceed asyncio's 64 KiB default.
+_WORKER_LINE_LIMIT = 64 * 1024 * 1024
+
+
 class BrowserError(Exception):
     """Exception raised for browser automation errors."""
 
     pass
 
 
+_F = TypeVar("_F", bound=Callable[..., Awaitable[Any]])
+
+
+def _mutates(fn: _F) -> _F:
+    """Mark a SafariBrowser method as one that can change the page.
+
+    Calling it invalidates the cached snapshot before the action runs.
+    """
+
+    @functools.wraps(fn)
+    async def wrapper(self: "SafariBrowser", *args: Any, **kwargs: Any) -> Any:
+        self._mutations += 1
+        return await fn(self, *args, **kwargs)
+
+    return cast(_F, wrapper)
+
+
+def _js_key(code: str) -> str:
+    """Short stable key for a JavaScript snippet."""
+    return hashlib.blake2b(code.encode(), digest_size=8).hexdigest()
+
+
+def _js_worker_command() -> list[str]:
+    """Command line for the persistent JavaScript evaluation worker."""
+    return ["osascript", "-l", "JavaScript", os.path.join(SCRIPTS_BASE, "lib", "js-worker.js")]
+
+
+def _resolve_script(script_name: str) -> str:
+    """Resolve a script name to its path, checking existence only once.
+
+    Args:
+        script_name: Name of the script (e.g., "navigate.sh")
+
+    Returns:
+        Absolute path to the script
+
+    Raises:
+        BrowserError: If the script does not exist
+    """
+    script_path = _SCRIPT_PATHS.get(script_name)
+    if script_path is None:
+        script_path = os.path.join(SCRIPTS_BASE, script_name)
+        if not os.path.exists(script_path):
+            raise BrowserError(f"Script not found: {script_path}")
+        _SCRIPT_PATHS[script_name] = script_path
+    return script_path
+
+
 async def _run_script(
     script_name: str, args: list[str] | None = None, timeout: int = 30
 ) -> dict[str, Any]:
@@ -44,45 +110,52 @@ async def _run_script(
     Raises:
         BrowserError: If script fails or returns error
     """
-    script_path = os.path.join(SCRIPTS_BASE, script_name)
-
-    if not os.path.exists(script_path):
-        raise BrowserError(f"Script not found: {script_path}")
+    script_path = _resolve_script(script_name)
+    # No-arg scripts (close, dismiss_cookies) skip the list concatenation
+    cmd_parts = [script_path, *args] if args else [script_path]
 
-    cmd_parts = [script_path] + (args or [])
-    cmd = " ".join(shlex.quote(p) for p in cmd_parts)
-
-    logger.debug(f"Running browser script: {cmd}")
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("Running browser script: %s", shlex.join(cmd_parts))
 
     try:
-        process = await asyncio.create_subprocess_shell(
-            cmd,
+        # Exec the script directly; going through a shell costs an extra
+        # fork/exec of /bin/sh on every browser action.
+        process = await asyncio.create_subprocess_exec(
+            *cmd_parts,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
         stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
 
-        stdout_str = stdout.decode().strip()
-        stderr_str = stderr.decode().strip()
-
-        logger.debug(f"Script stdout: {stdout_str[:500] if stdout_str else '(empty)'}")
-
-        if stderr_str:
-            logger.debug(f"Script stderr: {stderr_str}")
+        # Parse stdout as bytes; decoding the whole (possibly large) payload
+        # to str first would be a redundant pass
+        if debug:
+            preview = stdout[:500].decode(errors="replace").strip()
+            logger.debug("Script stdout: %s", preview or "(empty)")
+            stderr_str = stderr.decode(errors="replace").strip()
+            if stderr_str:
+                logger.debug("Script stderr: %s", stderr_str)
 
-        if not stdout_str:
+        if not stdout or stdout.isspace():
             raise BrowserError("Script returned no output")
 
         try:
-            result = json.loads(stdout_str)
+            result = json_loads(stdout)
         except json.JSONDecodeError as e:
-            raise BrowserError(f"Invalid JSON response: {e}\nOutput: {stdout_str[:200]}")
+            output = stdout[:200].decode(errors="replace").strip()
+            raise BrowserError(f"Invalid JSON response: {e}\nOutput: {output}")
 
-        if not result.get("success", True) and "error" in result:
-            raise BrowserError(result["error"])
+        # Scripts always include "error" on failure, so it alone decides
+        err = result.get("error")
+        if err:
+            raise BrowserError(err)
 
         return result
 
+    except FileNotFoundError:
+        _SCRIPT_PATHS.pop(script_name, None)
+        raise BrowserError(f"Script not found: {script_path}")
     except asyncio.TimeoutError:
         raise BrowserError(f"Script timed out after {timeout} seconds")
     except Exception as e:
@@ -113,16 +186,158 @@ class SafariBrowser:
         await browser.click("e2")
     """
 
+    # Upper bound on browser scripts running at once for this instance
+    MAX_CONCURRENT_SCRIPTS = 4
+
     def __init__(self):
         """Initialize the Safari browser controller."""
         self._last_snapshot: Snapshot | None = None
+        # get_element_info results for _last_snapshot, keyed by ref
+        self._info_cache: dict[str, dict[str, Any] | None] = {}
+        self._sema = asyncio.Semaphore(self.MAX_CONCURRENT_SCRIPTS)
+        # Snapshot cache, valid while neither counter has moved since the
+        # snapshot was requested: bumped on navigate and on any page mutation
+        self._nav_epoch = 0
+        self._mutations = 0
+        self._snap_cache: tuple[int, int, tuple[Any, ...], Snapshot] | None = None
+        # Origins whose current document already has the ARIA library
+        self._injected_origins: set[str] = set()
+        # Persistent osascript process for plain JavaScript evaluation and the
+        # lock serializing requests to it, both tied to the loop that made them
+        self._worker: asyncio.subprocess.Process | None = None
+        self._worker_lock: asyncio.Lock | None = None
+        self._worker_loop: asyncio.AbstractEventLoop | None = None
+        self._worker_disabled = False
+        # Snippets compiled with register_js(): code hash -> (name, code)
+        self._js_fns: dict[str, tuple[str, str]] = {}
+
+    async def _run(
+        self, script_name: str, args: list[str] | None = None, timeout: int = 30
+    ) -> dict[str, Any]:
+        """Run a browser script, bounded by this instance's concurrency limit."""
+        async with self._sema:
+            return await _run_script(script_name, args, timeout=timeout)
+
+    def _bind_worker_loop(self) -> asyncio.Lock:
+        """Return the worker lock for the running event loop.
+
+        A browser reused under a new ``asyncio.run()`` cannot touch the lock or
+        worker pipes of the previous loop, so both are replaced. The old worker
+        exits once its stdin is closed.
+        """
+        loop = asyncio.get_running_loop()
+        if self._worker_lock is None or self._worker_loop is not loop:
+            self._worker_loop = loop
+            self._worker_lock = asyncio.Lock()
+            self._worker = None
+        return self._worker_lock
+
+    async def aclose(self) -> None:
+        """Stop the JavaScript worker.
+
+        Call this when done with the browser. The worker is started again if
+        the browser is used afterwards.
+        """
+        self._bind_worker_loop()
+        await self._stop_worker()
+
+    async def _ensure_worker(self) -> asyncio.subprocess.Process:
+        """Start the JavaScript evaluation worker if it is not running."""
+        worker = self._worker
+        if worker is None or worker.returncode is not None:
+            worker = await asyncio.create_subprocess_exec(
+                *_js_worker_command(),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                limit=_WORKER_LINE_LIMIT,
+            )
+            self._worker = worker
+        return worker
+
+    async def _stop_worker(self) -> None:
+        """Kill the JavaScript evaluation worker, if any, and reap it."""
+        worker, self._worker = self._worker, None
+        if worker is None:
+            return
+        if worker.returncode is None:
+            try:
+                worker.kill()
+            except ProcessLookupError:
+                pass
+        await worker.wait()
+
+    async def _eval_js(self, code: str, timeout: int = 30) -> dict[str, Any] | None:
+        """Evaluate JavaScript in the current tab via the persistent worker.
+
+        Avoids the bash + osascript startup that each script call pays.
+
+        Args:
+            code: JavaScript code to evaluate
+            timeout: Timeout in seconds
+
+        Returns:
+            The worker's JSON response, or None if the request could not be
+            sent and the caller should fall back to the equivalent script
+
+        Raises:
+            BrowserError: If evaluation fails or times out, or the worker fails
+                after receiving the code (which may already have run)
+        """
+        if self._worker_disabled:
+            return None
+
+        async with self._bind_worker_loop():
+            try:
+                worker = await self._ensure_worker()
+                assert worker.stdin is not None and worker.stdout is not None
+                worker.stdin.write(json.dumps({"code": code}).encode() + b"\n")
+                await worker.stdin.drain()
+            except OSError as e:
+                logger.debug(f"JavaScript worker unavailable, using scripts: {e}")
+                await self._stop_worker()
+                self._worker_disabled = True
+                return None
+
+            # From here on the code may have run, so running it again through
+            # a script could repeat a click or a form submission
+            try:
+                line = await asyncio.wait_for(worker.stdout.readline(), timeout=timeout)
+            except asyncio.TimeoutError:
+                await self._stop_worker()
+                raise BrowserError(f"Script timed out after {timeout} seconds")
+            except ValueError:
+                # Response line over the limit: the rest of it is still in the
+                # pipe, so this worker is out of sync. Replace it next time.
+                await self._stop_worker()
+                raise BrowserError(
+                    f"JavaScript result larger than {_WORKER_LINE_LIMIT // (1024 * 1024)} MiB"
+                )
+
+            if not line:
+                await self._stop_worker()
+                self._worker_disabled = True
+                raise BrowserError("JavaScript worker exited during evaluation")
+
+        try:
+            result = json_loads(line)
+        except json.JSONDecodeError as e:
+            raise BrowserError(f"Invalid JSON response: {e}\nOutput: {line[:200]!r}")
+
+        err = result.get("error")
+        if err:
+            raise BrowserError(err)
+
+        return result
 
     async def navigate(
         self, url: str, new_tab: bool = False, timeout: int = 20
     ) -> BrowserResult:
         """Navigate to a URL in Safari.
 
-        This also injects the ARIA snapshot library into the page.
+        This also injects the ARIA snapshot library into the page. When
+        staying on the same origin in the same tab, the library is only
+        re-injected if the navigation replaced the document.
 
         Args:
             url: The URL to navigate to
@@ -135,26 +350,45 @@ class SafariBrowser:
         Raises:
             BrowserError: If navigation fails
         """
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        if new_tab or origin not in self._injected_origins:
+            self._injected_origins.clear()
+
         args = ["--timeout", str(timeout)]
         if new_tab:
             args.append("--new-tab")
+        if self._injected_origins:
+            args.append("--skip-inject")
         args.append(url)
 
-        result = await _run_script("navigate.sh", args, timeout=timeout + 10)
+        self._nav_epoch += 1
+        result = await self._run("navigate.sh", args, timeout=timeout + 10)
+        self._injected_origins.add(origin)
         return BrowserResult.from_json(result)
 
     async def snapshot(
-        self, interactive_only: bool = True, max_elements: int = 200, inject: bool = False
+        self,
+        interactive_only: bool = True,
+        max_elements: int = 200,
+        inject: bool = False,
+        start_ref: int = 1,
+        end_ref: int | None = None,
     ) -> Snapshot:
         """Get an ARIA snapshot of the current page.
 
         Returns a snapshot showing all interactive elements with refs that
-        can be used for subsequent interactions.
+        can be used for subsequent interactions. The previous snapshot is
+        reused if nothing has navigated or mutated the page since, unless
+        ``inject`` is set.
 
         Args:
             interactive_only: Only include interactive elements (default: True)
             max_elements: Maximum number of elements to include
             inject: Re-inject the ARIA library before snapshot
+            start_ref: First ref number to include (earlier refs keep their
+                numbering but are omitted from the output)
+            end_ref: Last ref number to include (default: start_ref + max_elements - 1)
 
         Returns:
             Snapshot object with text representation and refs mapping
@@ -162,17 +396,33 @@ class SafariBrowser:
         Raises:
             BrowserError: If snapshot fails
         """
+        key = (interactive_only, max_elements, start_ref, end_ref)
+        # Read before the script runs: an action started meanwhile may have
+        # changed the page after the snapshot was taken
+        version = (self._nav_epoch, self._mutations)
+        cache = self._snap_cache
+        if not inject and cache is not None and cache[:3] == (*version, key):
+            return cache[3]
+
         args = ["--max", str(max_elements)]
         if not interactive_only:
             args.append("--all")
         if inject:
             args.append("--inject")
+        if start_ref > 1:
+            args.extend(["--start-ref", str(start_ref)])
+        if end_ref is not None:
+            args.extend(["--end-ref", str(end_ref)])
 
-        result = await _run_script("snapshot.sh", args)
+        result = await self._run("snapshot.sh", args)
         snapshot = Snapshot.from_json(result)
         self._last_snapshot = snapshot
+        self._info_cache.clear()
+        if version == (self._nav_epoch, self._mutations):
+            self._snap_cache = (*version, key, snapshot)
         return snapshot
 
+    @_mutates
     async def click(self, ref: str) -> BrowserResult:
         """Click an element by its ref.
 
@@ -185,9 +435,10 @@ class SafariBrowser:
         Raises:
             BrowserError: If click fails (element not found, etc.)
         """
-        result = await _run_script("click.sh", [ref])
+        result = await self._run("click.sh", [ref])
         return BrowserResult.from_json(result)
 
+    @_mutates
     async def type(
         self, ref: str, text: str, clear: bool = True, submit: bool = False
     ) -> BrowserResult:
@@ -212,9 +463,10 @@ class SafariBrowser:
             args.append("--submit")
         args.extend([ref, text])
 
-        result = await _run_script("type.sh", args)
+        result = await self._run("type.sh", args)
         return BrowserResult.from_json(result)
 
+    @_mutates
     async def select(self, ref: str, value: str) -> BrowserResult:
         """Select an option in a dropdown.
 
@@ -228,9 +480,10 @@ class SafariBrowser:
         Raises:
             BrowserError: If selection fails
         """
-        result = await _run_script("select.sh", [ref, value])
+        result = await self._run("select.sh", [ref, value])
         return BrowserResult.from_json(result)
 
+    @_mutates
     async def scroll_to(self, ref: str) -> BrowserResult:
         """Scroll an element into view.
 
@@ -240,7 +493,7 @@ class SafariBrowser:
         Returns:
             BrowserResult
         """
-        result = await _run_script("scroll.sh", [ref])
+        result = await self._run("scroll.sh", [ref])
         return BrowserResult.from_json(result)
 
     async def get_text(self, ref: str) -> str:
@@ -255,9 +508,36 @@ class SafariBrowser:
         Raises:
             BrowserError: If element not found
         """
-        result = await _run_script("get-text.sh", [ref])
+        code = (
+            "typeof window.__ariaGetText === 'function'"
+            f" ? JSON.stringify(window.__ariaGetText({json.dumps(ref)}))"
+            " : JSON.stringify({success: false,"
+            " error: 'ARIA library not loaded. Run snapshot.sh --inject first.'})"
+        )
+        evaluated = await self._eval_js(code)
+        if evaluated is None:
+            result = await self._run("get-text.sh", [ref])
+        else:
+            result = json.loads(evaluated.get("result") or "{}")
+            err = result.get("error")
+            if err:
+                raise BrowserError(err)
         return result.get("text", "")
 
+    async def get_texts(self, refs: list[str]) -> list[str]:
+        """Get the text content of several elements concurrently.
+
+        Args:
+            refs: Element references
+
+        Returns:
+            Text content for each ref, in the same order
+
+        Raises:
+            BrowserError: If any element is not found
+        """
+        return list(await asyncio.gather(*(self.get_text(ref) for ref in refs)))
+
     async def screenshot(self, output_path: str | None = None) -> bytes | str:
         """Take a screenshot of the current page.
 
@@ -268,37 +548,55 @@ class SafariBrowser:
             If output_path: the path to the saved file
             Otherwise: screenshot data as bytes
         """
-        args = []
-        if output_path:
-            args.extend(["--output", output_path])
-
-        result = await _run_script("screenshot.sh", args, timeout=10)
-
+        # Never fall back to screencapture's click-a-window mode: nobody may
+        # be at the screen to click, and the call would hang until timeout
         if output_path:
+            result = await self._run(
+                "screenshot.sh", ["--output", output_path, "--no-interactive"], timeout=10
+            )
             return result.get("path", output_path)
-        else:
-            import base64
-
-            return base64.b64decode(result.get("data", ""))
 
+        # Capture to a temp file and read it back rather than shipping the
+        # image through the script's JSON output as base64
+        temp_path = os.path.join(tempfile.gettempdir(), f"macbot_screenshot_{uuid.uuid4().hex}.png")
+        try:
+            await self._run("screenshot.sh", ["--output", temp_path, "--no-interactive"], timeout=10)
+            with open(temp_path, "rb") as f:
+                data = f.read()
+        except OSError as e:
+            raise BrowserError(f"Failed to read screenshot: {e}")
+        finally:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+
+        if not data:
+            raise BrowserError("Failed to capture screenshot")
+        return data
+
+    @_mutates
     async def close(self) -> BrowserResult:
         """Close the current Safari tab.
 
         Returns:
             BrowserResult
         """
-        result = await _run_script("close-tab.sh", [])
+        self._injected_origins.clear()
+        result = await self._run("close-tab.sh")
         return BrowserResult.from_json(result)
 
+    @_mutates
     async def dismiss_cookies(self) -> dict:
         """Attempt to dismiss cookie consent banners.
 
         Returns:
             Dictionary with success status and whether a banner was dismissed.
         """
-        result = await _run_script("dismiss-cookies.sh", [])
+        result = await self._run("dismiss-cookies.sh")
         return result
 
+    @_mutates
     async def press_key(self, key: str) -> BrowserResult:
         """Press a keyboard key.
 
@@ -308,9 +606,10 @@ class SafariBrowser:
         Returns:
             BrowserResult
         """
-        result = await _run_script("press-key.sh", [key])
+        result = await self._run("press-key.sh", [key])
         return BrowserResult.from_json(result)
 
+    @_mutates
     async def physical_click(self, ref: str) -> BrowserResult:
         """Perform a physical mouse click on an element.
 
@@ -327,9 +626,10 @@ class SafariBrowser:
         Returns:
             BrowserResult with click coordinates
         """
-        result = await _run_script("physical-click.sh", [ref])
+        result = await self._run("physical-click.sh", [ref])
         return BrowserResult.from_json(result)
 
+    @_mutates
     async def execute_js(self, code: str) -> dict[str, Any]:
         """Execute JavaScript code in the current Safari tab.
 
@@ -350,7 +650,65 @@ class SafariBrowser:
                     .map(h => h.textContent))
             ''')
         """
-        return await _run_script("execute-js.sh", [code], timeout=30)
+        entry = self._js_fns.get(_js_key(code))
+        if entry is None:
+            return await self._execute_js_code(code)
+
+        name = json.dumps(entry[0])
+        call = (
+            f"(window.__macbot_fns && window.__macbot_fns[{name}])"
+            f" ? window.__macbot_fns[{name}]() : {json.dumps(_JS_MISSING)}"
+        )
+        result = await self._execute_js_code(call)
+        if result.get("result") != _JS_MISSING:
+            return result
+
+        # The page was reloaded since registration; define the function again
+        await self._define_js(*entry)
+        return await self._execute_js_code(call)
+
+    async def register_js(self, name: str, code: str) -> None:
+        """Compile a JavaScript expression once as a named page function.
+
+        Later execute_js() calls with the same code only send a short call
+        to the compiled function instead of the full source. If the page
+        has been reloaded since, the function is defined again on demand.
+
+        Args:
+            name: Name to register the function under
+            code: JavaScript expression, as it would be passed to execute_js()
+
+        Raises:
+            BrowserError: If the code is not a valid expression
+        """
+        self._js_fns[_js_key(code)] = (name, code)
+        await self._define_js(name, code)
+
+    async def _define_js(self, name: str, code: str) -> None:
+        """Define ``window.__macbot_fns[name]`` as a function returning ``code``."""
+        body = json.dumps(f"return ({code}\n);")
+        await self._execute_js_code(
+            "(function() {"
+            " window.__macbot_fns = window.__macbot_fns || {};"
+            f" window.__macbot_fns[{json.dumps(name)}] = new Function({body});"
+            " return 'ok';"
+            " })()"
+        )
+
+    async def _execute_js_code(self, code: str) -> dict[str, Any]:
+        """Run JavaScript via the worker, falling back to execute-js.sh."""
+        result = await self._eval_js(code, timeout=30)
+        if result is None:
+            return await self._run("execute-js.sh", [code], timeout=30)
+
+        # Mirror execute-js.sh, which passes JSON-looking results through as JSON
+        value = result.get("result")
+        if isinstance(value, str) and value.startswith(("{", "[")):
+            try:
+                result["result"] = json.loads(value)
+            except json.JSONDecodeError:
+                pass
+        return result
 
     async def visual_snapshot(
         self, output_path: str = "/tmp/visual_snapshot.png", max_elements: int = 80
@@ -368,7 +726,7 @@ class SafariBrowser:
             Dictionary with screenshot path and label count
         """
         args = ["--output", output_path, "--max", str(max_elements)]
-        return await _run_script("visual-snapshot.sh", args, timeout=15)
+        return await self._run("visual-snapshot.sh", args, timeout=15)
 
     def get_last_snapshot(self) -> Snapshot | None:
         """Get the last snapshot taken.
@@ -385,13 +743,18 @@ class SafariBrowser:
             ref: Element reference
 
         Returns:
-            Element info dict or None if not found
+            Element info dict or None if not found. The dict is cached for
+            the lifetime of the snapshot and must not be modified.
         """
         if not self._last_snapshot:
             return None
+        if ref in self._info_cache:
+            return self._info_cache[ref]
+
+        info = None
         elem = self._last_snapshot.refs.get(ref)
         if elem:
-            return {
+            info = {
                 "ref": elem.ref,
                 "role": elem.role,
                 "name": elem.name,
@@ -399,4 +762,5 @@ class SafariBrowser:
                 "tag": elem.tag,
                 "interactive": elem.interactive,
             }
-        return None
+        self._info_cache[ref] = info
+        return info
@@ -37,6 +37,7 @@ class Snapshot:
         title: Page title
         timestamp: When the snapshot was taken
         stats: Statistics about the snapshot
+        truncated: Whether refs after the requested range were left out
     """
 
     text: str
@@ -45,6 +46,7 @@ class Snapshot:
     title: str = ""
     timestamp: datetime = field(default_factory=datetime.now)
     stats: dict[str, Any] = field(default_factory=dict)
+    truncated: bool = False
 
     @classmethod
     def from_json(cls, data: dict[str, Any]) -> "Snapshot":
@@ -69,6 +71,7 @@ class Snapshot:
             if "timestamp" in data
             else datetime.now(),
             stats=data.get("stats", {}),
+            truncated=data.get("truncated", False),
         )
 
 
@@ -17,37 +17,39 @@ CONCEPTS:
         or specific times (cron). Used for automation.
 """
 
+from __future__ import annotations
+
 import argparse
 import asyncio
+import functools
 import json
 import logging
 import os
+import re
 import signal
 import sys
-from datetime import datetime
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import NoReturn
+from typing import TYPE_CHECKING, Any, NoReturn
 
-import httpx
-import yaml
 from rich.console import Console
 from rich.logging import RichHandler
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.table import Table
 
 from macbot import __version__
 from macbot.config import settings
-from macbot.core.agent import Agent
-from macbot.core.scheduler import ScheduledJob, TaskScheduler
-from macbot.cron import (
-    CronJobCreate,
-    CronPayload,
-    CronSchedule,
-    CronService,
-    ScheduleKind,
-)
-from macbot.tasks import create_default_registry
+from macbot.utils.eventloop import run_async as _run_async
+from macbot.utils.jsonio import json_dumps, json_loads
+from macbot.utils.yamlio import yaml_safe_load
+
+if TYPE_CHECKING:
+    import subprocess
+
+    from macbot.core.agent import Agent
+    from macbot.core.scheduler import TaskScheduler
+    from macbot.core.task import TaskRegistry
+    from macbot.cron import CronPayload, CronSchedule, CronService
+    from macbot.telegram import TelegramBot
 
 console = Console()
 
@@ -57,10 +59,20 @@ PID_FILE = MACBOT_DIR / "scheduler.pid"
 LOG_FILE = MACBOT_DIR / "scheduler.log"
 JOBS_FILE = MACBOT_DIR / "jobs.yaml"
 
+# Parsed jobs files keyed by path: (st_mtime_ns, st_size, jobs), least recently used first
+_JOBS_CACHE: dict[Path, tuple[int, int, dict[str, str]]] = {}
+_JOBS_CACHE_SIZE = 16
+
 
 def load_jobs_from_file(jobs_file: Path | None = None) -> dict[str, str]:
     """Load jobs from a YAML file and return a dict of name -> goal.
 
+    The parsed result is cached per path and reused for as long as the file's
+    mtime and size are unchanged. It is also written to a hidden sidecar next to
+    it (``.jobs.cache.json`` for ``jobs.yaml``) tagged with that mtime and size,
+    which later processes load instead of re-parsing the YAML until the file
+    changes.
+
     Args:
         jobs_file: Path to jobs YAML file. Defaults to ~/.macbot/jobs.yaml
 
@@ -70,24 +82,68 @@ def load_jobs_from_file(jobs_file: Path | None = None) -> dict[str, str]:
     if jobs_file is None:
         jobs_file = JOBS_FILE
 
-    if not jobs_file.exists():
+    try:
+        st = jobs_file.stat()
+    except OSError:
         return {}
 
+    cached = _JOBS_CACHE.pop(jobs_file, None)
+    if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+        _JOBS_CACHE[jobs_file] = cached
+        return cached[2]
+
+    # A JSON sidecar recorded for this exact version of the YAML file skips YAML parsing
+    sidecar = jobs_file.with_name(f".{jobs_file.stem}.cache.json")
     try:
-        with open(jobs_file) as f:
-            data = yaml.safe_load(f)
+        cached_file = json_loads(sidecar.read_bytes())
+        if (cached_file.get("src_mtime_ns"), cached_file.get("src_size")) == (
+            st.st_mtime_ns, st.st_size
+        ):
+            jobs = cached_file["jobs"]
+            _cache_jobs(jobs_file, st, jobs)
+            return jobs
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
 
-        if not data or "jobs" not in data:
-            return {}
+    try:
+        # One read; libyaml then parses (and decodes) the bytes in C
+        data = yaml_safe_load(jobs_file.read_bytes())
 
         jobs = {}
-        for job in data["jobs"]:
-            if "name" in job and "goal" in job:
-                jobs[job["name"].lower()] = job["goal"]
-        return jobs
+        if data and "jobs" in data:
+            for job in data["jobs"]:
+                if "name" in job and "goal" in job:
+                    jobs[job["name"].lower()] = job["goal"]
     except Exception:
         return {}
 
+    _write_jobs_sidecar(sidecar, st, jobs)
+    _cache_jobs(jobs_file, st, jobs)
+    return jobs
+
+
+def _cache_jobs(jobs_file: Path, st: os.stat_result, jobs: dict[str, str]) -> None:
+    """Remember parsed jobs for a file, evicting the least recently used entry."""
+    if len(_JOBS_CACHE) >= _JOBS_CACHE_SIZE:
+        del _JOBS_CACHE[next(iter(_JOBS_CACHE))]
+    _JOBS_CACHE[jobs_file] = (st.st_mtime_ns, st.st_size, jobs)
+
+
+def _write_jobs_sidecar(sidecar: Path, st: os.stat_result, jobs: dict[str, str]) -> None:
+    """Atomically write the parsed jobs next to jobs.yaml, ignoring failures.
+
+    The YAML file's mtime and size are stored with the jobs so a sidecar is
+    only trusted for the exact file it was built from.
+    """
+    tmp = sidecar.with_name(f".{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(
+            json_dumps({"src_mtime_ns": st.st_mtime_ns, "src_size": st.st_size, "jobs": jobs})
+        )
+        os.replace(tmp, sidecar)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
 
 def find_job_goal(name: str, jobs_file: Path | None = None) -> str | None:
     """Find a job's goal by name (case-insensitive).
@@ -99,32 +155,34 @@ def find_job_goal(name: str, jobs_file: Path | None = None) -> str | None:
     Returns:
         The job's goal if found, None otherwise
     """
+    # Job names are single words or phrases; multi-line prompts (son run -m)
+    # can never match, so don't touch the jobs file for them
+    if "\n" in name:
+        return None
+
     jobs = load_jobs_from_file(jobs_file)
     return jobs.get(name.lower())
 
-# Help text shown when no command is given
-WELCOME_TEXT = f"""
-# Son of Simon v{__version__}
 
-An LLM-powered agent for macOS automation.
-
-## Quick Start
+# Help text shown when no command is given. Written as Rich markup, like the
+# --help screens in main(), so the bare command needs no Markdown parser.
+WELCOME_TEXT = f"""[bold]Son of Simon v{__version__}[/bold]
 
-```bash
-son run "Check my emails"                # Run a goal
-son run "What's on my calendar?"         # Ask a question
-son start                                # Start service (cron + telegram)
-son status                               # Check service status
-son doctor                               # Verify setup
-```
+An LLM-powered agent for macOS automation.
 
-## Service Setup
+[bold]QUICK START[/bold]
+  son run "Check my emails"                # Run a goal
+  son run "What's on my calendar?"         # Ask a question
+  son start                                # Start service (cron + telegram)
+  son status                               # Check service status
+  son doctor                               # Verify setup
 
-1. Import scheduled jobs: `son cron import jobs.yaml`
-2. Configure Telegram: `export MACBOT_TELEGRAM_BOT_TOKEN=...`
-3. Start the service: `son start -d` (daemon) or `son start` (foreground)
+[bold]SERVICE SETUP[/bold]
+  1. Import scheduled jobs: [cyan]son cron import jobs.yaml[/cyan]
+  2. Configure Telegram: [cyan]export MACBOT_TELEGRAM_BOT_TOKEN=...[/cyan]
+  3. Start the service: [cyan]son start -d[/cyan] (daemon) or [cyan]son start[/cyan] (foreground)
 
-Use `son --help-all` to see all commands including admin tools.
+Use [bold]son --help-all[/bold] to see all commands including admin tools.
 """
 
 
@@ -146,6 +204,74 @@ def _format_tokens(count: int) -> str:
     return str(count)
 
 
+def _input_in_thread(prompt: str) -> asyncio.Future[str]:
+    """Read a line from the console on a daemon thread.
+
+    Unlike ``asyncio.to_thread()``, a read still blocked on stdin holds up
+    neither the event loop's shutdown nor the interpreter's exit.
+    """
+    import threading
+
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[str] = loop.create_future()
+
+    def settle(line: str | None, exc: Exception | None) -> None:
+        if future.done():
+            return
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(line or "")
+
+    def read() -> None:
+        try:
+            line, exc = console.input(prompt), None
+        except Exception as e:
+            line, exc = None, e
+        try:
+            loop.call_soon_threadsafe(settle, line, exc)
+        except RuntimeError:
+            pass  # Loop already closed
+
+    threading.Thread(target=read, name="chat-input", daemon=True).start()
+    return future
+
+
+async def _wait_unless_interrupted(future: asyncio.Future[Any]) -> bool:
+    """Wait for a future, stopping early if Ctrl+C is pressed.
+
+    The SIGINT handler is installed on the running loop for the duration of
+    the wait, so Ctrl+C is seen the same way on every Python version instead
+    of surfacing as a KeyboardInterrupt outside the coroutine. The future
+    itself is left running.
+
+    Returns:
+        True if the future finished, False if Ctrl+C came first
+    """
+    loop = asyncio.get_running_loop()
+    interrupted = loop.create_future()
+
+    def on_sigint() -> None:
+        if not interrupted.done():
+            interrupted.set_result(None)
+
+    previous = signal.getsignal(signal.SIGINT)
+    try:
+        loop.add_signal_handler(signal.SIGINT, on_sigint)
+    except (ValueError, RuntimeError, NotImplementedError):
+        # Not the main thread, or a loop without signal support
+        await future
+        return True
+    try:
+        await asyncio.wait({future, interrupted}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        loop.remove_signal_handler(signal.SIGINT)
+        if previous is not None:
+            signal.signal(signal.SIGINT, previous)
+        interrupted.cancel()
+    return future.done()
+
+
 async def interactive_loop(agent: Agent, verbose: bool = False) -> None:
     """Run an interactive chat loop with the agent.
 
@@ -153,8 +279,17 @@ async def interactive_loop(agent: Agent, verbose: bool = False) -> None:
         agent: The agent instance (may already have conversation history)
         verbose: Whether to show verbose output
     """
-    console.print("\n[dim]Type your message, or 'quit' to exit. Use 'clear' to reset conversation.[/dim]")
-    console.print("[dim]Commands: 'stats' shows token usage, 'help' for more.[/dim]\n")
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+
+    with console:
+        console.print("\n[dim]Type your message, or 'quit' to exit. Use 'clear' to reset conversation.[/dim]")
+        console.print("[dim]Commands: 'stats' shows token usage, 'help' for more.[/dim]\n")
+
+    # Input is read on a worker thread so the event loop keeps running while
+    # waiting for the user. A read interrupted by Ctrl+C is still blocked on
+    # stdin, so it is kept and awaited again rather than starting a second one.
+    pending_input: asyncio.Future[str] | None = None
 
     while True:
         try:
@@ -169,7 +304,13 @@ async def interactive_loop(agent: Agent, verbose: bool = False) -> None:
                 prompt = "[bold blue]You:[/bold blue] "
 
             # Get user input
-            user_input = console.input(prompt).strip()
+            if pending_input is None:
+                pending_input = _input_in_thread(prompt)
+            if not await _wait_unless_interrupted(pending_input):
+                console.print("\n[dim]Use 'quit' to exit.[/dim]")
+                continue
+            user_input = pending_input.result().strip()
+            pending_input = None
 
             if not user_input:
                 continue
@@ -191,12 +332,13 @@ async def interactive_loop(agent: Agent, verbose: bool = False) -> None:
 
             if user_input.lower() == "stats":
                 stats = agent.get_token_stats()
-                console.print(f"\n[bold]Token Statistics[/bold]")
-                console.print(f"  Context size:    {stats['context_tokens']:,} tokens")
-                console.print(f"  Messages:        {stats['message_count']}")
-                console.print(f"  Session input:   {stats['session_input_tokens']:,} tokens")
-                console.print(f"  Session output:  {stats['session_output_tokens']:,} tokens")
-                console.print(f"  Session total:   {stats['session_total_tokens']:,} tokens\n")
+                with console:
+                    console.print(f"\n[bold]Token Statistics[/bold]")
+                    console.print(f"  Context size:    {stats['context_tokens']:,} tokens")
+                    console.print(f"  Messages:        {stats['message_count']}")
+                    console.print(f"  Session input:   {stats['session_input_tokens']:,} tokens")
+                    console.print(f"  Session output:  {stats['session_output_tokens']:,} tokens")
+                    console.print(f"  Session total:   {stats['session_total_tokens']:,} tokens\n")
                 continue
 
             if user_input.lower() == "help":
@@ -227,10 +369,12 @@ async def interactive_loop(agent: Agent, verbose: bool = False) -> None:
             if cancelled:
                 console.print("\n[dim][Cancelled by Escape][/dim]\n")
             else:
-                console.print()
-                console.print("[bold green]A:[/bold green]", end=" ")
-                console.print(Markdown(result))
-                console.print("[dim]─" * 60 + "[/dim]\n")
+                # Render the whole answer before writing it out in one go
+                with console:
+                    console.print()
+                    console.print("[bold green]A:[/bold green]", end=" ")
+                    console.print(Markdown(result))
+                    console.print("[dim]─" * 60 + "[/dim]\n")
 
         except KeyboardInterrupt:
             console.print("\n[dim]Use 'quit' to exit.[/dim]")
@@ -242,18 +386,22 @@ async def interactive_loop(agent: Agent, verbose: bool = False) -> None:
 
 def _show_tasks_summary(registry) -> None:
     """Show a compact summary of available tasks."""
+    from rich.table import Table
+
     table = Table(title="Available Tasks", show_lines=False)
     table.add_column("Task", style="cyan", no_wrap=True)
     table.add_column("Description", style="white")
 
-    for task in sorted(registry.list_tasks(), key=lambda t: t.name):
-        desc = task.description
-        if len(desc) > 60:
-            desc = desc[:57] + "..."
-        table.add_row(task.name, desc)
+    rows = [
+        (task.name, desc if len(desc := task.description) <= 60 else desc[:57] + "...")
+        for task in registry.sorted_tasks()
+    ]
+    for row in rows:
+        table.add_row(*row)
 
-    console.print(table)
-    console.print()
+    with console:
+        console.print(table)
+        console.print()
 
 
 async def stdio_loop(agent: Agent, verbose: bool = False) -> None:
@@ -312,13 +460,25 @@ async def stdio_loop(agent: Agent, verbose: bool = False) -> None:
             break
 
 
+@functools.lru_cache(maxsize=1)
+def _get_registry() -> TaskRegistry:
+    """Return the default task registry, built once per process."""
+    from macbot.tasks import create_default_registry
+
+    return create_default_registry()
+
+
 def cmd_chat(args: argparse.Namespace) -> None:
     """Start an interactive chat session with the agent."""
-    registry = create_default_registry()
+    from rich.panel import Panel
+
+    from macbot.core.agent import Agent
+
+    registry = _get_registry()
     agent = Agent(registry)
 
     if getattr(args, "stdio", False):
-        asyncio.run(stdio_loop(agent, verbose=args.verbose))
+        _run_async(stdio_loop(agent, verbose=args.verbose))
         return
 
     console.print(Panel(
@@ -328,23 +488,30 @@ def cmd_chat(args: argparse.Namespace) -> None:
         title="Welcome"
     ))
 
-    asyncio.run(interactive_loop(agent, verbose=args.verbose))
+    _run_async(interactive_loop(agent, verbose=args.verbose))
 
 
 def cmd_run(args: argparse.Namespace) -> None:
     """Run a goal, optionally continuing to interactive mode."""
+    from rich.markdown import Markdown
+    from rich.panel import Panel
+
+    from macbot.core.agent import Agent
+
     # Handle --list-jobs flag
     if getattr(args, "list_jobs", False):
         jobs = load_jobs_from_file()
         if not jobs:
             console.print("[yellow]No jobs found in ~/.macbot/jobs.yaml[/yellow]")
         else:
-            console.print(f"[bold]Available jobs[/bold] ({len(jobs)}):\n")
-            for name in sorted(jobs.keys()):
-                # Show original case from file
-                goal_preview = jobs[name].strip().split("\n")[0][:60]
-                console.print(f"  [cyan]{name.title()}[/cyan]")
-                console.print(f"    {goal_preview}...")
+            # Buffer the listing so it reaches the terminal in one write
+            with console:
+                console.print(f"[bold]Available jobs[/bold] ({len(jobs)}):\n")
+                for name in sorted(jobs.keys()):
+                    # Show original case from file
+                    goal_preview = jobs[name].strip().split("\n")[0][:60]
+                    console.print(f"  [cyan]{name.title()}[/cyan]")
+                    console.print(f"    {goal_preview}...")
         return
 
     # Handle multiline input mode
@@ -372,7 +539,7 @@ def cmd_run(args: argparse.Namespace) -> None:
         console.print(f"[dim]Running job:[/dim] [bold]{goal}[/bold]\n")
         goal = job_goal
 
-    registry = create_default_registry()
+    registry = _get_registry()
     agent = Agent(registry)
 
     async def _run() -> None:
@@ -397,21 +564,38 @@ def cmd_run(args: argparse.Namespace) -> None:
         # When streaming, text was already printed via stream callback
         # Otherwise, print the final result with markdown rendering
         if not stream:
-            console.print()
-            console.print("[bold green]A:[/bold green]", end=" ")
-            console.print(Markdown(result))
+            with console:
+                console.print()
+                console.print("[bold green]A:[/bold green]", end=" ")
+                console.print(Markdown(result))
 
         # Continue to interactive mode if requested
         if args.continue_chat:
             await interactive_loop(agent, verbose=verbose)
 
-    asyncio.run(_run())
+    _run_async(_run())
+
+
+_BOOL_ARGS = {"true": True, "false": False}
+_INT_ARG_RE = re.compile(r"[+-]?\d+")
+_FLOAT_ARG_RE = re.compile(r"[+-]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?")
+
+
+def _parse_task_arg(value: str) -> Any:
+    """Convert a key=value task argument to a bool, int or float when it looks like one."""
+    lowered = value.lower()
+    if lowered in _BOOL_ARGS:
+        return _BOOL_ARGS[lowered]
+    if _INT_ARG_RE.fullmatch(value):
+        return int(value)
+    if _FLOAT_ARG_RE.fullmatch(value):
+        return float(value)
+    return value
 
 
 def cmd_task(args: argparse.Namespace) -> None:
     """Execute a single task directly without LLM involvement."""
-    registry = create_default_registry()
-    agent = Agent(registry)
+    registry = _get_registry()
 
     async def _run() -> None:
         # Parse task arguments from command line
@@ -420,24 +604,16 @@ def cmd_task(args: argparse.Namespace) -> None:
             for arg in args.args:
                 if "=" in arg:
                     key, value = arg.split("=", 1)
-                    # Try to parse as boolean or number
-                    if value.lower() == "true":
-                        kwargs[key] = True
-                    elif value.lower() == "false":
-                        kwargs[key] = False
-                    else:
-                        try:
-                            kwargs[key] = int(value)
-                        except ValueError:
-                            try:
-                                kwargs[key] = float(value)
-                            except ValueError:
-                                kwargs[key] = value
+                    kwargs[key] = _parse_task_arg(value)
 
         if args.verbose:
             console.print(f"[yellow]Executing:[/yellow] {args.task_name}({kwargs})")
 
-        result = await agent.run_single_task(args.task_name, verbose=args.verbose, **kwargs)
+        result = await registry.execute(args.task_name, **kwargs)
+
+        if args.verbose:
+            status = "[green]Success[/green]" if result.success else "[red]Failed[/red]"
+            console.print(f"  {status}: {result.output or result.error}")
 
         if result.success:
             console.print(f"\n[bold green]Result:[/bold green]\n{result.output}")
@@ -445,12 +621,46 @@ def cmd_task(args: argparse.Namespace) -> None:
             console.print(f"\n[bold red]Error:[/bold red] {result.error}")
             sys.exit(1)
 
-    asyncio.run(_run())
+    _run_async(_run())
+
+
+# Compact task listing categories, checked in order; anything else is "System"
+_TASK_CATEGORIES = (
+    ("Mail", ("mail",)),
+    ("Calendar", ("calendar", "event")),
+    ("Reminders", ("reminder",)),
+    ("Notes", ("note",)),
+    ("Safari", ("safari", "url", "link", "tab")),
+)
+
+# One lookahead branch per category, anchored at the start of the name, so a
+# single match() picks the first category whose keywords occur anywhere in it.
+_TASK_CATEGORY_RE = re.compile("|".join(
+    f"(?=.*(?:{'|'.join(keywords)}))(?P<{category}>)"
+    for category, keywords in _TASK_CATEGORIES
+))
+
+
+@functools.lru_cache(maxsize=512)
+def _task_category(name: str) -> str:
+    """Return the compact-listing category for a task name (memoised per name)."""
+    match = _TASK_CATEGORY_RE.match(name)
+    return match.lastgroup if match and match.lastgroup else "System"
+
+
+def _format_task_params(task) -> str:
+    """Render a task's parameters as ``name: type`` pairs, optional ones marked ``?``."""
+    params = ", ".join(
+        [f"{p.name}: {p.type}{'' if p.required else '?'}" for p in task.get_parameters()]
+    )
+    return params or "-"
 
 
 def cmd_tasks(args: argparse.Namespace) -> None:
     """List all available tasks the agent can execute."""
-    registry = create_default_registry()
+    from rich.table import Table
+
+    registry = _get_registry()
 
     if args.verbose:
         # Detailed view with parameters
@@ -459,103 +669,246 @@ def cmd_tasks(args: argparse.Namespace) -> None:
         table.add_column("Description", style="white")
         table.add_column("Parameters", style="yellow")
 
-        for task in sorted(registry.list_tasks(), key=lambda t: t.name):
-            params = ", ".join(
-                f"{p.name}: {p.type}" + ("" if p.required else "?")
-                for p in task.get_parameters()
-            )
-            table.add_row(task.name, task.description, params or "-")
+        rows = [
+            (task.name, task.description, _format_task_params(task))
+            for task in registry.sorted_tasks()
+        ]
+        for row in rows:
+            table.add_row(*row)
 
         console.print(table)
     else:
         # Compact view grouped by category
-        tasks_by_category = {
-            "Mail": [],
-            "Calendar": [],
-            "Reminders": [],
-            "Notes": [],
-            "Safari": [],
-            "System": [],
+        tasks_by_category: dict[str, list] = {
+            category: [] for category, _ in _TASK_CATEGORIES
         }
+        tasks_by_category["System"] = []
 
-        for task in registry.list_tasks():
-            name = task.name
-            if "email" in name or "mail" in name:
-                tasks_by_category["Mail"].append(task)
-            elif "calendar" in name or "event" in name:
-                tasks_by_category["Calendar"].append(task)
-            elif "reminder" in name:
-                tasks_by_category["Reminders"].append(task)
-            elif "note" in name:
-                tasks_by_category["Notes"].append(task)
-            elif "safari" in name or "url" in name or "link" in name or "tab" in name:
-                tasks_by_category["Safari"].append(task)
-            else:
-                tasks_by_category["System"].append(task)
+        # Buckets fill in name order, so they need no sorting of their own
+        for task in registry.sorted_tasks():
+            tasks_by_category[_task_category(task.name)].append(task)
 
         console.print(f"\n[bold]Available Tasks[/bold] ({len(registry)} total)\n")
 
         for category, tasks in tasks_by_category.items():
             if tasks:
-                task_names = ", ".join(t.name for t in sorted(tasks, key=lambda t: t.name))
+                task_names = ", ".join(t.name for t in tasks)
                 console.print(f"[cyan]{category}:[/cyan] {task_names}")
 
         console.print("\n[dim]Use 'son tasks -v' for detailed view with parameters.[/dim]")
 
 
-def _get_scheduler_pid() -> int | None:
-    """Get the PID of a running background scheduler, or None if not running."""
-    if not PID_FILE.exists():
+def _tail(path: Path, n: int) -> list[str]:
+    """Return the last n lines of a text file without reading all of it.
+
+    Reads blocks backwards from the end of the file, doubling the block size,
+    until it holds more than n lines (so the possibly partial first line can
+    be dropped) or covers the whole file. Each byte is read at most once.
+    """
+    if n <= 0:
+        return []
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        start = os.fstat(fd).st_size
+        block = 8192 * -(-n // 80)
+        data = b""
+        while start > 0:
+            read_from = max(0, start - block)
+            data = os.pread(fd, start - read_from, read_from) + data
+            start = read_from
+            if data.strip().count(b"\n") >= n:
+                break
+            block *= 2
+    finally:
+        os.close(fd)
+
+    return [line.decode(errors="replace") for line in data.strip().split(b"\n")[-n:]]
+
+
+def _read_live_pid(pid_file: Path) -> int | None:
+    """Return the PID recorded in a PID file if that process is running.
+
+    A PID file that is unreadable or names a dead process is removed.
+    """
+    try:
+        fd = os.open(pid_file, os.O_RDONLY)
+    except FileNotFoundError:
         return None
     try:
-        pid = int(PID_FILE.read_text().strip())
+        pid = int(os.read(fd, 32).strip())
         # Check if process is actually running
         os.kill(pid, 0)
         return pid
     except (ValueError, ProcessLookupError, PermissionError):
         # PID file exists but process is dead - clean up
-        PID_FILE.unlink(missing_ok=True)
+        pid_file.unlink(missing_ok=True)
         return None
+    finally:
+        os.close(fd)
 
 
-def _daemonize() -> None:
-    """Fork the process to run in the background (Unix double-fork)."""
-    # First fork
-    pid = os.fork()
-    if pid > 0:
-        # Parent exits
-        sys.exit(0)
+def _get_scheduler_pid() -> int | None:
+    """Get the PID of a running background scheduler, or None if not running."""
+    return _read_live_pid(PID_FILE)
 
-    # Decouple from parent environment
-    os.chdir("/")
-    os.setsid()
-    os.umask(0)
 
-    # Second fork
-    pid = os.fork()
-    if pid > 0:
-        sys.exit(0)
+def _write_pid_file(pid_file: Path, pid: int) -> None:
+    """Write a PID file atomically so readers never see it half-written."""
+    tmp = pid_file.with_name(f".{pid_file.name}.{os.getpid()}.tmp")
+    tmp.write_text(str(pid))
+    os.replace(tmp, pid_file)
+
+
+def _wait_for_exit(pid: int, timeout: float = 2.0) -> bool:
+    """Wait until a process exits; return True if it did within the timeout.
+
+    Blocks on a pidfd (Linux) or a kqueue process filter (macOS/BSD) so the exit
+    is seen as soon as it happens, and falls back to polling elsewhere.
+    """
+    import select
+
+    try:
+        if hasattr(os, "pidfd_open"):
+            fd = os.pidfd_open(pid)
+            try:
+                poller = select.poll()
+                poller.register(fd, select.POLLIN)
+                return bool(poller.poll(timeout * 1000))
+            finally:
+                os.close(fd)
+        if hasattr(select, "kqueue"):
+            kq = select.kqueue()
+            try:
+                event = select.kevent(
+                    pid,
+                    filter=select.KQ_FILTER_PROC,
+                    flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                    fflags=select.KQ_NOTE_EXIT,
+                )
+                return bool(kq.control([event], 1, timeout))
+            finally:
+                kq.close()
+    except ProcessLookupError:
+        return True
+    except OSError:
+        pass
+
+    import time
+
+    # Poll with a backoff from 1ms up to 50ms, so quick exits are seen quickly
+    deadline = time.monotonic() + timeout
+    delay = 0.001
+    while True:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            pass
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.05)
+
+
+def _cli_command() -> list[str]:
+    """Return the command line that runs this CLI (also for frozen app builds)."""
+    if getattr(sys, "frozen", False):
+        return [sys.executable]
+    return [sys.executable, "-m", "macbot.cli"]
+
 
-    # Redirect standard file descriptors
-    sys.stdout.flush()
-    sys.stderr.flush()
+def _spawn_daemon(
+    cli_args: list[str],
+    pid_file: Path | None = None,
+    log_file: Path | None = None,
+    verbose: bool = False,
+) -> int:
+    """Start the CLI with the given arguments as a detached background process.
+
+    The child is a fresh interpreter in its own session rather than a fork
+    of the current one, so it does not inherit this process's heap or
+    imported state. Output goes to log_file and the child's PID is written
+    to pid_file (LOG_FILE and PID_FILE, the scheduler's, by default).
+
+    The child starts in the current working directory so it loads the same
+    project .env as this process; the daemon body leaves it afterwards
+    (see _detach_cwd).
+
+    Returns:
+        The PID of the background process
+    """
+    import subprocess
 
-    # Redirect stdin/stdout/stderr to log file
     MACBOT_DIR.mkdir(parents=True, exist_ok=True)
     from macbot.core.preferences import CorePreferences
     CorePreferences().save_defaults()
-    log_fd = os.open(str(LOG_FILE), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
-    null_fd = os.open(os.devnull, os.O_RDONLY)
 
-    os.dup2(null_fd, sys.stdin.fileno())
-    os.dup2(log_fd, sys.stdout.fileno())
-    os.dup2(log_fd, sys.stderr.fileno())
+    with open(log_file or LOG_FILE, "ab") as log:
+        proc = subprocess.Popen(
+            [*_cli_command(), *(["-v"] if verbose else []), *cli_args],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+        )
+
+    _write_pid_file(pid_file or PID_FILE, proc.pid)
+    return proc.pid
+
+
+def _detach_cwd() -> None:
+    """Move a daemon out of the directory it was started from.
+
+    Settings, including the project .env in that directory, are loaded when
+    the CLI is imported, so this only stops the daemon from keeping the
+    directory busy.
+    """
+    os.chdir("/")
+
 
-    os.close(null_fd)
-    os.close(log_fd)
+def _build_scheduler(goal: str | None, task: str | None, interval: int) -> TaskScheduler:
+    """Create a scheduler with a single repeating goal (agent) or task (direct) job."""
+    from macbot.core.scheduler import ScheduledJob, TaskScheduler
 
-    # Write PID file
-    PID_FILE.write_text(str(os.getpid()))
+    scheduler = TaskScheduler(_get_registry())
+    if goal:
+        job = ScheduledJob(name="scheduled_goal", goal=goal, interval_seconds=interval)
+    else:
+        job = ScheduledJob(name="scheduled_task", task_name=task, interval_seconds=interval)
+    scheduler.add_job(job)
+    return scheduler
+
+
+def _run_schedule_daemon(goal: str | None, task: str | None, interval: int) -> None:
+    """Body of the background scheduler started by 'schedule --background'."""
+    _detach_cwd()
+    print(f"\n{'='*60}")
+    print(f"Son of Simon Scheduler started at {datetime.now().isoformat()}")
+    print(f"PID: {os.getpid()}")
+    print(f"{'='*60}\n")
+
+    # Set up signal handler for clean shutdown
+    def handle_signal(signum, frame):
+        print(f"\nReceived signal {signum}, shutting down...")
+        PID_FILE.unlink(missing_ok=True)
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    scheduler = _build_scheduler(goal, task, interval)
+    if goal:
+        print(f"Scheduled goal: \"{goal}\" every {interval}s")
+    else:
+        print(f"Scheduled task: {task} every {interval}s")
+
+    try:
+        _run_async(scheduler.run_forever())
+    finally:
+        PID_FILE.unlink(missing_ok=True)
 
 
 def cmd_schedule(args: argparse.Namespace) -> None:
@@ -564,6 +917,11 @@ def cmd_schedule(args: argparse.Namespace) -> None:
         console.print("[red]Error:[/red] Specify --goal or --task")
         sys.exit(1)
 
+    # We are the detached process started by --background below
+    if args.daemon_child:
+        _run_schedule_daemon(args.goal, args.task, args.interval)
+        return
+
     # Check if already running in background
     existing_pid = _get_scheduler_pid()
     if existing_pid and args.background:
@@ -583,85 +941,25 @@ def cmd_schedule(args: argparse.Namespace) -> None:
         console.print("\nUse 'son schedule status' to check status")
         console.print("Use 'son schedule stop' to stop")
 
-        # Store job config before forking (for the child process)
-        job_goal = args.goal
-        job_task = args.task
-        job_interval = args.interval
-
-        _daemonize()
-
-        # Now we're in the daemon process
-        print(f"\n{'='*60}")
-        print(f"Son of Simon Scheduler started at {datetime.now().isoformat()}")
-        print(f"PID: {os.getpid()}")
-        print(f"{'='*60}\n")
-
-        # Set up signal handler for clean shutdown
-        def handle_signal(signum, frame):
-            print(f"\nReceived signal {signum}, shutting down...")
-            PID_FILE.unlink(missing_ok=True)
-            sys.exit(0)
-
-        signal.signal(signal.SIGTERM, handle_signal)
-        signal.signal(signal.SIGINT, handle_signal)
-
-        # Create scheduler in daemon process
-        registry = create_default_registry()
-        scheduler = TaskScheduler(registry)
-
-        if job_goal:
-            scheduler.add_job(
-                ScheduledJob(
-                    name="scheduled_goal",
-                    goal=job_goal,
-                    interval_seconds=job_interval,
-                )
-            )
-            print(f"Scheduled goal: \"{job_goal}\" every {job_interval}s")
+        cli_args = ["schedule", f"--interval={args.interval}", "--daemon-child"]
+        if args.goal:
+            cli_args.append(f"--goal={args.goal}")
         else:
-            scheduler.add_job(
-                ScheduledJob(
-                    name="scheduled_task",
-                    task_name=job_task,
-                    interval_seconds=job_interval,
-                )
-            )
-            print(f"Scheduled task: {job_task} every {job_interval}s")
-
-        try:
-            asyncio.run(scheduler.run_forever())
-        finally:
-            PID_FILE.unlink(missing_ok=True)
-
+            cli_args.append(f"--task={args.task}")
+        _spawn_daemon(cli_args, verbose=args.verbose)
     else:
         # Foreground mode
-        registry = create_default_registry()
-        scheduler = TaskScheduler(registry)
-
+        scheduler = _build_scheduler(args.goal, args.task, args.interval)
         if args.goal:
-            scheduler.add_job(
-                ScheduledJob(
-                    name="scheduled_goal",
-                    goal=args.goal,
-                    interval_seconds=args.interval,
-                )
-            )
             console.print(f"[green]Scheduled goal[/green] to run every {args.interval}s:")
             console.print(f"  \"{args.goal}\"")
         else:
-            scheduler.add_job(
-                ScheduledJob(
-                    name="scheduled_task",
-                    task_name=args.task,
-                    interval_seconds=args.interval,
-                )
-            )
             console.print(f"[green]Scheduled task[/green] '{args.task}' to run every {args.interval}s")
 
         console.print("\n[dim]Press Ctrl+C to stop.[/dim]\n")
 
         try:
-            asyncio.run(scheduler.run_forever())
+            _run_async(scheduler.run_forever())
         except KeyboardInterrupt:
             console.print("\n[dim]Scheduler stopped.[/dim]")
 
@@ -677,8 +975,7 @@ def cmd_schedule_status(args: argparse.Namespace) -> None:
         # Show last few log lines
         if LOG_FILE.exists():
             console.print(f"\n[dim]Recent log entries:[/dim]")
-            lines = LOG_FILE.read_text().strip().split("\n")
-            for line in lines[-10:]:
+            for line in _tail(LOG_FILE, 10):
                 console.print(f"  {line}")
     else:
         console.print("[yellow]Scheduler is not running[/yellow]")
@@ -697,12 +994,11 @@ def cmd_schedule_stop(args: argparse.Namespace) -> None:
         console.print(f"[green]Sent stop signal to scheduler[/green] (PID {pid})")
 
         # Wait briefly for it to stop
-        import time
-        for _ in range(10):
-            time.sleep(0.2)
-            if not _get_scheduler_pid():
-                console.print("[green]Scheduler stopped[/green]")
-                return
+        if _wait_for_exit(pid):
+            # The scheduler is gone, so drop its PID file if it left one behind
+            PID_FILE.unlink(missing_ok=True)
+            console.print("[green]Scheduler stopped[/green]")
+            return
 
         console.print("[yellow]Scheduler may still be shutting down...[/yellow]")
     except ProcessLookupError:
@@ -712,6 +1008,26 @@ def cmd_schedule_stop(args: argparse.Namespace) -> None:
         console.print(f"[red]Permission denied[/red] to stop PID {pid}")
 
 
+def _follow(path: Path, n: int, interval: float = 0.5) -> NoReturn:
+    """Print the last n lines of a file, then new lines as they are appended.
+
+    Fallback for systems without tail(1); polls for new data every interval.
+    """
+    import time
+
+    for line in _tail(path, n):
+        print(line)
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        while True:
+            chunk = f.read()
+            if chunk:
+                sys.stdout.write(chunk.decode(errors="replace"))
+                sys.stdout.flush()
+            else:
+                time.sleep(interval)
+
+
 def cmd_schedule_log(args: argparse.Namespace) -> None:
     """Show the scheduler log file."""
     if not LOG_FILE.exists():
@@ -721,15 +1037,27 @@ def cmd_schedule_log(args: argparse.Namespace) -> None:
     if args.follow:
         # Tail -f style following
         console.print(f"[dim]Following {LOG_FILE} (Ctrl+C to stop)...[/dim]\n")
-        import subprocess
+        # posix_spawn skips forking this (already large) interpreter. tail waits
+        # on inotify/kqueue for new data, so following costs no idle wakeups.
         try:
-            subprocess.run(["tail", "-f", str(LOG_FILE)])
+            pid = os.posix_spawnp(
+                "tail", ["tail", "-n", str(args.lines), "-f", str(LOG_FILE)], os.environ
+            )
+        except FileNotFoundError:
+            # No tail binary (e.g. a minimal container): follow in-process instead
+            try:
+                _follow(LOG_FILE, args.lines)
+            except KeyboardInterrupt:
+                pass
+            return
+        try:
+            os.waitpid(pid, 0)
         except KeyboardInterrupt:
-            pass
+            # tail is in our process group, so it got the SIGINT as well
+            os.waitpid(pid, 0)
     else:
         # Show last N lines
-        lines = LOG_FILE.read_text().strip().split("\n")
-        for line in lines[-args.lines:]:
+        for line in _tail(LOG_FILE, args.lines):
             console.print(line)
 
 
@@ -739,7 +1067,7 @@ def cmd_version(args: argparse.Namespace) -> None:
     console.print(f"Model: {settings.model}")
     console.print(f"Max iterations: {settings.max_iterations}")
 
-    registry = create_default_registry()
+    registry = _get_registry()
     console.print(f"Tasks available: {len(registry)}")
 
 
@@ -752,6 +1080,8 @@ def cmd_start(args: argparse.Namespace) -> None:
 
 def cmd_connect(args: argparse.Namespace) -> None:
     """Connect to a running service's shared agent via Unix socket."""
+    from rich.markdown import Markdown
+
     from macbot.service import SOCKET_PATH, get_service_pid
 
     pid = get_service_pid()
@@ -879,7 +1209,7 @@ def cmd_connect(args: argparse.Namespace) -> None:
                 return
 
     try:
-        asyncio.run(_connect_loop())
+        _run_async(_connect_loop())
     except KeyboardInterrupt:
         console.print("\n[dim]Disconnected.[/dim]")
 
@@ -938,17 +1268,191 @@ def cmd_status(args: argparse.Namespace) -> None:
     # Show recent log if running
     if pid and LOG_FILE.exists():
         console.print(f"\n[bold]Recent Log[/bold]")
-        lines = LOG_FILE.read_text().strip().split("\n")
-        for line in lines[-5:]:
+        for line in _tail(LOG_FILE, 5):
             console.print(f"  [dim]{line}[/dim]")
 
 
+# AppleScript expressions used to probe automation access, evaluated inside
+# a `tell application "<name>"` block
+_APP_ACCESS_PROBES = {
+    "Notes": "count of notes",
+    "Mail": "count of accounts",
+    "Calendar": "count of calendars",
+    "Reminders": "count of lists",
+    "Safari": "count of windows",
+    "Contacts": "count of people",
+    "Messages": "count of services",
+}
+
+
+def _describe_osascript_error(app_name: str, error: str) -> str:
+    """Turn an osascript error (number and/or message) into a short hint."""
+    # Parse common error codes
+    if "-1743" in error:
+        return "Permission denied (grant in System Settings > Privacy > Automation)"
+    elif "-2741" in error:
+        return "AppleScript syntax error (special chars in data?)"
+    elif "-1728" in error:
+        return f"{app_name} not found or not responding"
+    elif "-1712" in error:
+        return "Timeout (app not responding)"
+    return error[:80]
+
+
+def _app_access_command(
+    apps: list[str], timeout: int = 10, osascript: str = "osascript"
+) -> list[str]:
+    """Build one osascript command that probes AppleScript access to several apps.
+
+    Each app is probed in its own try block, so one failing app does not
+    affect the others.
+
+    Args:
+        apps: App names, each a key of _APP_ACCESS_PROBES
+        timeout: Seconds to wait for each app to respond
+        osascript: Command or resolved path to run the script with
+
+    Returns:
+        The osascript argv
+    """
+    lines = ['set out to ""']
+    for app_name in apps:
+        lines += [
+            "try",
+            f"    with timeout of {timeout} seconds",
+            f'        tell application "{app_name}" to set r to {_APP_ACCESS_PROBES[app_name]}',
+            "    end timeout",
+            f'    set out to out & "{app_name}" & tab & "ok" & tab & (r as text) & linefeed',
+            "on error errMsg number errNum",
+            f'    set out to out & "{app_name}" & tab & errNum & tab & errMsg & linefeed',
+            "end try",
+        ]
+    lines.append("return out")
+    return [osascript, "-e", "\n".join(lines)]
+
+
+def _parse_app_access(
+    apps: list[str], result: subprocess.CompletedProcess | Exception
+) -> dict[str, tuple[bool, str]]:
+    """Turn the outcome of an _app_access_command run into per-app results.
+
+    Args:
+        apps: App names that were probed
+        result: The finished osascript run (text mode), or the exception it raised
+
+    Returns:
+        Mapping of app name to (ok, message)
+    """
+    import subprocess
+
+    if isinstance(result, subprocess.TimeoutExpired):
+        return {app_name: (False, "Timeout (app not responding)") for app_name in apps}
+    if isinstance(result, Exception):
+        return {app_name: (False, str(result)[:80]) for app_name in apps}
+
+    if result.returncode != 0:
+        error = result.stderr.strip()
+        return {app_name: (False, _describe_osascript_error(app_name, error)) for app_name in apps}
+
+    access: dict[str, tuple[bool, str]] = {}
+    for line in result.stdout.splitlines():
+        app_name, status, detail = (line.split("\t", 2) + ["", ""])[:3]
+        if app_name not in _APP_ACCESS_PROBES:
+            continue
+        if status == "ok":
+            access[app_name] = (True, detail.strip()[:50] or "OK")
+        else:
+            access[app_name] = (False, _describe_osascript_error(app_name, f"{status} {detail}"))
+    return {app_name: access.get(app_name, (False, "No result from osascript")) for app_name in apps}
+
+
+def _check_app_access(apps: list[str], timeout: int = 10) -> dict[str, tuple[bool, str]]:
+    """Test AppleScript access to several apps with a single osascript run.
+
+    Args:
+        apps: App names, each a key of _APP_ACCESS_PROBES
+        timeout: Seconds to wait for each app to respond
+
+    Returns:
+        Mapping of app name to (ok, message)
+    """
+    import subprocess
+
+    try:
+        result: subprocess.CompletedProcess | Exception = subprocess.run(
+            _app_access_command(apps, timeout),
+            capture_output=True,
+            text=True,
+            timeout=timeout * len(apps) + 5,
+        )
+    except Exception as e:
+        result = e
+    return _parse_app_access(apps, result)
+
+
+def _run_commands(
+    commands: dict[str, tuple[list[str], float]],
+) -> dict[str, subprocess.CompletedProcess | Exception]:
+    """Run several commands concurrently and wait for all of them.
+
+    Args:
+        commands: Mapping of a key to (argv, timeout in seconds)
+
+    Returns:
+        Mapping of each key to its CompletedProcess (text output), or to the
+        exception it raised: subprocess.TimeoutExpired if it ran too long,
+        OSError if it could not be started
+    """
+    import subprocess
+
+    async def run_one(argv: list[str], timeout: float) -> subprocess.CompletedProcess:
+        proc = await asyncio.create_subprocess_exec(
+            *argv, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(argv, timeout) from None
+        return subprocess.CompletedProcess(
+            argv, proc.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+        )
+
+    async def run_all() -> list[subprocess.CompletedProcess | BaseException]:
+        return await asyncio.gather(
+            *(run_one(argv, timeout) for argv, timeout in commands.values()),
+            return_exceptions=True,
+        )
+
+    return dict(zip(commands, _run_async(run_all())))
+
+
+# KEY=value lines of a .env file; comment lines start with "#"
+_ENV_LINE_RE = re.compile(r"^(?!#)([^=\n]*)=(.*)$", re.MULTILINE)
+
+
+def _read_env_file(path: Path) -> dict[str, str]:
+    """Parse a .env file into a dict, stripping whitespace around keys and values."""
+    return {key.strip(): value.strip() for key, value in _ENV_LINE_RE.findall(path.read_text())}
+
+
+def _write_env_file(path: Path, env: dict[str, str]) -> None:
+    """Write env vars as a .env file, sorted by key, with a single write."""
+    lines = ["# MacBot Configuration", "# Generated by 'son onboard'", ""]
+    lines += [f"{key}={value}" for key, value in sorted(env.items())]
+    path.write_text("\n".join(lines) + "\n")
+
+
 def cmd_onboard(args: argparse.Namespace) -> None:
     """Interactive setup wizard for new users."""
-    import platform
     import shutil
     import subprocess
 
+    import httpx
+
+    from macbot.core.agent import Agent
+
     console.print(f"\n[bold]Welcome to Son of Simon![/bold] v{__version__}")
     console.print("Let's get you set up.\n")
 
@@ -998,18 +1502,6 @@ def cmd_onboard(args: argparse.Namespace) -> None:
             capture_output=True,
         )
 
-    def test_applescript_access(app: str, script: str) -> bool:
-        """Test if we have AppleScript access to an app."""
-        try:
-            result = subprocess.run(
-                ["osascript", "-e", script],
-                capture_output=True,
-                timeout=10,
-            )
-            return result.returncode == 0
-        except Exception:
-            return False
-
     total_steps = 6
 
     # =========================================================================
@@ -1121,25 +1613,20 @@ def cmd_onboard(args: argparse.Namespace) -> None:
     # =========================================================================
     step_header(2, total_steps, "macOS Permissions")
 
-    if platform.system() != "Darwin":
+    if _platform_info()[1] != "Darwin":
         console.print("[yellow]Skipping - not on macOS[/yellow]")
     else:
         console.print("Son of Simon needs permission to control apps via AppleScript.")
         console.print("We'll open System Settings for you to grant access.\n")
 
-        apps_to_test = [
-            ("Mail", 'tell application "Mail" to count of accounts'),
-            ("Calendar", 'tell application "Calendar" to count of calendars'),
-            ("Reminders", 'tell application "Reminders" to count of lists'),
-            ("Notes", 'tell application "Notes" to count of notes'),
-            ("Safari", 'tell application "Safari" to count of windows'),
-        ]
+        apps_to_test = ["Mail", "Calendar", "Reminders", "Notes", "Safari"]
 
-        # Check current permissions
-        missing_perms = []
-        for app_name, script in apps_to_test:
-            if not test_applescript_access(app_name, script):
-                missing_perms.append(app_name)
+        # Check current permissions (all apps in one osascript run)
+        missing_perms = [
+            app_name
+            for app_name, (ok, _) in _check_app_access(apps_to_test).items()
+            if not ok
+        ]
 
         if not missing_perms:
             console.print("[green]✓[/green] All app permissions already granted!")
@@ -1155,10 +1642,11 @@ def cmd_onboard(args: argparse.Namespace) -> None:
             console.input("\nPress [bold]Enter[/bold] when done...")
 
             # Re-check
-            still_missing = []
-            for app_name, script in apps_to_test:
-                if not test_applescript_access(app_name, script):
-                    still_missing.append(app_name)
+            still_missing = [
+                app_name
+                for app_name, (ok, _) in _check_app_access(apps_to_test).items()
+                if not ok
+            ]
 
             if not still_missing:
                 console.print("[green]✓[/green] All permissions granted!")
@@ -1256,42 +1744,37 @@ def cmd_onboard(args: argparse.Namespace) -> None:
                 # Validate token
                 console.print("Validating token...", end=" ")
                 try:
-                    async def _validate():
-                        from macbot.telegram.bot import validate_token
-                        return await validate_token(token)
-                    ok, msg = asyncio.run(_validate())
-                    if ok:
-                        console.print(f"[green]✓ Connected as {msg}[/green]")
-                        env_vars["MACBOT_TELEGRAM_BOT_TOKEN"] = token
-
-                        # Get chat ID
-                        console.print("\n[bold]Now let's get your chat ID:[/bold]")
-                        console.print("  Send any message to your new bot in Telegram...")
-
-                        async def _get_chat_id():
-                            from macbot.telegram import TelegramBot
-                            bot = TelegramBot(token)
-                            offset = None
-                            for _ in range(30):  # Wait up to 30 seconds
-                                updates = await bot.get_updates(offset=offset, timeout=1)
-                                for update in updates:
-                                    offset = update.update_id + 1
-                                    if update.message:
-                                        await bot.close()
-                                        return str(update.message.chat_id)
+                    from macbot.telegram import TelegramBot
+                    from macbot.telegram.bot import validate_token
+
+                    async def _setup_telegram() -> None:
+                        # One bot (and HTTP connection) for validation and the chat ID wait
+                        bot = TelegramBot(token)
+                        try:
+                            ok, msg = await validate_token(token, bot=bot)
+                            if not ok:
+                                console.print(f"[red]✗ Invalid: {msg}[/red]")
+                                return
+
+                            console.print(f"[green]✓ Connected as {msg}[/green]")
+                            env_vars["MACBOT_TELEGRAM_BOT_TOKEN"] = token
+
+                            # Get chat ID
+                            console.print("\n[bold]Now let's get your chat ID:[/bold]")
+                            console.print("  Send any message to your new bot in Telegram...")
+                            console.print("[dim]Waiting for message...[/dim]")
+                            chat_id = await _wait_for_chat_id(bot, timeout=30)
+                        finally:
                             await bot.close()
-                            return None
 
-                        console.print("[dim]Waiting for message...[/dim]")
-                        chat_id = asyncio.run(_get_chat_id())
                         if chat_id:
                             console.print(f"[green]✓[/green] Your chat ID: {chat_id}")
                             env_vars["MACBOT_TELEGRAM_CHAT_ID"] = chat_id
                         else:
                             console.print("[yellow]![/yellow] Timeout - no message received")
                             console.print("    Run 'son telegram whoami' later to get your chat ID")
-                    else:
-                        console.print(f"[red]✗ Invalid: {msg}[/red]")
+
+                    _run_async(_setup_telegram())
                 except Exception as e:
                     console.print(f"[red]✗ Error: {e}[/red]")
 
@@ -1350,7 +1833,7 @@ def cmd_onboard(args: argparse.Namespace) -> None:
                             response.raise_for_status()
                             return True, response.json().get("count", 0)
 
-                    ok, doc_count = asyncio.run(_validate_paperless())
+                    ok, doc_count = _run_async(_validate_paperless())
                     if ok:
                         console.print(f"[green]✓ Connected ({doc_count} documents)[/green]")
                         env_vars["MACBOT_PAPERLESS_URL"] = url
@@ -1383,22 +1866,13 @@ def cmd_onboard(args: argparse.Namespace) -> None:
         CorePreferences().save_defaults()
 
         # Read existing env file if present
-        existing_env = {}
-        if env_file.exists():
-            for line in env_file.read_text().splitlines():
-                if "=" in line and not line.startswith("#"):
-                    key, value = line.split("=", 1)
-                    existing_env[key.strip()] = value.strip()
+        existing_env = _read_env_file(env_file) if env_file.exists() else {}
 
         # Merge with new values
         existing_env.update(env_vars)
 
         # Write back
-        with open(env_file, "w") as f:
-            f.write("# MacBot Configuration\n")
-            f.write("# Generated by 'son onboard'\n\n")
-            for key, value in sorted(existing_env.items()):
-                f.write(f"{key}={value}\n")
+        _write_env_file(env_file, existing_env)
 
         console.print(f"[green]✓[/green] Saved to {env_file}")
         console.print("[dim]Configuration will be loaded automatically on next run.[/dim]")
@@ -1416,13 +1890,10 @@ def cmd_onboard(args: argparse.Namespace) -> None:
         test_settings = Settings()
 
         if test_settings.anthropic_api_key or test_settings.openai_api_key:
-            registry = create_default_registry()
+            registry = _get_registry()
             agent = Agent(registry, config=test_settings)
 
-            async def _test():
-                return await agent.run("What time is it?", stream=False)
-
-            result = asyncio.run(_test())
+            result = _run_async(agent.run("What time is it?", stream=False))
             console.print(f"[green]✓[/green] Test successful!")
             console.print(f"  Response: {result[:100]}{'...' if len(result) > 100 else ''}")
         else:
@@ -1447,11 +1918,28 @@ def cmd_onboard(args: argparse.Namespace) -> None:
     console.print("\n[dim]Run 'son --help' for more commands.[/dim]\n")
 
 
+@functools.lru_cache(maxsize=1)
+def _platform_info() -> tuple[str, str, str | None]:
+    """Return (Python version, OS name, macOS version or None) for this machine."""
+    import platform
+
+    system = platform.system()
+    macos_version = platform.mac_ver()[0] if system == "Darwin" else None
+    return ".".join(map(str, sys.version_info[:3])), system, macos_version
+
+
+def _mask_secret(secret: str) -> str:
+    """Mask an API key or token for display, keeping its first 8 and last 4 chars."""
+    return f"{secret[:8]}...{secret[-4:]}" if len(secret) > 12 else "***"
+
+
 def cmd_doctor(args: argparse.Namespace) -> None:
     """Check system prerequisites and configuration."""
     import json
-    import platform
     import shutil
+    import subprocess
+
+    import httpx
 
     # JSON output mode for GUI integration
     json_mode = getattr(args, 'json', False)
@@ -1459,12 +1947,14 @@ def cmd_doctor(args: argparse.Namespace) -> None:
     if not json_mode:
         console.print(f"\n[bold]Son of Simon Doctor[/bold] v{__version__}\n")
 
+    py_version, system, macos_version = _platform_info()
+
     all_ok = True
     results: dict = {
         "version": __version__,
-        "python_version": platform.python_version(),
-        "macos_version": platform.mac_ver()[0] if platform.system() == "Darwin" else None,
-        "platform": platform.system(),
+        "python_version": py_version,
+        "macos_version": macos_version,
+        "platform": system,
         "config": {},
         "permissions": {
             "accessibility": False,
@@ -1499,14 +1989,12 @@ def cmd_doctor(args: argparse.Namespace) -> None:
         console.print("[bold]System[/bold]")
 
     # Python version
-    py_version = platform.python_version()
-    py_ok = tuple(map(int, py_version.split(".")[:2])) >= (3, 10)
+    py_ok = sys.version_info[:2] >= (3, 10)
     check("Python", py_ok, py_version, "Requires Python 3.10+")
 
     # Platform
-    system = platform.system()
     if system == "Darwin":
-        check("Platform", True, f"macOS ({platform.mac_ver()[0]})")
+        check("Platform", True, f"macOS ({macos_version})")
     else:
         warn("Platform", f"{system} (macOS recommended)",
              "macOS automation tasks require macOS")
@@ -1544,8 +2032,7 @@ def cmd_doctor(args: argparse.Namespace) -> None:
         key_name = f"MACBOT_{provider.upper()}_API_KEY"
 
         if api_key:
-            masked = api_key[:8] + "..." + api_key[-4:] if len(api_key) > 12 else "***"
-            check("API Key", True, f"{masked}")
+            check("API Key", True, _mask_secret(api_key))
         else:
             check("API Key", False, "Not set",
                   f"Set {key_name} or run 'son onboard' to configure")
@@ -1596,10 +2083,13 @@ def cmd_doctor(args: argparse.Namespace) -> None:
 
         missing = []
         for script in key_scripts:
-            script_path = scripts_dir / script
-            if not script_path.exists():
+            # One stat covers both the existence and the executable check
+            try:
+                st = os.stat(scripts_dir / script)
+            except FileNotFoundError:
                 missing.append(script)
-            elif not os.access(script_path, os.X_OK):
+                continue
+            if not st.st_mode & 0o111:
                 missing.append(f"{script} (not executable)")
 
         if not missing:
@@ -1611,87 +2101,52 @@ def cmd_doctor(args: argparse.Namespace) -> None:
         check("Scripts Directory", False, "Not found",
               "Clone https://github.com/user/macos-automation to ~/macos-automation")
 
+    # Look up every external tool once; the probes below exec the resolved
+    # paths directly instead of searching PATH again
+    tool_paths = {
+        tool: shutil.which(tool)
+        for tool in ("osascript", "cliclick", "brew", "python3", "node", "npx")
+    }
+
     # osascript (AppleScript)
-    osascript = shutil.which("osascript")
+    osascript = tool_paths["osascript"]
     if osascript:
         check("osascript", True, osascript)
     else:
         check("osascript", False, "Not found",
               "osascript is required for macOS automation (macOS only)")
 
+    # Start every external probe below at once; each section then renders
+    # from its result, so the wait is the slowest probe rather than the sum
+    apps = list(_APP_ACCESS_PROBES)
+    js_test = 'tell application "Safari" to do JavaScript "1+1" in current tab of front window'
+    osascript_cmd = osascript or "osascript"
+    probes: dict[str, tuple[list[str], float]] = {
+        "apps": (_app_access_command(apps, osascript=osascript_cmd), 10 * len(apps) + 5),
+        "safari_js": ([osascript_cmd, "-e", js_test], 5),
+    }
+    if tool_paths["cliclick"]:
+        probes["cliclick"] = ([tool_paths["cliclick"], "p:."], 5)
+    for tool in ("brew", "python3", "node"):
+        if tool_paths[tool]:
+            probes[tool] = ([tool_paths[tool], "--version"], 5)
+    probe_results = _run_commands(probes)
+
+    def probe(name: str) -> subprocess.CompletedProcess:
+        """Return a probe's finished process, re-raising what it failed with."""
+        result = probe_results[name]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
     # Test AppleScript access to apps
     if not json_mode:
         console.print("\n[bold]App Access Tests[/bold]")
 
-    def test_app_access(app_name: str, test_script: str) -> tuple[bool, str]:
-        """Test if we can access an app via AppleScript."""
-        import subprocess
-        try:
-            result = subprocess.run(
-                ["osascript", "-e", test_script],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode == 0:
-                return True, result.stdout.strip()[:50] or "OK"
-            else:
-                error = result.stderr.strip()
-                # Parse common error codes
-                if "-1743" in error:
-                    return False, "Permission denied (grant in System Settings > Privacy > Automation)"
-                elif "-2741" in error:
-                    return False, "AppleScript syntax error (special chars in data?)"
-                elif "-1728" in error:
-                    return False, f"{app_name} not found or not responding"
-                else:
-                    return False, error[:80]
-        except subprocess.TimeoutExpired:
-            return False, "Timeout (app not responding)"
-        except Exception as e:
-            return False, str(e)[:80]
-
-    # Test Notes
-    ok, msg = test_app_access("Notes", 'tell application "Notes" to count of notes')
-    results["permissions"]["automation"]["Notes"] = ok
-    check("Notes.app", ok, msg,
-          "Grant access in System Settings > Privacy & Security > Automation" if not ok else None)
-
-    # Test Mail
-    ok, msg = test_app_access("Mail", 'tell application "Mail" to count of accounts')
-    results["permissions"]["automation"]["Mail"] = ok
-    check("Mail.app", ok, msg,
-          "Grant access in System Settings > Privacy & Security > Automation" if not ok else None)
-
-    # Test Calendar
-    ok, msg = test_app_access("Calendar", 'tell application "Calendar" to count of calendars')
-    results["permissions"]["automation"]["Calendar"] = ok
-    check("Calendar.app", ok, msg,
-          "Grant access in System Settings > Privacy & Security > Automation" if not ok else None)
-
-    # Test Reminders
-    ok, msg = test_app_access("Reminders", 'tell application "Reminders" to count of lists')
-    results["permissions"]["automation"]["Reminders"] = ok
-    check("Reminders.app", ok, msg,
-          "Grant access in System Settings > Privacy & Security > Automation" if not ok else None)
-
-    # Test Safari
-    ok, msg = test_app_access("Safari", 'tell application "Safari" to count of windows')
-    results["permissions"]["automation"]["Safari"] = ok
-    check("Safari.app", ok, msg,
-          "Grant access in System Settings > Privacy & Security > Automation" if not ok else None)
-
-    # Test Contacts
-    ok, msg = test_app_access("Contacts", 'tell application "Contacts" to count of people')
-    results["permissions"]["automation"]["Contacts"] = ok
-    check("Contacts.app", ok, msg,
-          "Grant access in System Settings > Privacy & Security > Automation" if not ok else None)
-
-    # Test Messages
-    ok, msg = test_app_access("Messages", 'tell application "Messages" to count of services')
-    results["permissions"]["automation"]["Messages"] = ok
-    check("Messages.app", ok, msg,
-          "Grant access in System Settings > Privacy & Security > Automation" if not ok else None)
+    for app_name, (ok, msg) in _parse_app_access(apps, probe_results["apps"]).items():
+        results["permissions"]["automation"][app_name] = ok
+        check(f"{app_name}.app", ok, msg,
+              "Grant access in System Settings > Privacy & Security > Automation" if not ok else None)
 
     # Folder Access
     if not json_mode:
@@ -1734,17 +2189,11 @@ def cmd_doctor(args: argparse.Namespace) -> None:
         console.print("\n[bold]Browser Automation[/bold]")
 
     # Check for cliclick (used for physical mouse clicks)
-    cliclick_path = shutil.which("cliclick")
+    cliclick_path = tool_paths["cliclick"]
     if cliclick_path:
         # Test if cliclick has Accessibility permissions
-        import subprocess
         try:
-            result = subprocess.run(
-                ["cliclick", "p:."],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
+            result = probe("cliclick")
             if result.returncode == 0:
                 check("cliclick", True, f"{cliclick_path} (Accessibility OK)")
             else:
@@ -1763,14 +2212,8 @@ def cmd_doctor(args: argparse.Namespace) -> None:
              "Install with: brew install cliclick")
 
     # Check for JavaScript execution capability in Safari
-    js_test = 'tell application "Safari" to do JavaScript "1+1" in current tab of front window'
     try:
-        result = subprocess.run(
-            ["osascript", "-e", js_test],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
+        result = probe("safari_js")
         if result.returncode == 0:
             check("Safari JavaScript", True, "Allowed")
         else:
@@ -1791,10 +2234,10 @@ def cmd_doctor(args: argparse.Namespace) -> None:
 
     results["dev_tools"] = {}
 
-    brew_path = shutil.which("brew")
+    brew_path = tool_paths["brew"]
     if brew_path:
         try:
-            brew_out = subprocess.run(["brew", "--version"], capture_output=True, text=True, timeout=5)
+            brew_out = probe("brew")
             brew_ver = brew_out.stdout.strip().split("\n")[0].replace("Homebrew ", "") if brew_out.returncode == 0 else "unknown"
             check("Homebrew", True, f"{brew_ver} ({brew_path})")
             results["dev_tools"]["homebrew"] = {"installed": True, "version": brew_ver, "path": brew_path}
@@ -1806,10 +2249,10 @@ def cmd_doctor(args: argparse.Namespace) -> None:
              "Install from https://brew.sh")
         results["dev_tools"]["homebrew"] = {"installed": False}
 
-    python3_path = shutil.which("python3")
+    python3_path = tool_paths["python3"]
     if python3_path:
         try:
-            py_out = subprocess.run(["python3", "--version"], capture_output=True, text=True, timeout=5)
+            py_out = probe("python3")
             py_ver = py_out.stdout.strip().replace("Python ", "") if py_out.returncode == 0 else "unknown"
             check("Python 3", True, f"{py_ver} ({python3_path})")
             results["dev_tools"]["python3"] = {"installed": True, "version": py_ver, "path": python3_path}
@@ -1821,10 +2264,10 @@ def cmd_doctor(args: argparse.Namespace) -> None:
              "Install with: brew install python3")
         results["dev_tools"]["python3"] = {"installed": False}
 
-    node_path = shutil.which("node")
+    node_path = tool_paths["node"]
     if node_path:
         try:
-            node_out = subprocess.run(["node", "--version"], capture_output=True, text=True, timeout=5)
+            node_out = probe("node")
             node_ver = node_out.stdout.strip().replace("v", "") if node_out.returncode == 0 else "unknown"
             check("Node.js", True, f"{node_ver} ({node_path})")
             results["dev_tools"]["node"] = {"installed": True, "version": node_ver, "path": node_path}
@@ -1836,7 +2279,7 @@ def cmd_doctor(args: argparse.Namespace) -> None:
              "Install with: brew install node")
         results["dev_tools"]["node"] = {"installed": False}
 
-    npx_path = shutil.which("npx")
+    npx_path = tool_paths["npx"]
     if npx_path:
         check("npx", True, npx_path)
         results["dev_tools"]["npx"] = {"installed": True, "path": npx_path}
@@ -1849,19 +2292,16 @@ def cmd_doctor(args: argparse.Namespace) -> None:
     if not json_mode:
         console.print("\n[bold]Tasks[/bold]")
 
-    registry = create_default_registry()
+    registry = _get_registry()
     task_count = len(registry)
     check("Registered Tasks", task_count > 0, f"{task_count} tasks")
 
-    # Categorize tasks
-    macos_tasks = [t for t in registry.list_tasks() if any(
-        x in t.name for x in ["email", "mail", "calendar", "event", "reminder", "note", "safari", "url", "tab", "link"]
-    )]
-    system_tasks = [t for t in registry.list_tasks() if t not in macos_tasks]
+    # Categorize tasks: anything in one of the app categories is a macOS task
+    system_count = sum(_task_category(t.name) == "System" for t in registry.sorted_tasks())
 
     if not json_mode:
-        console.print(f"    [dim]System tasks: {len(system_tasks)}[/dim]")
-        console.print(f"    [dim]macOS tasks: {len(macos_tasks)}[/dim]")
+        console.print(f"    [dim]System tasks: {system_count}[/dim]")
+        console.print(f"    [dim]macOS tasks: {task_count - system_count}[/dim]")
 
     # Telegram Integration
     if not json_mode:
@@ -1872,16 +2312,13 @@ def cmd_doctor(args: argparse.Namespace) -> None:
         if ":" not in settings.telegram_bot_token:
             check("Token Format", False, "Invalid format (expected ID:SECRET)")
         else:
-            masked = settings.telegram_bot_token[:8] + "..." + settings.telegram_bot_token[-4:]
-            check("Token", True, masked)
+            check("Token", True, _mask_secret(settings.telegram_bot_token))
 
             # Test API connection
-            async def _test_telegram() -> tuple[bool, str]:
+            try:
                 from macbot.telegram.bot import validate_token
-                return await validate_token(settings.telegram_bot_token)
 
-            try:
-                ok, msg = asyncio.run(_test_telegram())
+                ok, msg = _run_async(validate_token(settings.telegram_bot_token))
                 if ok:
                     check("API Connection", True, f"Connected as {msg}")
                 else:
@@ -1916,9 +2353,7 @@ def cmd_doctor(args: argparse.Namespace) -> None:
         check("URL", True, settings.paperless_url)
 
         # Mask the token
-        token = settings.paperless_api_token
-        masked = token[:8] + "..." + token[-4:] if len(token) > 12 else "***"
-        check("API Token", True, masked)
+        check("API Token", True, _mask_secret(settings.paperless_api_token))
 
         # Test API connection
         async def _test_paperless() -> tuple[bool, str]:
@@ -1944,7 +2379,7 @@ def cmd_doctor(args: argparse.Namespace) -> None:
                 return False, str(e)[:50]
 
         try:
-            ok, msg = asyncio.run(_test_paperless())
+            ok, msg = _run_async(_test_paperless())
             if ok:
                 check("API Connection", True, msg)
             else:
@@ -1975,15 +2410,56 @@ def cmd_doctor(args: argparse.Namespace) -> None:
 
 
 # Cron commands
+@functools.lru_cache(maxsize=1)
+def _get_cron_service() -> CronService:
+    """Return the cron service backed by the configured storage, loaded once."""
+    from macbot.cron import CronService
+
+    return CronService(storage_path=settings.get_cron_storage_path())
+
+
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MS = timedelta(milliseconds=1)
+
+
+def _iso_to_ms(value: str | datetime) -> int:
+    """Convert an ISO 8601 datetime (or a datetime YAML already parsed) to epoch ms.
+
+    Naive datetimes are taken as local time.
+
+    Raises:
+        ValueError: If the string is not a valid ISO 8601 datetime
+    """
+    dt = value if isinstance(value, datetime) else datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        dt = dt.astimezone()
+    return (dt - _EPOCH_UTC) // _ONE_MS
+
+
+@functools.lru_cache(maxsize=1024)
+def _at_ms_iso(at_ms: int) -> str:
+    """Format an 'at' schedule's epoch ms as a local ISO 8601 datetime."""
+    return datetime.fromtimestamp(at_ms / 1000).isoformat()
+
+
+# Renders a job's schedule for display, keyed by ScheduleKind (a str enum)
+_SCHED_FORMATTERS: dict[str, Callable[[CronSchedule], str]] = {
+    "at": lambda s: f"at {_at_ms_iso(s.at_ms)}",
+    "every": lambda s: f"every {s.every_ms // 1000}s",
+    "cron": lambda s: s.cron_expr or "?",
+}
+
+
 def cmd_cron_add(args: argparse.Namespace) -> None:
     """Add a new scheduled job."""
-    service = CronService(storage_path=settings.get_cron_storage_path())
+    from macbot.cron import CronJobCreate, CronPayload, CronSchedule, ScheduleKind
+
+    service = _get_cron_service()
 
     # Determine schedule type
     if args.at:
         try:
-            at_time = datetime.fromisoformat(args.at)
-            at_ms = int(at_time.timestamp() * 1000)
+            at_ms = _iso_to_ms(args.at)
             schedule = CronSchedule(kind=ScheduleKind.AT, at_ms=at_ms)
         except ValueError:
             console.print(f"[red]Invalid datetime:[/red] {args.at}")
@@ -2020,7 +2496,9 @@ def cmd_cron_add(args: argparse.Namespace) -> None:
 
 def cmd_cron_list(args: argparse.Namespace) -> None:
     """List all scheduled jobs."""
-    service = CronService(storage_path=settings.get_cron_storage_path())
+    from rich.table import Table
+
+    service = _get_cron_service()
     jobs = service.list_jobs()
 
     if not jobs:
@@ -2036,12 +2514,7 @@ def cmd_cron_list(args: argparse.Namespace) -> None:
     table.add_column("Runs", style="magenta")
 
     for job in jobs:
-        if job.schedule.kind == ScheduleKind.AT:
-            sched_str = f"at {datetime.fromtimestamp(job.schedule.at_ms / 1000).isoformat()}"
-        elif job.schedule.kind == ScheduleKind.EVERY:
-            sched_str = f"every {job.schedule.every_ms // 1000}s"
-        else:
-            sched_str = job.schedule.cron_expr or "?"
+        sched_str = _SCHED_FORMATTERS[job.schedule.kind](job.schedule)
 
         next_run = job.state.next_run_at.isoformat() if job.state.next_run_at else "-"
 
@@ -2059,7 +2532,7 @@ def cmd_cron_list(args: argparse.Namespace) -> None:
 
 def cmd_cron_run(args: argparse.Namespace) -> None:
     """Run a scheduled job immediately."""
-    service = CronService(storage_path=settings.get_cron_storage_path())
+    service = _get_cron_service()
 
     job = service.get_job(args.job_id)
     if not job:
@@ -2074,12 +2547,12 @@ def cmd_cron_run(args: argparse.Namespace) -> None:
             console.print(f"[red]Failed:[/red] {result.error}")
 
     console.print(f"Running: {job.name}")
-    asyncio.run(_run())
+    _run_async(_run())
 
 
 def cmd_cron_remove(args: argparse.Namespace) -> None:
     """Remove a scheduled job."""
-    service = CronService(storage_path=settings.get_cron_storage_path())
+    service = _get_cron_service()
 
     job = service.get_job(args.job_id)
     if not job:
@@ -2095,7 +2568,7 @@ def cmd_cron_remove(args: argparse.Namespace) -> None:
 
 def cmd_cron_enable(args: argparse.Namespace) -> None:
     """Enable a scheduled job."""
-    service = CronService(storage_path=settings.get_cron_storage_path())
+    service = _get_cron_service()
 
     if service.enable_job(args.job_id):
         console.print(f"[green]Enabled:[/green] {args.job_id}")
@@ -2106,7 +2579,7 @@ def cmd_cron_enable(args: argparse.Namespace) -> None:
 
 def cmd_cron_disable(args: argparse.Namespace) -> None:
     """Disable a scheduled job."""
-    service = CronService(storage_path=settings.get_cron_storage_path())
+    service = _get_cron_service()
 
     if service.disable_job(args.job_id):
         console.print(f"[yellow]Disabled:[/yellow] {args.job_id}")
@@ -2123,6 +2596,16 @@ def cmd_cron_import(args: argparse.Namespace) -> None:
     2. Clear all existing jobs
     3. Import jobs from the file
     """
+    import yaml
+
+    from macbot.cron import (
+        CronJobCreate,
+        CronPayload,
+        CronSchedule,
+        ScheduleKind,
+        validate_cron_expression,
+    )
+
     config_path = Path(args.file)
 
     if not config_path.exists():
@@ -2131,8 +2614,7 @@ def cmd_cron_import(args: argparse.Namespace) -> None:
 
     # Load and parse YAML file
     try:
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
+        config = yaml_safe_load(config_path.read_bytes())
     except yaml.YAMLError as e:
         console.print(f"[red]Invalid YAML:[/red] {e}")
         sys.exit(1)
@@ -2152,100 +2634,119 @@ def cmd_cron_import(args: argparse.Namespace) -> None:
         console.print(f"[yellow]Stopping running scheduler[/yellow] (PID {pid})...")
         try:
             os.kill(pid, signal.SIGTERM)
-            import time
-            for _ in range(20):
-                time.sleep(0.2)
-                if not _get_scheduler_pid():
-                    break
-        except (ProcessLookupError, PermissionError):
-            pass
-        PID_FILE.unlink(missing_ok=True)
+            stopped = _wait_for_exit(pid, timeout=4.0)
+        except ProcessLookupError:
+            stopped = True
+        except PermissionError:
+            stopped = False
+        if stopped:
+            PID_FILE.unlink(missing_ok=True)
+        else:
+            # Keep the PID file so 'son cron stop' can still find the process
+            console.print("[yellow]Scheduler may still be shutting down...[/yellow]")
 
     # Clear existing jobs and import new ones
-    service = CronService(storage_path=settings.get_cron_storage_path())
+    service = _get_cron_service()
 
     # Clear all existing jobs
     existing = service.list_jobs()
     if existing:
         console.print(f"[yellow]Removing {len(existing)} existing jobs...[/yellow]")
-        for job in existing:
-            service.delete_job(job.id)
+        service.clear_jobs()
 
     # Import new jobs
     console.print(f"\n[bold]Importing {len(jobs_config)} jobs from {config_path.name}[/bold]\n")
 
-    imported_count = 0
+    # Validate every entry first, then store all jobs with a single write
+    creates: list[CronJobCreate] = []
+    sched_strs: list[str] = []
+    lines: list[str] = []  # Printed in one go once the jobs are stored
     for job_config in jobs_config:
-        name = job_config.get("name")
+        if not isinstance(job_config, dict):
+            lines.append(f"[red]Skipping invalid entry:[/red] {job_config!r}")
+            continue
+        get = job_config.get
+        name = get("name")
         if not name:
-            console.print(f"[red]Skipping job without name[/red]")
+            lines.append(f"[red]Skipping job without name[/red]")
             continue
 
-        goal = job_config.get("goal") or job_config.get("message")
+        goal = get("goal") or get("message")
         if not goal:
-            console.print(f"[red]Skipping '{name}':[/red] no goal/message")
+            lines.append(f"[red]Skipping '{name}':[/red] no goal/message")
             continue
 
         # Parse schedule
-        interval = job_config.get("interval")
-        cron_expr = job_config.get("cron")
-        at_time = job_config.get("at")
+        interval = get("interval")
+        cron_expr = get("cron")
+        at_time = get("at")
 
         if interval:
             schedule = CronSchedule(kind=ScheduleKind.EVERY, every_ms=interval * 1000)
             sched_str = f"every {interval}s"
         elif cron_expr:
-            tz = job_config.get("timezone", "UTC")
+            if not validate_cron_expression(cron_expr):
+                lines.append(f"[red]Skipping '{name}':[/red] invalid cron expression '{cron_expr}'")
+                continue
+            tz = get("timezone", "UTC")
             schedule = CronSchedule(kind=ScheduleKind.CRON, cron_expr=cron_expr, timezone=tz)
             sched_str = cron_expr
         elif at_time:
             try:
-                dt = datetime.fromisoformat(at_time)
-                at_ms = int(dt.timestamp() * 1000)
+                at_ms = _iso_to_ms(at_time)
                 schedule = CronSchedule(kind=ScheduleKind.AT, at_ms=at_ms)
                 sched_str = f"at {at_time}"
-            except ValueError:
-                console.print(f"[red]Skipping '{name}':[/red] invalid datetime '{at_time}'")
+            except (TypeError, ValueError):
+                lines.append(f"[red]Skipping '{name}':[/red] invalid datetime '{at_time}'")
                 continue
         else:
-            console.print(f"[red]Skipping '{name}':[/red] no schedule (interval, cron, or at)")
+            lines.append(f"[red]Skipping '{name}':[/red] no schedule (interval, cron, or at)")
             continue
 
-        # Create the job
-        job = service.create_job(CronJobCreate(
+        creates.append(CronJobCreate(
             name=name,
-            description=job_config.get("description"),
+            description=get("description"),
             schedule=schedule,
             payload=CronPayload(
                 message=goal,
                 kind="agent_turn",  # Always use agent for goals
             ),
-            enabled=job_config.get("enabled", True),
+            enabled=get("enabled", True),
         ))
+        sched_strs.append(sched_str)
 
-        imported_count += 1
+    jobs = service.create_jobs(creates)
+    for job, sched_str in zip(jobs, sched_strs):
         status = "[green]✓[/green]" if job.enabled else "[yellow]○[/yellow]"
-        console.print(f"  {status} {name} ({sched_str})")
+        lines.append(f"  {status} {job.name} ({sched_str})")
+    if lines:
+        console.print("\n".join(lines))
 
-    console.print(f"\n[green]Imported {imported_count} jobs[/green]")
+    console.print(f"\n[green]Imported {len(jobs)} jobs[/green]")
     console.print(f"Storage: {service.storage_path}")
     console.print("\nRun [bold]son cron start[/bold] to start the scheduler")
 
 
 def cmd_cron_start(args: argparse.Namespace) -> None:
     """Start the cron scheduler to run all registered jobs."""
-    service = CronService(storage_path=settings.get_cron_storage_path())
+    from macbot.core.agent import Agent
 
-    jobs = service.list_jobs()
-    enabled_jobs = [j for j in jobs if j.enabled]
+    # We are the detached process started by --background below
+    if args.daemon_child:
+        _run_cron_daemon()
+        return
 
-    if not jobs:
-        console.print("[yellow]No jobs registered.[/yellow]")
-        console.print("Use [bold]son cron import <file>[/bold] to import jobs")
-        sys.exit(0)
+    service = _get_cron_service()
+
+    enabled_jobs = service.list_enabled_jobs()
 
     if not enabled_jobs:
-        console.print(f"[yellow]No enabled jobs.[/yellow] ({len(jobs)} jobs disabled)")
+        jobs = service.list_jobs()
+        if not jobs:
+            console.print("[yellow]No jobs registered.[/yellow]")
+            console.print("Use [bold]son cron import <file>[/bold] to import jobs")
+        else:
+            console.print(f"[yellow]No enabled jobs.[/yellow] ({len(jobs)} jobs disabled)")
         sys.exit(0)
 
     # Check if already running
@@ -2260,12 +2761,7 @@ def cmd_cron_start(args: argparse.Namespace) -> None:
 
     # Show jobs that will run
     for job in enabled_jobs:
-        if job.schedule.kind == ScheduleKind.EVERY:
-            sched_str = f"every {job.schedule.every_ms // 1000}s"
-        elif job.schedule.kind == ScheduleKind.CRON:
-            sched_str = job.schedule.cron_expr
-        else:
-            sched_str = f"at {datetime.fromtimestamp(job.schedule.at_ms / 1000).isoformat()}"
+        sched_str = _SCHED_FORMATTERS[job.schedule.kind](job.schedule)
 
         goal_preview = job.payload.message[:50] + "..." if len(job.payload.message) > 50 else job.payload.message
         console.print(f"  [cyan]{job.name}[/cyan] ({sched_str})")
@@ -2278,51 +2774,12 @@ def cmd_cron_start(args: argparse.Namespace) -> None:
         console.print(f"  Log: {LOG_FILE}")
         console.print("\nUse 'son cron stop' to stop")
 
-        _daemonize()
-
-        # Now in daemon process
-        print(f"\n{'='*60}")
-        print(f"Son of Simon Cron Service started at {datetime.now().isoformat()}")
-        print(f"PID: {os.getpid()}")
-        print(f"Jobs: {len(enabled_jobs)} enabled")
-        print(f"{'='*60}\n")
-
-        # Set up signal handler
-        def handle_signal(signum, frame):
-            print(f"\nReceived signal {signum}, shutting down...")
-            PID_FILE.unlink(missing_ok=True)
-            sys.exit(0)
-
-        signal.signal(signal.SIGTERM, handle_signal)
-        signal.signal(signal.SIGINT, handle_signal)
-
-        # Set up agent handler for the cron service
-        registry = create_default_registry()
-        agent = Agent(registry)
-
-        async def agent_handler(payload: CronPayload):
-            from macbot.cron.executor import ExecutionResult
-            try:
-                result = await agent.run(payload.message)
-                return ExecutionResult(success=True, output=result)
-            except Exception as e:
-                return ExecutionResult(success=False, error=str(e))
-
-        # Create fresh service in daemon
-        daemon_service = CronService(storage_path=settings.get_cron_storage_path())
-        daemon_service.set_agent_handler(agent_handler)
-
-        try:
-            asyncio.run(daemon_service.start())
-            # Keep running
-            asyncio.run(_cron_run_forever(daemon_service))
-        finally:
-            PID_FILE.unlink(missing_ok=True)
+        _spawn_daemon(["cron", "start", "--daemon-child"], verbose=args.verbose)
     else:
         # Foreground mode
         console.print("[dim]Press Ctrl+C to stop.[/dim]\n")
 
-        registry = create_default_registry()
+        registry = _get_registry()
         agent = Agent(registry)
 
         async def agent_handler(payload: CronPayload):
@@ -2339,25 +2796,74 @@ def cmd_cron_start(args: argparse.Namespace) -> None:
         service.set_agent_handler(agent_handler)
 
         try:
-            asyncio.run(_cron_run_foreground(service))
+            _run_async(_cron_run_until_stopped(service))
         except KeyboardInterrupt:
-            console.print("\n[dim]Scheduler stopped.[/dim]")
+            pass
+        console.print("\n[dim]Scheduler stopped.[/dim]")
 
 
-async def _cron_run_forever(service: CronService) -> None:
-    """Run the cron service forever (for daemon mode)."""
-    await service.start()
-    while True:
-        await asyncio.sleep(1)
+def _run_cron_daemon() -> None:
+    """Body of the background cron scheduler started by 'cron start --background'."""
+    from macbot.core.agent import Agent
 
+    _detach_cwd()
+
+    daemon_service = _get_cron_service()
+
+    print(f"\n{'='*60}")
+    print(f"Son of Simon Cron Service started at {datetime.now().isoformat()}")
+    print(f"PID: {os.getpid()}")
+    print(f"Jobs: {len(daemon_service.list_enabled_jobs())} enabled")
+    print(f"{'='*60}\n")
+
+    # Set up signal handler
+    def handle_signal(signum, frame):
+        print(f"\nReceived signal {signum}, shutting down...")
+        PID_FILE.unlink(missing_ok=True)
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    # Set up agent handler for the cron service
+    registry = _get_registry()
+    agent = Agent(registry)
+
+    async def agent_handler(payload: CronPayload):
+        from macbot.cron.executor import ExecutionResult
+        try:
+            result = await agent.run(payload.message)
+            return ExecutionResult(success=True, output=result)
+        except Exception as e:
+            return ExecutionResult(success=False, error=str(e))
+
+    daemon_service.set_agent_handler(agent_handler)
+
+    try:
+        # Start and keep running in one event loop so the service task survives
+        _run_async(_cron_run_until_stopped(daemon_service))
+        print("\nReceived stop signal, shutting down...")
+    finally:
+        PID_FILE.unlink(missing_ok=True)
+
+
+async def _cron_run_until_stopped(service: CronService) -> None:
+    """Run the cron service until SIGTERM or SIGINT, then stop it.
+
+    The loop parks on an event instead of waking up periodically, so an idle
+    scheduler costs no CPU between jobs.
+    """
+    loop = asyncio.get_running_loop()
+    stop_event = asyncio.Event()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop_event.set)
 
-async def _cron_run_foreground(service: CronService) -> None:
-    """Run the cron service in foreground."""
     await service.start()
     try:
-        while True:
-            await asyncio.sleep(1)
+        await stop_event.wait()
     finally:
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.remove_signal_handler(sig)
         await service.stop()
 
 
@@ -2373,12 +2879,11 @@ def cmd_cron_stop(args: argparse.Namespace) -> None:
         os.kill(pid, signal.SIGTERM)
         console.print(f"[green]Sent stop signal to cron scheduler[/green] (PID {pid})")
 
-        import time
-        for _ in range(10):
-            time.sleep(0.2)
-            if not _get_scheduler_pid():
-                console.print("[green]Cron scheduler stopped[/green]")
-                return
+        if _wait_for_exit(pid):
+            # The scheduler is gone, so drop its PID file if it left one behind
+            PID_FILE.unlink(missing_ok=True)
+            console.print("[green]Cron scheduler stopped[/green]")
+            return
 
         console.print("[yellow]Scheduler may still be shutting down...[/yellow]")
     except ProcessLookupError:
@@ -2390,7 +2895,7 @@ def cmd_cron_stop(args: argparse.Namespace) -> None:
 
 def cmd_cron_clear(args: argparse.Namespace) -> None:
     """Clear all scheduled jobs."""
-    service = CronService(storage_path=settings.get_cron_storage_path())
+    service = _get_cron_service()
     jobs = service.list_jobs()
 
     if not jobs:
@@ -2404,8 +2909,7 @@ def cmd_cron_clear(args: argparse.Namespace) -> None:
             console.print("[dim]Aborted[/dim]")
             return
 
-    for job in jobs:
-        service.delete_job(job.id)
+    service.clear_jobs()
 
     console.print(f"[green]Cleared {len(jobs)} jobs[/green]")
 
@@ -2423,8 +2927,6 @@ def parse_time_range(time_str: str) -> tuple[int, int]:
     Raises:
         ValueError: If the format is invalid
     """
-    import re
-
     time_str = time_str.lower().strip()
     hours = 0
     minutes = 0
@@ -2540,6 +3042,8 @@ def cmd_skills_list(args: argparse.Namespace) -> None:
     """List all registered skills."""
     import json as json_module
 
+    from rich.table import Table
+
     from macbot.skills import SkillsRegistry
 
     registry = SkillsRegistry()
@@ -2599,6 +3103,8 @@ def cmd_skills_show(args: argparse.Namespace) -> None:
     """Show details of a specific skill."""
     import json as json_module
 
+    from rich.markdown import Markdown
+
     from macbot.skills import SkillsRegistry
 
     registry = SkillsRegistry()
@@ -2763,20 +3269,62 @@ TELEGRAM_LOG_FILE = MACBOT_DIR / "telegram.log"
 
 def _get_telegram_pid() -> int | None:
     """Get the PID of a running Telegram service, or None if not running."""
-    if not TELEGRAM_PID_FILE.exists():
-        return None
+    return _read_live_pid(TELEGRAM_PID_FILE)
+
+
+def _run_telegram_daemon() -> None:
+    """Body of the background Telegram service started by 'telegram start --daemon'."""
+    from macbot.core.agent import Agent
+    from macbot.telegram import TelegramService
+
+    _detach_cwd()
+
+    print(f"\n{'='*60}")
+    print(f"Son of Simon Telegram Service started at {datetime.now().isoformat()}")
+    print(f"PID: {os.getpid()}")
+    print(f"{'='*60}\n")
+
+    def handle_signal(signum, frame):
+        print(f"\nReceived signal {signum}, shutting down...")
+        TELEGRAM_PID_FILE.unlink(missing_ok=True)
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, handle_signal)
+    signal.signal(signal.SIGINT, handle_signal)
+
+    # Create service and run
+    service = TelegramService(
+        bot_token=settings.telegram_bot_token,
+        chat_id=settings.telegram_chat_id or None,
+        allowed_users=settings.telegram_allowed_users or None,
+    )
+
+    registry = _get_registry()
+    agent = Agent(registry)
+
+    async def message_handler(text: str, chat_id: str) -> str:
+        print(f"\n[{datetime.now().isoformat()}] Message from {chat_id}: {text[:50]}...")
+        try:
+            result = await agent.run(text, stream=False)
+            print(f"Response: {result[:100]}...")
+            return result
+        except Exception as e:
+            print(f"Error: {e}")
+            return f"Error: {e}"
+
+    service.set_message_handler(message_handler)
+
     try:
-        pid = int(TELEGRAM_PID_FILE.read_text().strip())
-        os.kill(pid, 0)
-        return pid
-    except (ValueError, ProcessLookupError, PermissionError):
+        _run_async(service.start(write_pid=False))
+    finally:
         TELEGRAM_PID_FILE.unlink(missing_ok=True)
-        return None
 
 
 def cmd_telegram_start(args: argparse.Namespace) -> None:
     """Start the Telegram service."""
+    from macbot.core.agent import Agent
     from macbot.telegram import TelegramService
+    from macbot.telegram.bot import validate_token
 
     if not settings.telegram_bot_token:
         console.print("[red]Error:[/red] MACBOT_TELEGRAM_BOT_TOKEN not set")
@@ -2784,6 +3332,11 @@ def cmd_telegram_start(args: argparse.Namespace) -> None:
         console.print("  2. Set the token: export MACBOT_TELEGRAM_BOT_TOKEN='your-token'")
         sys.exit(1)
 
+    # We are the detached process started by --daemon below
+    if args.daemon_child:
+        _run_telegram_daemon()
+        return
+
     # Check if already running
     existing_pid = _get_telegram_pid()
     if existing_pid and args.daemon:
@@ -2792,11 +3345,7 @@ def cmd_telegram_start(args: argparse.Namespace) -> None:
         sys.exit(1)
 
     # Validate token first
-    async def _validate() -> tuple[bool, str]:
-        from macbot.telegram.bot import validate_token
-        return await validate_token(settings.telegram_bot_token)
-
-    ok, msg = asyncio.run(_validate())
+    ok, msg = _run_async(validate_token(settings.telegram_bot_token))
     if not ok:
         console.print(f"[red]Invalid token:[/red] {msg}")
         sys.exit(1)
@@ -2813,57 +3362,13 @@ def cmd_telegram_start(args: argparse.Namespace) -> None:
         console.print(f"  Log: {TELEGRAM_LOG_FILE}")
         console.print("\nUse 'son telegram stop' to stop")
 
-        _daemonize()
-
-        # Update PID file location for telegram
-        TELEGRAM_PID_FILE.write_text(str(os.getpid()))
-
-        # Redirect to telegram log
-        log_fd = os.open(str(TELEGRAM_LOG_FILE), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
-        os.dup2(log_fd, sys.stdout.fileno())
-        os.dup2(log_fd, sys.stderr.fileno())
-        os.close(log_fd)
-
-        print(f"\n{'='*60}")
-        print(f"Son of Simon Telegram Service started at {datetime.now().isoformat()}")
-        print(f"PID: {os.getpid()}")
-        print(f"{'='*60}\n")
-
-        def handle_signal(signum, frame):
-            print(f"\nReceived signal {signum}, shutting down...")
-            TELEGRAM_PID_FILE.unlink(missing_ok=True)
-            sys.exit(0)
-
-        signal.signal(signal.SIGTERM, handle_signal)
-        signal.signal(signal.SIGINT, handle_signal)
-
-        # Create service and run
-        service = TelegramService(
-            bot_token=settings.telegram_bot_token,
-            chat_id=settings.telegram_chat_id or None,
-            allowed_users=settings.telegram_allowed_users or None,
+        _spawn_daemon(
+            ["telegram", "start", "--daemon-child"],
+            pid_file=TELEGRAM_PID_FILE,
+            log_file=TELEGRAM_LOG_FILE,
+            verbose=args.verbose,
         )
 
-        registry = create_default_registry()
-        agent = Agent(registry)
-
-        async def message_handler(text: str, chat_id: str) -> str:
-            print(f"\n[{datetime.now().isoformat()}] Message from {chat_id}: {text[:50]}...")
-            try:
-                result = await agent.run(text, stream=False)
-                print(f"Response: {result[:100]}...")
-                return result
-            except Exception as e:
-                print(f"Error: {e}")
-                return f"Error: {e}"
-
-        service.set_message_handler(message_handler)
-
-        try:
-            asyncio.run(service.start(write_pid=False))
-        finally:
-            TELEGRAM_PID_FILE.unlink(missing_ok=True)
-
     else:
         # Foreground mode
         console.print(f"\n[dim]Starting Telegram service (press Ctrl+C to stop)...[/dim]\n")
@@ -2874,7 +3379,7 @@ def cmd_telegram_start(args: argparse.Namespace) -> None:
             allowed_users=settings.telegram_allowed_users or None,
         )
 
-        registry = create_default_registry()
+        registry = _get_registry()
         agent = Agent(registry)
 
         async def message_handler(text: str, chat_id: str) -> str:
@@ -2890,7 +3395,7 @@ def cmd_telegram_start(args: argparse.Namespace) -> None:
         service.set_message_handler(message_handler)
 
         try:
-            asyncio.run(service.start())
+            _run_async(service.start())
         except KeyboardInterrupt:
             console.print("\n[dim]Telegram service stopped.[/dim]")
 
@@ -2907,12 +3412,11 @@ def cmd_telegram_stop(args: argparse.Namespace) -> None:
         os.kill(pid, signal.SIGTERM)
         console.print(f"[green]Sent stop signal to Telegram service[/green] (PID {pid})")
 
-        import time
-        for _ in range(10):
-            time.sleep(0.2)
-            if not _get_telegram_pid():
-                console.print("[green]Telegram service stopped[/green]")
-                return
+        if _wait_for_exit(pid):
+            # The service is gone, so drop its PID file if it left one behind
+            TELEGRAM_PID_FILE.unlink(missing_ok=True)
+            console.print("[green]Telegram service stopped[/green]")
+            return
 
         console.print("[yellow]Service may still be shutting down...[/yellow]")
     except ProcessLookupError:
@@ -2932,8 +3436,7 @@ def cmd_telegram_status(args: argparse.Namespace) -> None:
 
         if TELEGRAM_LOG_FILE.exists():
             console.print(f"\n[dim]Recent log entries:[/dim]")
-            lines = TELEGRAM_LOG_FILE.read_text().strip().split("\n")
-            for line in lines[-10:]:
+            for line in _tail(TELEGRAM_LOG_FILE, 10):
                 console.print(f"  {line}")
     else:
         console.print("[yellow]Telegram service is not running[/yellow]")
@@ -2941,8 +3444,7 @@ def cmd_telegram_status(args: argparse.Namespace) -> None:
     # Show configuration status
     console.print(f"\n[bold]Configuration:[/bold]")
     if settings.telegram_bot_token:
-        masked = settings.telegram_bot_token[:8] + "..." + settings.telegram_bot_token[-4:]
-        console.print(f"  Token: {masked}")
+        console.print(f"  Token: {_mask_secret(settings.telegram_bot_token)}")
     else:
         console.print(f"  Token: [red]Not set[/red]")
 
@@ -2977,7 +3479,7 @@ def cmd_telegram_send(args: argparse.Namespace) -> None:
         finally:
             await bot.close()
 
-    asyncio.run(_send())
+    _run_async(_send())
 
 
 def cmd_telegram_whoami(args: argparse.Namespace) -> None:
@@ -3022,11 +3524,40 @@ def cmd_telegram_whoami(args: argparse.Namespace) -> None:
             await bot.close()
 
     try:
-        asyncio.run(_whoami())
+        _run_async(_whoami())
     except KeyboardInterrupt:
         console.print("\n[dim]Stopped.[/dim]")
 
 
+async def _wait_for_chat_id(
+    bot: TelegramBot, timeout: float, offset: int | None = None
+) -> str | None:
+    """Wait for the next message to the bot and return its chat ID.
+
+    Uses Telegram's server-side long polling: each getUpdates call blocks
+    until a message arrives or the remaining time runs out, so a message is
+    picked up as soon as it is sent and an idle wait is a single request.
+
+    Args:
+        bot: Bot to poll
+        timeout: Seconds to wait in total
+        offset: First update ID to consider (skips older updates)
+
+    Returns:
+        The chat ID as a string, or None if no message arrived in time
+    """
+    import time
+
+    deadline = time.monotonic() + timeout
+    while (remaining := int(deadline - time.monotonic())) > 0:
+        updates = await bot.get_updates(offset=offset, timeout=remaining)
+        for update in updates:
+            offset = update.update_id + 1
+            if update.message:
+                return str(update.message.chat_id)
+    return None
+
+
 def cmd_telegram_detect_chat_id(args: argparse.Namespace) -> None:
     """Wait for a single Telegram message and print the chat ID.
 
@@ -3051,26 +3582,16 @@ def cmd_telegram_detect_chat_id(args: argparse.Namespace) -> None:
                 offset = updates[-1].update_id + 1
 
             # Now wait for a fresh message
-            import time
-            start = time.time()
-            while time.time() - start < timeout:
-                remaining = max(1, int(timeout - (time.time() - start)))
-                poll_timeout = min(remaining, 15)
-                updates = await bot.get_updates(offset=offset, timeout=poll_timeout)
-                for update in updates:
-                    offset = update.update_id + 1
-                    if update.message:
-                        await bot.close()
-                        return str(update.message.chat_id)
+            chat_id = await _wait_for_chat_id(bot, timeout, offset=offset)
             await bot.close()
-            return None
+            return chat_id
         except Exception as e:
             await bot.close()
             print(f"ERROR={e}")
             sys.exit(1)
 
     try:
-        chat_id = asyncio.run(_detect())
+        chat_id = _run_async(_detect())
         if chat_id:
             print(f"CHAT_ID={chat_id}")
         else:
@@ -3081,90 +3602,8 @@ def cmd_telegram_detect_chat_id(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
-def main() -> NoReturn:
-    """Main entry point for Son of Simon CLI."""
-    # Check for --help-all before argparse processes it
-    show_all_commands = "--help-all" in sys.argv
-
-    # Handle custom help output for clean display (only for top-level help)
-    is_top_level_help = (
-        ("-h" in sys.argv or "--help" in sys.argv) and
-        len([a for a in sys.argv[1:] if not a.startswith("-")]) == 0
-    ) or (show_all_commands and len(sys.argv) == 2)
-
-    if is_top_level_help:
-        if show_all_commands:
-            console.print(f"""[bold]son[/bold] v{__version__} - LLM-powered agent for macOS automation
-
-[bold]MAIN COMMANDS[/bold]
-  run          Run a goal or ask a question
-  start        Start the service (cron + telegram)
-  stop         Stop the service
-  status       Check service status
-  doctor       Check system prerequisites
-  onboard      Interactive setup wizard
-
-[bold]ADMIN COMMANDS[/bold]
-  chat         Interactive chat with the agent
-  task         Execute a task directly (no LLM)
-  tasks        List available tasks
-  skills       Manage agent skills
-  cron         Manage scheduled jobs
-  memory       Manage agent memory
-  telegram     Telegram bot commands
-  version      Show version information
-
-[bold]OPTIONS[/bold]
-  -v, --verbose    Show detailed output
-  --help-all       Show all commands
-
-[bold]EXAMPLES[/bold]
-  son run "Check my emails"           Run a goal
-  son start -d                        Start service as daemon
-  son cron import jobs.yaml           Import scheduled jobs
-  son telegram whoami                 Get your Telegram chat ID
-""")
-        else:
-            console.print(f"""[bold]son[/bold] v{__version__} - LLM-powered agent for macOS automation
-
-[bold]COMMANDS[/bold]
-  run          Run a goal or ask a question
-  start        Start the service (cron + telegram)
-  stop         Stop the service
-  status       Check service status
-  doctor       Check system prerequisites
-  onboard      Interactive setup wizard
-
-[bold]OPTIONS[/bold]
-  -v, --verbose    Show detailed output
-  --help-all       Show all commands including admin tools
-
-[bold]GETTING STARTED[/bold]
-  son onboard                         Setup wizard (recommended for new users)
-  son run "Check my emails"           Run a goal
-  son doctor                          Verify setup
-
-Use [bold]son --help-all[/bold] to see all commands.
-Use [bold]son <command> --help[/bold] for command details.
-""")
-        sys.exit(0)
-
-    parser = argparse.ArgumentParser(
-        prog="son",
-        description="Son of Simon - LLM-powered agent for macOS automation",
-        add_help=False,  # We handle help ourselves
-    )
-    parser.add_argument("-h", "--help", action="store_true", help="Show help")
-    parser.add_argument("-v", "--verbose", action="store_true", help="Show detailed output")
-    parser.add_argument("--help-all", action="store_true", help="Show all commands")
-
-    subparsers = parser.add_subparsers(dest="command")
-
-    # ==========================================================================
-    # MAIN COMMANDS (shown in default help)
-    # ==========================================================================
-
-    # Run command (single goal)
+def _add_run_parser(subparsers: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    """Register the 'run' command."""
     run_parser = subparsers.add_parser(
         "run",
         help="Run a goal or ask a question",
@@ -3206,8 +3645,11 @@ Use [bold]son <command> --help[/bold] for command details.
         help="Read multiline prompt from stdin (end with Ctrl+D)"
     )
     run_parser.set_defaults(func=cmd_run)
+    return run_parser
+
 
-    # Start command (unified service)
+def _add_start_parser(subparsers: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    """Register the 'start' command."""
     start_parser = subparsers.add_parser(
         "start",
         help="Start the Son of Simon service (cron + telegram)",
@@ -3227,8 +3669,11 @@ Use [bold]son <command> --help[/bold] for command details.
         help="Show detailed output"
     )
     start_parser.set_defaults(func=cmd_start)
+    return start_parser
 
-    # Connect command
+
+def _add_connect_parser(subparsers: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    """Register the 'connect' command."""
     connect_parser = subparsers.add_parser(
         "connect",
         help="Connect to a running service's shared agent",
@@ -3237,24 +3682,33 @@ Use [bold]son <command> --help[/bold] for command details.
                     "and Telegram."
     )
     connect_parser.set_defaults(func=cmd_connect)
+    return connect_parser
+
 
-    # Stop command
+def _add_stop_parser(subparsers: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    """Register the 'stop' command."""
     stop_parser = subparsers.add_parser(
         "stop",
         help="Stop the service",
         description="Stop the running service daemon."
     )
     stop_parser.set_defaults(func=cmd_stop)
+    return stop_parser
 
-    # Status command
+
+def _add_status_parser(subparsers: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    """Register the 'status' command."""
     status_parser = subparsers.add_parser(
         "status",
         help="Check service status",
         description="Show the status of the service, cron jobs, and Telegram."
     )
     status_parser.set_defaults(func=cmd_status)
+    return status_parser
+
 
-    # Doctor command
+def _add_doctor_parser(subparsers: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    """Register the 'doctor' command."""
     doctor_parser = subparsers.add_parser(
         "doctor",
         help="Check system prerequisites and configuration",
@@ -3266,8 +3720,11 @@ Use [bold]son <command> --help[/bold] for command details.
         help="Output results as JSON (for programmatic use)"
     )
     doctor_parser.set_defaults(func=cmd_doctor)
+    return doctor_parser
 
-    # Onboard command
+
+def _add_onboard_parser(subparsers: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    """Register the 'onboard' command."""
     onboard_parser = subparsers.add_parser(
         "onboard",
         help="Interactive setup wizard for new users",
@@ -3275,12 +3732,11 @@ Use [bold]son <command> --help[/bold] for command details.
                     "grant macOS permissions, set up Telegram, and verify everything works."
     )
     onboard_parser.set_defaults(func=cmd_onboard)
+    return onboard_parser
 
-    # ==========================================================================
-    # ADMIN COMMANDS (hidden from default help, shown with --help-all)
-    # ==========================================================================
 
-    # Chat command (interactive mode)
+def _add_chat_parser(subparsers: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    """Register the 'chat' command (interactive mode)."""
     chat_parser = subparsers.add_parser(
         "chat",
         help=argparse.SUPPRESS,  # Admin command
@@ -3296,8 +3752,11 @@ Use [bold]son <command> --help[/bold] for command details.
         help="Use JSON-lines protocol over stdin/stdout (for app integration)"
     )
     chat_parser.set_defaults(func=cmd_chat)
+    return chat_parser
+
 
-    # Task command (direct execution)
+def _add_task_parser(subparsers: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    """Register the 'task' command (direct execution)."""
     task_parser = subparsers.add_parser(
         "task",
         help=argparse.SUPPRESS,  # Admin command
@@ -3318,23 +3777,32 @@ Use [bold]son <command> --help[/bold] for command details.
         help="Show detailed output"
     )
     task_parser.set_defaults(func=cmd_task)
+    return task_parser
 
-    # Tasks command (list tasks)
+
+def _add_tasks_parser(subparsers: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    """Register the 'tasks' command (list tasks)."""
     tasks_parser = subparsers.add_parser(
         "tasks",
         help=argparse.SUPPRESS,  # Admin command
         description="Show all tasks (tools) the agent can use."
     )
     tasks_parser.set_defaults(func=cmd_tasks)
+    return tasks_parser
+
 
-    # Also allow 'list' as alias for 'tasks'
+def _add_list_parser(subparsers: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    """Register 'list' as an alias for 'tasks'."""
     list_parser = subparsers.add_parser(
         "list",
         help=argparse.SUPPRESS  # Always hidden (it's just an alias)
     )
     list_parser.set_defaults(func=cmd_tasks)
+    return list_parser
 
-    # Schedule command group (legacy, hidden)
+
+def _add_schedule_parser(subparsers: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    """Register the 'schedule' command group (legacy, hidden)."""
     schedule_parser = subparsers.add_parser(
         "schedule",
         help=argparse.SUPPRESS,  # Hidden - use 'start' instead
@@ -3366,6 +3834,10 @@ Use [bold]son <command> --help[/bold] for command details.
         "-b", "--background", action="store_true",
         help="Run in background as a daemon"
     )
+    schedule_parser.add_argument(
+        "--daemon-child", action="store_true",
+        help=argparse.SUPPRESS  # Set on the process started by --background
+    )
     schedule_parser.set_defaults(func=cmd_schedule)
 
     # schedule status
@@ -3396,15 +3868,21 @@ Use [bold]son <command> --help[/bold] for command details.
         help="Number of lines to show (default: 50)"
     )
     schedule_log.set_defaults(func=cmd_schedule_log)
+    return schedule_parser
+
 
-    # Version command
+def _add_version_parser(subparsers: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    """Register the 'version' command."""
     version_parser = subparsers.add_parser(
         "version",
         help=argparse.SUPPRESS  # Admin command
     )
     version_parser.set_defaults(func=cmd_version)
+    return version_parser
 
-    # Cron command group
+
+def _add_cron_parser(subparsers: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    """Register the 'cron' command group."""
     cron_parser = subparsers.add_parser(
         "cron",
         help=argparse.SUPPRESS,  # Admin command
@@ -3490,6 +3968,10 @@ Use [bold]son <command> --help[/bold] for command details.
         "-b", "--background", action="store_true",
         help="Run in background as a daemon"
     )
+    cron_start.add_argument(
+        "--daemon-child", action="store_true",
+        help=argparse.SUPPRESS  # Set on the process started by --background
+    )
     cron_start.set_defaults(func=cmd_cron_start)
 
     # cron stop
@@ -3509,8 +3991,11 @@ Use [bold]son <command> --help[/bold] for command details.
         help="Skip confirmation"
     )
     cron_clear.set_defaults(func=cmd_cron_clear)
+    return cron_parser
+
 
-    # Memory command group
+def _add_memory_parser(subparsers: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    """Register the 'memory' command group."""
     memory_parser = subparsers.add_parser(
         "memory",
         help=argparse.SUPPRESS,  # Admin command
@@ -3571,8 +4056,11 @@ Example:
         help="Skip confirmation"
     )
     memory_clear.set_defaults(func=cmd_memory_clear)
+    return memory_parser
 
-    # Skills command group
+
+def _add_skills_parser(subparsers: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    """Register the 'skills' command group."""
     skills_parser = subparsers.add_parser(
         "skills",
         help=argparse.SUPPRESS,  # Admin command
@@ -3668,8 +4156,11 @@ Examples:
                     "Use this after creating or modifying skills."
     )
     skills_reload.set_defaults(func=cmd_skills_reload)
+    return skills_parser
+
 
-    # Telegram command group
+def _add_telegram_parser(subparsers: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    """Register the 'telegram' command group."""
     telegram_parser = subparsers.add_parser(
         "telegram",
         help=argparse.SUPPRESS,  # Admin command
@@ -3700,6 +4191,10 @@ Examples:
         "-d", "--daemon", action="store_true",
         help="Run in background as a daemon"
     )
+    telegram_start.add_argument(
+        "--daemon-child", action="store_true",
+        help=argparse.SUPPRESS  # Set on the process started by --daemon
+    )
     telegram_start.set_defaults(func=cmd_telegram_start)
 
     # telegram stop
@@ -3752,13 +4247,147 @@ Examples:
         help="Seconds to wait for a message (default: 60)"
     )
     telegram_detect.set_defaults(func=cmd_telegram_detect_chat_id)
+    return telegram_parser
+
+
+# Parser builders by command name. Main commands come first; the rest are
+# admin commands hidden from the default help (shown with --help-all).
+_COMMAND_PARSERS: dict[str, Callable[[argparse._SubParsersAction], argparse.ArgumentParser]] = {
+    "run": _add_run_parser,
+    "start": _add_start_parser,
+    "connect": _add_connect_parser,
+    "stop": _add_stop_parser,
+    "status": _add_status_parser,
+    "doctor": _add_doctor_parser,
+    "onboard": _add_onboard_parser,
+    "chat": _add_chat_parser,
+    "task": _add_task_parser,
+    "tasks": _add_tasks_parser,
+    "list": _add_list_parser,
+    "schedule": _add_schedule_parser,
+    "version": _add_version_parser,
+    "cron": _add_cron_parser,
+    "memory": _add_memory_parser,
+    "skills": _add_skills_parser,
+    "telegram": _add_telegram_parser,
+}
+
+
+# Argument-less invocations dispatched straight from argv, with the defaults
+# their parsers would produce
+_FAST_COMMANDS: dict[tuple[str, ...], Callable[[], None]] = {
+    ("version",): lambda: cmd_version(argparse.Namespace(
+        help=False, verbose=False, help_all=False, command="version",
+    )),
+    ("doctor",): lambda: cmd_doctor(argparse.Namespace(
+        help=False, verbose=False, help_all=False, command="doctor", json=False,
+    )),
+}
+
+
+def main() -> NoReturn:
+    """Main entry point for Son of Simon CLI."""
+    # Quick diagnostics commands without options skip argparse entirely
+    fast_path = _FAST_COMMANDS.get(tuple(sys.argv[1:]))
+    if fast_path is not None:
+        setup_logging(False)
+        fast_path()
+        sys.exit(0)
+
+    # Check for --help-all before argparse processes it
+    show_all_commands = "--help-all" in sys.argv
+
+    # Handle custom help output for clean display (only for top-level help)
+    is_top_level_help = (
+        ("-h" in sys.argv or "--help" in sys.argv) and
+        len([a for a in sys.argv[1:] if not a.startswith("-")]) == 0
+    ) or (show_all_commands and len(sys.argv) == 2)
+
+    if is_top_level_help:
+        if show_all_commands:
+            console.print(f"""[bold]son[/bold] v{__version__} - LLM-powered agent for macOS automation
+
+[bold]MAIN COMMANDS[/bold]
+  run          Run a goal or ask a question
+  start        Start the service (cron + telegram)
+  stop         Stop the service
+  status       Check service status
+  doctor       Check system prerequisites
+  onboard      Interactive setup wizard
+
+[bold]ADMIN COMMANDS[/bold]
+  chat         Interactive chat with the agent
+  task         Execute a task directly (no LLM)
+  tasks        List available tasks
+  skills       Manage agent skills
+  cron         Manage scheduled jobs
+  memory       Manage agent memory
+  telegram     Telegram bot commands
+  version      Show version information
+
+[bold]OPTIONS[/bold]
+  -v, --verbose    Show detailed output
+  --help-all       Show all commands
+
+[bold]EXAMPLES[/bold]
+  son run "Check my emails"           Run a goal
+  son start -d                        Start service as daemon
+  son cron import jobs.yaml           Import scheduled jobs
+  son telegram whoami                 Get your Telegram chat ID
+""")
+        else:
+            console.print(f"""[bold]son[/bold] v{__version__} - LLM-powered agent for macOS automation
+
+[bold]COMMANDS[/bold]
+  run          Run a goal or ask a question
+  start        Start the service (cron + telegram)
+  stop         Stop the service
+  status       Check service status
+  doctor       Check system prerequisites
+  onboard      Interactive setup wizard
+
+[bold]OPTIONS[/bold]
+  -v, --verbose    Show detailed output
+  --help-all       Show all commands including admin tools
+
+[bold]GETTING STARTED[/bold]
+  son onboard                         Setup wizard (recommended for new users)
+  son run "Check my emails"           Run a goal
+  son doctor                          Verify setup
+
+Use [bold]son --help-all[/bold] to see all commands.
+Use [bold]son <command> --help[/bold] for command details.
+""")
+        sys.exit(0)
+
+    parser = argparse.ArgumentParser(
+        prog="son",
+        description="Son of Simon - LLM-powered agent for macOS automation",
+        add_help=False,  # We handle help ourselves
+    )
+    parser.add_argument("-h", "--help", action="store_true", help="Show help")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Show detailed output")
+    parser.add_argument("--help-all", action="store_true", help="Show all commands")
+
+    subparsers = parser.add_subparsers(dest="command")
+
+    # Only build the parser for the requested command. Everything is built
+    # when the command is unknown so argparse can list the valid choices.
+    command = next((a for a in sys.argv[1:] if not a.startswith("-")), None)
+    if command is None:
+        builders = {}
+    elif command in _COMMAND_PARSERS:
+        builders = {command: _COMMAND_PARSERS[command]}
+    else:
+        builders = _COMMAND_PARSERS
+    command_parsers = {name: build(subparsers) for name, build in builders.items()}
 
     args = parser.parse_args()
     setup_logging(args.verbose)
 
     # No command given - show welcome
     if args.command is None:
-        console.print(Markdown(WELCOME_TEXT))
+        console.print(WELCOME_TEXT)
         sys.exit(0)
 
     # Handle schedule subcommands
@@ -3768,7 +4397,7 @@ Examples:
             args.func(args)
         elif not args.goal and not args.task:
             # No subcommand and no --goal/--task: show help
-            schedule_parser.print_help()
+            command_parsers["schedule"].print_help()
             sys.exit(0)
         else:
             # Has --goal or --task: run the scheduler
@@ -3777,12 +4406,12 @@ Examples:
 
     # Handle cron subcommands
     if args.command == "cron" and args.cron_command is None:
-        cron_parser.print_help()
+        command_parsers["cron"].print_help()
         sys.exit(0)
 
     # Handle memory subcommands
     if args.command == "memory" and args.memory_command is None:
-        memory_parser.print_help()
+        command_parsers["memory"].print_help()
         sys.exit(0)
 
     # Handle skills subcommands - default to list when no subcommand
@@ -3793,7 +4422,7 @@ Examples:
 
     # Handle telegram subcommands
     if args.command == "telegram" and args.telegram_command is None:
-        telegram_parser.print_help()
+        command_parsers["telegram"].print_help()
         sys.exit(0)
 
     args.func(args)
@@ -1,15 +1,37 @@
 """Core components for the agent loop."""
 
-from macbot.core.agent import Agent
-from macbot.core.command_queue import CommandLane, CommandQueue, LaneState, QueueEntry
-from macbot.core.followup_queue import (
-    DropPolicy,
-    FollowupItem,
-    FollowupQueue,
-    QueueMode,
-)
-from macbot.core.scheduler import TaskScheduler
-from macbot.core.task import Task, TaskRegistry
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from macbot.core.agent import Agent
+    from macbot.core.command_queue import CommandLane, CommandQueue, LaneState, QueueEntry
+    from macbot.core.followup_queue import (
+        DropPolicy,
+        FollowupItem,
+        FollowupQueue,
+        QueueMode,
+    )
+    from macbot.core.scheduler import TaskScheduler
+    from macbot.core.task import Task, TaskRegistry
+
+# Exported name -> defining submodule. Submodules are imported on first
+# attribute access so that importing e.g. macbot.core.preferences does not
+# load the agent and its LLM provider SDKs.
+_EXPORTS = {
+    "Agent": "macbot.core.agent",
+    "TaskScheduler": "macbot.core.scheduler",
+    "Task": "macbot.core.task",
+    "TaskRegistry": "macbot.core.task",
+    "CommandQueue": "macbot.core.command_queue",
+    "CommandLane": "macbot.core.command_queue",
+    "QueueEntry": "macbot.core.command_queue",
+    "LaneState": "macbot.core.command_queue",
+    "FollowupQueue": "macbot.core.followup_queue",
+    "FollowupItem": "macbot.core.followup_queue",
+    "QueueMode": "macbot.core.followup_queue",
+    "DropPolicy": "macbot.core.followup_queue",
+}
 
 __all__ = [
     # Agent
@@ -30,3 +52,12 @@ __all__ = [
     "QueueMode",
     "DropPolicy",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
@@ -11,6 +11,8 @@ from typing import Any
 
 import yaml
 
+from macbot.utils.yamlio import yaml_safe_load
+
 DEFAULT_PREFERENCES: dict[str, Any] = {
     "directories": {
         "temp": "/tmp",
@@ -49,7 +51,7 @@ class CorePreferences:
 
         if self.path.exists():
             with open(self.path) as f:
-                self._data = yaml.safe_load(f) or {}
+                self._data = yaml_safe_load(f) or {}
         else:
             self._data = {}
 
@@ -4,8 +4,10 @@ This module handles computing the next run time for different
 schedule types (at, every, cron expression).
 """
 
+import copy
 import logging
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 from croniter import croniter
@@ -15,6 +17,18 @@ from macbot.cron.types import CronSchedule, ScheduleKind
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _parse_cron(expr: str) -> croniter:
+    """Parse a cron expression once per process.
+
+    The returned iterator is shared, so callers must copy it before moving it.
+
+    Raises:
+        ValueError: If the expression is invalid (croniter's errors subclass it)
+    """
+    return croniter(expr)
+
+
 def compute_next_run(
     schedule: CronSchedule,
     last_run: datetime | None = None,
@@ -131,8 +145,9 @@ def _compute_cron_next_run(
         # Convert now to the schedule's timezone
         now_tz = now.astimezone(tz) if now.tzinfo else now.replace(tzinfo=tz)
 
-        # Create croniter and get next run
-        cron = croniter(schedule.cron_expr, now_tz)
+        # Start a copy of the parsed expression at now and get next run
+        cron = copy.copy(_parse_cron(schedule.cron_expr))
+        cron.set_current(now_tz)
         next_run = cron.get_next(datetime)
 
         # Convert back to UTC
@@ -153,7 +168,7 @@ def validate_cron_expression(expr: str) -> bool:
         True if the expression is valid.
     """
     try:
-        croniter(expr)
+        _parse_cron(expr)
         return True
     except Exception:
         return False
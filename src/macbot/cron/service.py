@@ -105,20 +105,19 @@ class CronService:
         """
         return f"job_{uuid.uuid4().hex[:12]}"
 
-    def create_job(self, create: CronJobCreate) -> CronJob:
-        """Create a new cron job.
+    def _build_job(self, create: CronJobCreate) -> CronJob:
+        """Build a new job with a fresh ID and its initial next run.
 
         Args:
             create: Job creation parameters.
 
         Returns:
-            The created job.
+            The new, not yet stored job.
         """
-        job_id = self._generate_id()
         now = datetime.now(timezone.utc)
 
         job = CronJob(
-            id=job_id,
+            id=self._generate_id(),
             name=create.name,
             description=create.description,
             enabled=create.enabled,
@@ -133,12 +132,43 @@ class CronService:
         if job.enabled:
             job.state.next_run_at = compute_next_run(job.schedule)
 
+        return job
+
+    def create_job(self, create: CronJobCreate) -> CronJob:
+        """Create a new cron job.
+
+        Args:
+            create: Job creation parameters.
+
+        Returns:
+            The created job.
+        """
+        job = self._build_job(create)
+
         self._jobs[job.id] = job
         self._storage.add(job)
 
         logger.info(f"Created cron job: {job.name} ({job.id})")
         return job
 
+    def create_jobs(self, creates: list[CronJobCreate]) -> list[CronJob]:
+        """Create several cron jobs with a single storage write.
+
+        Args:
+            creates: Job creation parameters, one per job.
+
+        Returns:
+            The created jobs, in the same order.
+        """
+        jobs = [self._build_job(create) for create in creates]
+
+        self._storage.add_many(jobs)
+        for job in jobs:
+            self._jobs[job.id] = job
+
+        logger.info(f"Created {len(jobs)} cron jobs")
+        return jobs
+
     def get_job(self, job_id: str) -> CronJob | None:
         """Get a job by ID.
 
@@ -158,6 +188,14 @@ class CronService:
         """
         return list(self._jobs.values())
 
+    def list_enabled_jobs(self) -> list[CronJob]:
+        """List enabled jobs.
+
+        Returns:
+            List of jobs that are enabled.
+        """
+        return [job for job in self._jobs.values() if job.enabled]
+
     def update_job(self, job_id: str, update: CronJobUpdate) -> CronJob | None:
         """Update a job.
 
@@ -215,6 +253,19 @@ class CronService:
         logger.info(f"Deleted cron job: {job.name} ({job_id})")
         return True
 
+    def clear_jobs(self) -> int:
+        """Delete all jobs with a single storage write.
+
+        Returns:
+            Number of jobs deleted.
+        """
+        count = len(self._jobs)
+        self._jobs.clear()
+        self._storage.clear()
+
+        logger.info(f"Cleared {count} cron jobs")
+        return count
+
     def enable_job(self, job_id: str) -> bool:
         """Enable a job.
 
@@ -4,7 +4,6 @@ This module handles loading and saving cron jobs to a JSON file,
 with file locking for concurrent access safety.
 """
 
-import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
@@ -14,6 +13,7 @@ from filelock import FileLock
 from pydantic import BaseModel, Field
 
 from macbot.cron.types import CronJob
+from macbot.utils.jsonio import json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -89,11 +89,11 @@ class CronStorage:
         """
         self._ensure_file_exists()
 
-        content = self._path.read_text(encoding="utf-8")
+        content = self._path.read_bytes()
         if not content.strip():
             return CronStorageData()
 
-        data = json.loads(content)
+        data = json_loads(content)
 
         # Handle version migrations if needed
         version = data.get("version", 1)
@@ -113,8 +113,7 @@ class CronStorage:
         # Convert to dict with datetime serialization
         json_data = data.model_dump(mode="json")
 
-        content = json.dumps(json_data, indent=2, default=self._json_serializer)
-        self._path.write_text(content, encoding="utf-8")
+        self._path.write_bytes(json_dumps(json_data, indent=True, default=self._json_serializer))
 
     def _json_serializer(self, obj: Any) -> Any:
         """Custom JSON serializer for datetime objects.
@@ -202,6 +201,29 @@ class CronStorage:
             self._write_data(data)
             logger.info(f"Added cron job: {job.name} ({job.id})")
 
+    def add_many(self, jobs: list[CronJob]) -> None:
+        """Add several new jobs to storage in one write.
+
+        Args:
+            jobs: The jobs to add.
+
+        Raises:
+            ValueError: If a job ID already exists or appears twice.
+        """
+        with self._lock:
+            data = self._read_data()
+
+            # Check for duplicate IDs
+            ids = {existing.id for existing in data.jobs}
+            for job in jobs:
+                if job.id in ids:
+                    raise ValueError(f"Job with ID '{job.id}' already exists")
+                ids.add(job.id)
+
+            data.jobs.extend(jobs)
+            self._write_data(data)
+            logger.info(f"Added {len(jobs)} cron jobs")
+
     def update(self, job: CronJob) -> bool:
         """Update an existing job.
 
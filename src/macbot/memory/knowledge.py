@@ -11,6 +11,8 @@ from typing import Any
 
 import yaml
 
+from macbot.utils.yamlio import yaml_safe_load
+
 
 class KnowledgeMemory:
     """Persistent agent knowledge memory stored in YAML format."""
@@ -35,7 +37,7 @@ class KnowledgeMemory:
 
         if self.path.exists():
             with open(self.path) as f:
-                self._data = yaml.safe_load(f) or {}
+                self._data = yaml_safe_load(f) or {}
         else:
             self._data = {}
 
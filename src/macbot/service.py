@@ -19,6 +19,7 @@ from macbot.config import settings
 from macbot.core.agent import Agent
 from macbot.cron import CronPayload, CronService
 from macbot.tasks import create_default_registry
+from macbot.utils.eventloop import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -1092,10 +1093,10 @@ def run_service(daemon: bool = False, verbose: bool = False, foreground: bool =
 
             try:
                 # Enable stdin reader so GUI can send queries via JSON-lines
-                asyncio.run(service.start(interactive=False, stdin_reader=True))
+                run_async(service.start(interactive=False, stdin_reader=True))
             except KeyboardInterrupt:
                 stderr_console.print("\n[dim]Stopping...[/dim]")
-                asyncio.run(service.stop())
+                run_async(service.stop())
             finally:
                 PID_FILE.unlink(missing_ok=True)
             stderr_console.print("[dim]Service stopped.[/dim]")
@@ -1112,10 +1113,10 @@ def run_service(daemon: bool = False, verbose: bool = False, foreground: bool =
                 )
 
             try:
-                asyncio.run(service.start(interactive=True))
+                run_async(service.start(interactive=True))
             except KeyboardInterrupt:
                 console.print("\n[dim]Stopping...[/dim]")
-                asyncio.run(service.stop())
+                run_async(service.stop())
                 # Close stdin to unblock any thread still waiting on console.input()
                 import sys
                 try:
@@ -1190,7 +1191,7 @@ def _run_daemon_service() -> None:
     service = MacbotService()
 
     try:
-        asyncio.run(service.start())
+        run_async(service.start())
     except Exception as e:
         print(f"Service error: {e}")
     finally:
@@ -8,6 +8,7 @@ from typing import Any
 import yaml
 
 from macbot.skills.models import Skill
+from macbot.utils.yamlio import yaml_safe_load
 
 logger = logging.getLogger(__name__)
 
@@ -48,7 +49,7 @@ def parse_frontmatter(content: str) -> tuple[dict[str, Any], str]:
     body = match.group(2) or ""
 
     try:
-        frontmatter = yaml.safe_load(yaml_content)
+        frontmatter = yaml_safe_load(yaml_content)
         if not isinstance(frontmatter, dict):
             raise ValueError("Frontmatter must be a YAML dictionary")
         return frontmatter, body.strip()
@@ -113,7 +113,11 @@ class BrowserSnapshotTask(Task):
         )
 
     async def execute(
-        self, interactive_only: bool = True, max_elements: int = 200, inject: bool = False
+        self,
+        interactive_only: bool = True,
+        max_elements: int = 200,
+        inject: bool = False,
+        start_ref: int = 1,
     ) -> dict[str, Any]:
         """Get ARIA snapshot.
 
@@ -121,6 +125,7 @@ class BrowserSnapshotTask(Task):
             interactive_only: Only show interactive elements (default: True).
             max_elements: Maximum number of elements to include.
             inject: Re-inject the ARIA library (use if page changed without navigate).
+            start_ref: First ref number to show; use to page through a truncated snapshot.
 
         Returns:
             Dictionary with snapshot text showing elements and their refs.
@@ -131,6 +136,7 @@ class BrowserSnapshotTask(Task):
                 interactive_only=interactive_only,
                 max_elements=max_elements,
                 inject=inject,
+                start_ref=start_ref,
             )
             return {
                 "success": True,
@@ -139,6 +145,7 @@ class BrowserSnapshotTask(Task):
                 "title": snapshot.title,
                 "element_count": len(snapshot.refs),
                 "stats": snapshot.stats,
+                "truncated": snapshot.truncated,
             }
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -38,6 +38,8 @@ class TaskRegistry:
     def __init__(self) -> None:
         """Initialize an empty task registry."""
         self._tasks: dict[str, Task] = {}
+        # Tasks ordered by name, built on demand and reset on (un)registration
+        self._sorted: tuple[Task, ...] | None = None
 
     def register(self, task: Task) -> None:
         """Register a task instance.
@@ -51,6 +53,7 @@ class TaskRegistry:
         if task.name in self._tasks:
             raise ValueError(f"Task '{task.name}' is already registered")
         self._tasks[task.name] = task
+        self._sorted = None
         logger.debug(f"Registered task: {task.name}")
 
     def register_function(
@@ -106,6 +109,7 @@ class TaskRegistry:
         """
         if name in self._tasks:
             del self._tasks[name]
+            self._sorted = None
             logger.debug(f"Unregistered task: {name}")
             return True
         return False
@@ -140,6 +144,18 @@ class TaskRegistry:
         """
         return list(self._tasks.values())
 
+    def sorted_tasks(self) -> tuple[Task, ...]:
+        """Get all registered tasks ordered by name.
+
+        The ordering is computed once and reused until the registry changes.
+
+        Returns:
+            Tuple of tasks sorted by name.
+        """
+        if self._sorted is None:
+            self._sorted = tuple(self._tasks[name] for name in sorted(self._tasks))
+        return self._sorted
+
     def list_names(self) -> list[str]:
         """Get names of all registered tasks.
 
@@ -169,11 +169,13 @@ class TelegramBot:
         await self._bot.shutdown()
 
 
-async def validate_token(token: str) -> tuple[bool, str]:
+async def validate_token(token: str, bot: TelegramBot | None = None) -> tuple[bool, str]:
     """Validate a Telegram bot token by calling getMe.
 
     Args:
         token: Telegram bot token to validate
+        bot: Bot for this token to check with, so its connection can be
+            reused afterwards (left open). A temporary bot is used otherwise.
 
     Returns:
         Tuple of (success, message) where message is either
@@ -183,9 +185,12 @@ async def validate_token(token: str) -> tuple[bool, str]:
         return False, "Invalid token format (expected 'ID:SECRET')"
 
     try:
-        bot = TelegramBot(token)
-        info = await bot.get_me()
-        await bot.close()
+        if bot is None:
+            bot = TelegramBot(token)
+            info = await bot.get_me()
+            await bot.close()
+        else:
+            info = await bot.get_me()
         return True, f"@{info['username']}"
     except TelegramError as e:
         return False, f"API error: {e.message}"
@@ -1,5 +1,14 @@
 """Utility modules for MacBot."""
 
 from macbot.utils.cancellable import run_with_escape_cancel
+from macbot.utils.eventloop import run_async
+from macbot.utils.jsonio import json_dumps, json_loads
+from macbot.utils.yamlio import yaml_safe_load
 
-__all__ = ["run_with_escape_cancel"]
+__all__ = [
+    "json_dumps",
+    "json_loads",
+    "run_async",
+    "run_with_escape_cancel",
+    "yaml_safe_load",
+]
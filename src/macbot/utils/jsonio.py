@@ -0,0 +1,34 @@
+"""JSON encoding and decoding, on orjson when it is installed."""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+
+def json_dumps(
+    obj: Any, indent: bool = False, default: Callable[[Any], Any] | None = None
+) -> bytes:
+    """Serialize to UTF-8 JSON bytes, compact unless ``indent`` is set.
+
+    orjson is part of the optional ``fast`` extra; without it this is
+    ``json.dumps``. Indented output uses two spaces either way.
+    """
+    try:
+        import orjson
+    except ImportError:
+        if indent:
+            return json.dumps(obj, indent=2, default=default).encode()
+        return json.dumps(obj, separators=(",", ":"), default=default).encode()
+    return orjson.dumps(obj, default=default, option=orjson.OPT_INDENT_2 if indent else None)
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Parse JSON from bytes or text, with orjson when it is installed.
+
+    Both parsers raise ``json.JSONDecodeError`` (or a subclass) on bad input.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(data)
+    return orjson.loads(data)
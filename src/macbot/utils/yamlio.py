@@ -0,0 +1,14 @@
+"""YAML parsing with the fastest safe loader available."""
+
+from typing import Any
+
+
+def yaml_safe_load(stream: Any) -> Any:
+    """Parse YAML like ``yaml.safe_load``, on libyaml when PyYAML was built with it.
+
+    The C loader is several times faster, which matters for files read on
+    every start (jobs, skills, preferences, knowledge).
+    """
+    import yaml
+
+    return yaml.load(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
@@ -0,0 +1,1065 @@
+"""Tests for CLI helpers."""
+
+import argparse
+import asyncio
+import io
+import json
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import yaml
+
+from macbot import cli
+from macbot.utils.yamlio import yaml_safe_load
+
+
+@pytest.fixture(autouse=True)
+def clear_jobs_cache():
+    cli._JOBS_CACHE.clear()
+    yield
+    cli._JOBS_CACHE.clear()
+
+
+def write_jobs(path, *jobs):
+    lines = ["jobs:"]
+    for name, goal in jobs:
+        lines.append(f"  - name: {name}")
+        lines.append(f"    goal: {goal}")
+    path.write_text("\n".join(lines) + "\n")
+
+
+class TestLoadJobsFromFile:
+    """Tests for load_jobs_from_file."""
+
+    def test_missing_file(self, tmp_path):
+        """A missing jobs file yields no jobs."""
+        assert cli.load_jobs_from_file(tmp_path / "jobs.yaml") == {}
+
+    def test_names_are_lowercased(self, tmp_path):
+        """Job names are keyed case-insensitively."""
+        jobs_file = tmp_path / "jobs.yaml"
+        write_jobs(jobs_file, ("Morning", "Check my emails"))
+
+        assert cli.load_jobs_from_file(jobs_file) == {"morning": "Check my emails"}
+        assert cli.find_job_goal("MORNING", jobs_file) == "Check my emails"
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path, monkeypatch):
+        """A second load of an unchanged file is served from the cache."""
+        jobs_file = tmp_path / "jobs.yaml"
+        write_jobs(jobs_file, ("morning", "Check my emails"))
+        cli.load_jobs_from_file(jobs_file)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("jobs file was parsed again")
+
+        monkeypatch.setattr(yaml, "load", fail)
+        assert cli.load_jobs_from_file(jobs_file) == {"morning": "Check my emails"}
+
+    def test_modified_file_is_reparsed(self, tmp_path):
+        """Changing the file invalidates the cached jobs."""
+        jobs_file = tmp_path / "jobs.yaml"
+        write_jobs(jobs_file, ("morning", "Check my emails"))
+        cli.load_jobs_from_file(jobs_file)
+
+        write_jobs(jobs_file, ("evening", "Summarize my day"))
+        st = jobs_file.stat()
+        os.utime(jobs_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert cli.load_jobs_from_file(jobs_file) == {"evening": "Summarize my day"}
+
+    def test_non_ascii_goals(self, tmp_path):
+        jobs_file = tmp_path / "jobs.yaml"
+        write_jobs(jobs_file, ("Kaffee", "Bestelle Café für Zoë"))
+
+        assert cli.load_jobs_from_file(jobs_file) == {"kaffee": "Bestelle Café für Zoë"}
+
+    def test_cache_is_bounded(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(cli, "_JOBS_CACHE_SIZE", 2)
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"jobs{i}.yaml"
+            write_jobs(path, (f"job{i}", "goal"))
+            paths.append(path)
+
+        cli.load_jobs_from_file(paths[0])
+        cli.load_jobs_from_file(paths[1])
+        cli.load_jobs_from_file(paths[0])  # Now the most recently used
+        cli.load_jobs_from_file(paths[2])
+
+        assert list(cli._JOBS_CACHE) == [paths[0], paths[2]]
+
+    def test_sidecar_written_and_used(self, tmp_path, monkeypatch):
+        """Parsed jobs are saved as JSON and loaded from there next time."""
+        jobs_file = tmp_path / "jobs.yaml"
+        write_jobs(jobs_file, ("morning", "Check my emails"))
+        cli.load_jobs_from_file(jobs_file)
+
+        sidecar = tmp_path / ".jobs.cache.json"
+        assert json.loads(sidecar.read_text())["jobs"] == {"morning": "Check my emails"}
+
+        cli._JOBS_CACHE.clear()
+        monkeypatch.setattr(yaml, "load", lambda *a, **kw: pytest.fail("YAML parsed"))
+        assert cli.load_jobs_from_file(jobs_file) == {"morning": "Check my emails"}
+
+    def test_user_jobs_json_is_left_alone(self, tmp_path):
+        """The sidecar doesn't clobber an unrelated jobs.json next to jobs.yaml."""
+        jobs_file = tmp_path / "jobs.yaml"
+        write_jobs(jobs_file, ("morning", "Check my emails"))
+        user_file = tmp_path / "jobs.json"
+        user_file.write_text('{"mine": true}')
+
+        assert cli.load_jobs_from_file(jobs_file) == {"morning": "Check my emails"}
+        assert user_file.read_text() == '{"mine": true}'
+
+    def test_sidecar_without_orjson(self, tmp_path, monkeypatch):
+        """The sidecar round-trips through the stdlib when orjson is not installed."""
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        jobs_file = tmp_path / "jobs.yaml"
+        write_jobs(jobs_file, ("café", "Order a crème brûlée"))
+        cli.load_jobs_from_file(jobs_file)
+
+        cli._JOBS_CACHE.clear()
+        monkeypatch.setattr(yaml, "load", lambda *a, **kw: pytest.fail("YAML parsed"))
+        assert cli.load_jobs_from_file(jobs_file) == {"café": "Order a crème brûlée"}
+
+    def test_stale_sidecar_is_ignored(self, tmp_path):
+        """A sidecar built from another version of jobs.yaml is rebuilt from the YAML."""
+        jobs_file = tmp_path / "jobs.yaml"
+        write_jobs(jobs_file, ("evening", "Summarize my day"))
+        sidecar = tmp_path / ".jobs.cache.json"
+        st = jobs_file.stat()
+        sidecar.write_text(json.dumps({
+            "src_mtime_ns": st.st_mtime_ns - 1_000_000,
+            "src_size": st.st_size,
+            "jobs": {"morning": "Check my emails"},
+        }))
+
+        assert cli.load_jobs_from_file(jobs_file) == {"evening": "Summarize my day"}
+        assert json.loads(sidecar.read_text())["jobs"] == {"evening": "Summarize my day"}
+
+    def test_sidecar_newer_than_replaced_yaml_is_ignored(self, tmp_path):
+        """Restoring an older jobs.yaml (e.g. cp -p) does not reuse a newer sidecar."""
+        jobs_file = tmp_path / "jobs.yaml"
+        write_jobs(jobs_file, ("morning", "Check my emails"))
+        cli.load_jobs_from_file(jobs_file)
+        cli._JOBS_CACHE.clear()
+
+        write_jobs(jobs_file, ("evening", "Summarize my day"))
+        os.utime(jobs_file, ns=(0, 1_000_000_000))
+
+        assert cli.load_jobs_from_file(jobs_file) == {"evening": "Summarize my day"}
+
+    def test_old_sidecar_format_is_rebuilt(self, tmp_path):
+        jobs_file = tmp_path / "jobs.yaml"
+        write_jobs(jobs_file, ("evening", "Summarize my day"))
+        (tmp_path / ".jobs.cache.json").write_text('{"morning": "Check my emails"}')
+
+        assert cli.load_jobs_from_file(jobs_file) == {"evening": "Summarize my day"}
+
+
+class TestRunAsync:
+    """Tests for the _run_async helper."""
+
+    def test_returns_coroutine_result(self):
+        """The coroutine's return value is passed through."""
+
+        async def answer():
+            return 42
+
+        assert cli._run_async(answer()) == 42
+
+    def test_falls_back_to_asyncio_without_uvloop(self, monkeypatch):
+        """Without uvloop the coroutine still runs on the stock event loop."""
+        import asyncio
+
+        monkeypatch.setitem(sys.modules, "uvloop", None)
+
+        async def loop_type():
+            return type(asyncio.get_running_loop()).__module__
+
+        assert cli._run_async(loop_type()).startswith("asyncio")
+
+
+class TestTaskCategory:
+    """Tests for compact task listing categories."""
+
+    @pytest.mark.parametrize(
+        ("name", "category"),
+        [
+            ("get_unread_emails", "Mail"),
+            ("move_mail", "Mail"),
+            ("get_today_events", "Calendar"),
+            ("create_reminder", "Reminders"),
+            ("list_notes", "Notes"),
+            ("open_url", "Safari"),
+            ("get_safari_tabs", "Safari"),
+            ("get_system_info", "System"),
+        ],
+    )
+    def test_category(self, name, category):
+        assert cli._task_category(name) == category
+
+    def test_earlier_category_wins(self):
+        """Names matching several categories use the first in listing order."""
+        assert cli._task_category("note_from_event") == "Calendar"
+        assert cli._task_category("email_link") == "Mail"
+
+
+class TestGetRegistry:
+    """Tests for the per-process registry cache."""
+
+    def test_built_once_until_cleared(self):
+        cli._get_registry.cache_clear()
+        with patch(
+            "macbot.tasks.create_default_registry", side_effect=lambda: object()
+        ) as create:
+            first = cli._get_registry()
+            assert cli._get_registry() is first
+            cli._get_registry.cache_clear()
+            assert cli._get_registry() is not first
+        assert create.call_count == 2
+        cli._get_registry.cache_clear()
+
+
+class TestShowTasksSummary:
+    """Tests for the compact task listing."""
+
+    def test_single_write(self):
+        """The table and trailing blank line are flushed to the terminal together."""
+        from rich.console import Console
+
+        from macbot.tasks.base import FunctionTask
+        from macbot.tasks.registry import TaskRegistry
+
+        registry = TaskRegistry()
+        registry.register(FunctionTask(lambda: None, name="noop", description="x" * 80))
+        out = MagicMock(wraps=io.StringIO())
+        with patch.object(cli, "console", Console(file=out, width=80)):
+            cli._show_tasks_summary(registry)
+
+        out.write.assert_called_once()
+        text = out.write.call_args.args[0]
+        assert "noop" in text
+        assert "x" * 57 + "..." in text
+        assert text.endswith("\n\n")
+
+
+class TestCheckAppAccess:
+    """Tests for the batched AppleScript access probe."""
+
+    def test_single_osascript_run(self):
+        """All apps are probed by one osascript invocation."""
+        stdout = "Notes\tok\t12\nMail\t-1743\tNot authorized to send Apple events to Mail.\n"
+        completed = subprocess.CompletedProcess([], 0, stdout=stdout, stderr="")
+        with patch("subprocess.run", return_value=completed) as run:
+            access = cli._check_app_access(["Notes", "Mail", "Safari"])
+
+        run.assert_called_once()
+        script = run.call_args.args[0][2]
+        assert 'tell application "Notes" to set r to count of notes' in script
+        assert 'tell application "Safari" to set r to count of windows' in script
+        assert access["Notes"] == (True, "12")
+        assert access["Mail"][0] is False
+        assert access["Mail"][1].startswith("Permission denied")
+        assert access["Safari"] == (False, "No result from osascript")
+
+    def test_script_failure_marks_all_apps(self):
+        """A failing osascript run reports every app as inaccessible."""
+        completed = subprocess.CompletedProcess([], 1, stdout="", stderr="syntax error (-2741)")
+        with patch("subprocess.run", return_value=completed):
+            access = cli._check_app_access(["Notes", "Mail"])
+
+        assert [ok for ok, _ in access.values()] == [False, False]
+        assert "syntax error" in access["Notes"][1]
+
+
+class TestRunCommands:
+    """Tests for running external probes concurrently."""
+
+    def test_results_by_key(self):
+        results = cli._run_commands({
+            "ok": ([sys.executable, "-c", "print('hi')"], 10),
+            "fail": ([sys.executable, "-c", "import sys; sys.exit('boom')"], 10),
+        })
+
+        assert results["ok"].returncode == 0
+        assert results["ok"].stdout == "hi\n"
+        assert results["fail"].returncode == 1
+        assert "boom" in results["fail"].stderr
+
+    def test_runs_concurrently(self):
+        """Two one-second commands finish in well under two seconds."""
+        import time
+
+        sleep = [sys.executable, "-c", "import time; time.sleep(1)"]
+        start = time.monotonic()
+        cli._run_commands({"a": (sleep, 10), "b": (sleep, 10)})
+        assert time.monotonic() - start < 1.9
+
+    def test_failures_are_returned(self):
+        results = cli._run_commands({
+            "missing": (["definitely-not-a-command-xyz"], 5),
+            "slow": ([sys.executable, "-c", "import time; time.sleep(10)"], 0.2),
+        })
+
+        assert isinstance(results["missing"], FileNotFoundError)
+        assert isinstance(results["slow"], subprocess.TimeoutExpired)
+
+    def test_app_access_from_result(self):
+        """Probe results feed the same parser as _check_app_access."""
+        timeout = subprocess.TimeoutExpired(["osascript"], 5)
+        access = cli._parse_app_access(["Notes", "Mail"], timeout)
+
+        assert access == {
+            "Notes": (False, "Timeout (app not responding)"),
+            "Mail": (False, "Timeout (app not responding)"),
+        }
+
+
+class TestWaitForChatId:
+    """Tests for waiting on the first Telegram message."""
+
+    @staticmethod
+    def update(update_id, chat_id=None):
+        message = MagicMock(chat_id=chat_id) if chat_id is not None else None
+        return MagicMock(update_id=update_id, message=message)
+
+    async def test_single_long_poll(self):
+        """One getUpdates call waits for the whole timeout on the server."""
+        bot = MagicMock()
+        bot.get_updates = AsyncMock(return_value=[self.update(7, chat_id=1234)])
+
+        assert await cli._wait_for_chat_id(bot, timeout=30) == "1234"
+        bot.get_updates.assert_awaited_once()
+        assert bot.get_updates.await_args.kwargs["timeout"] in (29, 30)
+
+    async def test_skips_updates_without_message(self):
+        bot = MagicMock()
+        bot.get_updates = AsyncMock(
+            side_effect=[[self.update(7)], [self.update(8, chat_id=99)]]
+        )
+
+        assert await cli._wait_for_chat_id(bot, timeout=30, offset=5) == "99"
+        offsets = [call.kwargs["offset"] for call in bot.get_updates.await_args_list]
+        assert offsets == [5, 8]
+
+    async def test_timeout(self):
+        bot = MagicMock()
+        bot.get_updates = AsyncMock(return_value=[])
+
+        assert await cli._wait_for_chat_id(bot, timeout=0) is None
+        bot.get_updates.assert_not_awaited()
+
+
+class TestReadEnvFile:
+    """Tests for reading and writing the onboarding .env file."""
+
+    def test_parses_assignments(self, tmp_path):
+        env_file = tmp_path / ".env"
+        env_file.write_text(
+            "# MacBot Configuration\n"
+            "MACBOT_MODEL=anthropic/claude\n"
+            " MACBOT_TELEGRAM_CHAT_ID = 1234 \r\n"
+            "#MACBOT_OLD=1\n"
+            "not an assignment\n"
+            "MACBOT_PAPERLESS_URL=http://host/?a=b\n"
+        )
+
+        assert cli._read_env_file(env_file) == {
+            "MACBOT_MODEL": "anthropic/claude",
+            "MACBOT_TELEGRAM_CHAT_ID": "1234",
+            "MACBOT_PAPERLESS_URL": "http://host/?a=b",
+        }
+
+    def test_last_assignment_wins(self, tmp_path):
+        env_file = tmp_path / ".env"
+        env_file.write_text("KEY=old\nKEY=new\n")
+
+        assert cli._read_env_file(env_file) == {"KEY": "new"}
+
+    def test_round_trip(self, tmp_path):
+        """What onboarding writes reads back unchanged, header comments skipped."""
+        env_file = tmp_path / ".env"
+        cli._write_env_file(env_file, {"B": "2", "A": "1"})
+
+        assert env_file.read_text() == (
+            "# MacBot Configuration\n# Generated by 'son onboard'\n\nA=1\nB=2\n"
+        )
+        assert cli._read_env_file(env_file) == {"A": "1", "B": "2"}
+
+
+class TestTail:
+    """Tests for the _tail log helper."""
+
+    def test_last_lines(self, tmp_path):
+        log = tmp_path / "scheduler.log"
+        log.write_text("".join(f"line {i}\n" for i in range(100)))
+
+        assert cli._tail(log, 3) == ["line 97", "line 98", "line 99"]
+
+    def test_short_file(self, tmp_path):
+        """Asking for more lines than exist returns the whole file."""
+        log = tmp_path / "scheduler.log"
+        log.write_text("first\nsecond\n")
+
+        assert cli._tail(log, 10) == ["first", "second"]
+
+    def test_window_grows_for_long_lines(self, tmp_path):
+        """Lines longer than the initial read window are still returned whole."""
+        log = tmp_path / "scheduler.log"
+        long_line = "x" * 20000
+        log.write_text(f"{long_line}\n{long_line}\nlast\n")
+
+        assert cli._tail(log, 2) == [long_line, "last"]
+
+
+class TestParseTaskArg:
+    """Tests for key=value task argument conversion."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("true", True),
+            ("False", False),
+            ("42", 42),
+            ("-7", -7),
+            ("3.5", 3.5),
+            (".5", 0.5),
+            ("1e3", 1000.0),
+            ("hello", "hello"),
+            ("1.2.3", "1.2.3"),
+            ("", ""),
+        ],
+    )
+    def test_conversion(self, value, expected):
+        result = cli._parse_task_arg(value)
+        assert result == expected
+        assert type(result) is type(expected)
+
+
+class TestInteractiveLoop:
+    """Tests for the interactive chat loop."""
+
+    async def test_input_read_off_loop(self):
+        """Input is read on a worker thread and 'quit' ends the loop."""
+        agent = MagicMock()
+        agent.get_token_stats.return_value = {"context_tokens": 0, "session_total_tokens": 0}
+        threads = []
+
+        def fake_input(prompt):
+            threads.append(threading.current_thread())
+            return "quit" if len(threads) > 1 else "  "
+
+        with patch.object(cli.console, "input", side_effect=fake_input):
+            await cli.interactive_loop(agent)
+
+        assert len(threads) == 2
+        assert threading.main_thread() not in threads
+        agent.run.assert_not_called()
+
+    async def test_eof_ends_loop(self):
+        agent = MagicMock()
+        agent.get_token_stats.return_value = {"context_tokens": 0, "session_total_tokens": 0}
+
+        with patch.object(cli.console, "input", side_effect=EOFError):
+            await cli.interactive_loop(agent)
+
+    def test_ctrl_c_keeps_chatting(self, capsys):
+        """A real SIGINT under _run_async() prints a hint instead of ending the chat."""
+        agent = MagicMock()
+        agent.get_token_stats.return_value = {"context_tokens": 0, "session_total_tokens": 0}
+        handler = signal.getsignal(signal.SIGINT)
+
+        def fake_input(prompt):
+            time.sleep(0.1)  # Like a user, press Ctrl+C once the prompt is waiting
+            os.kill(os.getpid(), signal.SIGINT)
+            time.sleep(0.2)
+            return "quit"
+
+        with patch.object(cli.console, "input", side_effect=fake_input):
+            cli._run_async(cli.interactive_loop(agent))
+
+        out = capsys.readouterr().out
+        assert "Use 'quit' to exit." in out
+        assert "Goodbye!" in out
+        assert signal.getsignal(signal.SIGINT) is handler
+
+    def test_cancel_does_not_wait_for_blocked_input(self):
+        """Other cancellations propagate, and shutdown doesn't wait for stdin."""
+        agent = MagicMock()
+        agent.get_token_stats.return_value = {"context_tokens": 0, "session_total_tokens": 0}
+        release = threading.Event()
+
+        def fake_input(prompt):
+            release.wait(5)
+            return "quit"
+
+        async def cancel_chat():
+            task = asyncio.ensure_future(cli.interactive_loop(agent))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        start = time.monotonic()
+        try:
+            with patch.object(cli.console, "input", side_effect=fake_input):
+                cli._run_async(cancel_chat())
+            assert time.monotonic() - start < 2
+        finally:
+            release.set()
+
+
+class TestScheduleLog:
+    """Tests for 'schedule log'."""
+
+    def test_shows_last_lines(self, tmp_path, monkeypatch, capsys):
+        log = tmp_path / "scheduler.log"
+        log.write_text("one\ntwo\nthree\n")
+        monkeypatch.setattr(cli, "LOG_FILE", log)
+
+        cli.cmd_schedule_log(argparse.Namespace(follow=False, lines=2))
+
+        assert capsys.readouterr().out.split() == ["two", "three"]
+
+    def test_follow_spawns_tail(self, tmp_path, monkeypatch):
+        """--follow runs tail -f from the last --lines lines and waits for it."""
+        log = tmp_path / "scheduler.log"
+        log.write_text("one\n")
+        monkeypatch.setattr(cli, "LOG_FILE", log)
+
+        with patch("os.posix_spawnp", return_value=4242) as spawn, \
+                patch("os.waitpid", return_value=(4242, 0)) as wait:
+            cli.cmd_schedule_log(argparse.Namespace(follow=True, lines=50))
+
+        assert spawn.call_args.args[:2] == ("tail", ["tail", "-n", "50", "-f", str(log)])
+        wait.assert_called_once_with(4242, 0)
+
+
+    def test_follow_without_tail_binary(self, tmp_path, monkeypatch, capsys):
+        """Without tail(1), --follow prints the last lines and follows in-process."""
+        log = tmp_path / "scheduler.log"
+        log.write_text("one\ntwo\nthree\n")
+        monkeypatch.setattr(cli, "LOG_FILE", log)
+
+        def append(_):
+            with open(log, "a") as f:
+                f.write("four\n")
+
+        sleeps = iter([append, KeyboardInterrupt()])
+
+        def fake_sleep(seconds):
+            step = next(sleeps)
+            if isinstance(step, BaseException):
+                raise step
+            step(seconds)
+
+        monkeypatch.setattr("time.sleep", fake_sleep)
+        with patch("os.posix_spawnp", side_effect=FileNotFoundError):
+            cli.cmd_schedule_log(argparse.Namespace(follow=True, lines=2))
+
+        assert capsys.readouterr().out.split()[-3:] == ["two", "three", "four"]
+
+
+class TestWaitForExit:
+    """Tests for _wait_for_exit."""
+
+    def test_exited_process(self):
+        proc = subprocess.Popen(["true"])
+        proc.wait()
+
+        assert cli._wait_for_exit(proc.pid, timeout=0) is True
+
+    def test_running_process(self):
+        proc = subprocess.Popen(["sleep", "5"])
+        try:
+            assert cli._wait_for_exit(proc.pid, timeout=0.05) is False
+        finally:
+            proc.kill()
+            proc.wait()
+
+    def test_returns_when_process_exits(self):
+        proc = subprocess.Popen(["sleep", "0.1"])
+        try:
+            assert cli._wait_for_exit(proc.pid, timeout=5) is True
+        finally:
+            proc.wait()
+
+    def test_polling_fallback(self, monkeypatch):
+        monkeypatch.delattr(os, "pidfd_open", raising=False)
+        import select
+
+        monkeypatch.delattr(select, "kqueue", raising=False)
+        proc = subprocess.Popen(["true"])
+        proc.wait()
+
+        assert cli._wait_for_exit(proc.pid, timeout=0) is True
+
+    def test_polling_fallback_notices_quick_exit(self, monkeypatch):
+        import select
+        import time
+
+        monkeypatch.delattr(os, "pidfd_open", raising=False)
+        monkeypatch.delattr(select, "kqueue", raising=False)
+        proc = subprocess.Popen(["sleep", "0.05"])
+        threading.Thread(target=proc.wait).start()
+
+        start = time.monotonic()
+        assert cli._wait_for_exit(proc.pid, timeout=5) is True
+        assert time.monotonic() - start < 1
+
+
+class TestMaskSecret:
+    """Tests for _mask_secret."""
+
+    def test_long_secret(self):
+        assert cli._mask_secret("sk-ant-0123456789abcdef") == "sk-ant-0...cdef"
+
+    def test_short_secret_fully_hidden(self):
+        assert cli._mask_secret("short") == "***"
+
+
+class TestScheduleBackground:
+    """Tests for 'schedule --background'."""
+
+    @pytest.fixture
+    def macbot_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(cli, "MACBOT_DIR", tmp_path)
+        monkeypatch.setattr(cli, "PID_FILE", tmp_path / "scheduler.pid")
+        monkeypatch.setattr(cli, "LOG_FILE", tmp_path / "scheduler.log")
+        monkeypatch.setattr("macbot.core.preferences.CorePreferences.save_defaults", lambda self: None)
+        return tmp_path
+
+    def test_spawns_detached_cli(self, macbot_dir):
+        """The scheduler runs in a new session started from a fresh interpreter."""
+        args = argparse.Namespace(
+            goal="Check emails", task=None, interval=300, background=True, daemon_child=False,
+            verbose=False,
+        )
+        with patch("subprocess.Popen") as popen:
+            popen.return_value.pid = 4242
+            cli.cmd_schedule(args)
+
+        argv = popen.call_args.args[0]
+        assert argv[-4:] == [
+            "schedule", "--interval=300", "--daemon-child", "--goal=Check emails",
+        ]
+        assert popen.call_args.kwargs["start_new_session"] is True
+        assert (macbot_dir / "scheduler.pid").read_text() == "4242"
+
+    def test_child_starts_in_callers_directory(self, macbot_dir, monkeypatch):
+        """The child loads the same project .env; the top-level -v is passed on."""
+        project = macbot_dir / "project"
+        project.mkdir()
+        (project / ".env").write_text("MACBOT_TELEGRAM_BOT_TOKEN=123:from-project\n")
+        monkeypatch.chdir(project)
+        args = argparse.Namespace(
+            goal="Check emails", task=None, interval=300, background=True, daemon_child=False,
+            verbose=True,
+        )
+        with patch("subprocess.Popen") as popen:
+            popen.return_value.pid = 4242
+            cli.cmd_schedule(args)
+
+        argv = popen.call_args.args[0]
+        assert argv[len(cli._cli_command())] == "-v"
+        child_cwd = popen.call_args.kwargs.get("cwd") or os.getcwd()
+
+        # Load settings the way the child would, from the directory it starts in
+        code = "from macbot.config import settings; print(settings.telegram_bot_token)"
+        env = {k: v for k, v in os.environ.items() if k != "MACBOT_TELEGRAM_BOT_TOKEN"}
+        env["HOME"] = str(macbot_dir)
+        out = subprocess.run(
+            [sys.executable, "-c", code], cwd=child_cwd, env=env,
+            capture_output=True, text=True, check=True,
+        )
+        assert out.stdout.strip() == "123:from-project"
+
+    def test_daemon_leaves_start_directory(self, macbot_dir, monkeypatch):
+        """The daemon body moves to / once settings are loaded."""
+        monkeypatch.chdir(macbot_dir)
+        monkeypatch.setattr(cli, "_build_scheduler", MagicMock())
+        monkeypatch.setattr(cli, "_run_async", lambda coro: coro.close())
+        monkeypatch.setattr(cli.signal, "signal", MagicMock())
+        cwd = []
+        monkeypatch.setattr(cli.os, "chdir", cwd.append)
+
+        cli._run_schedule_daemon("Check emails", None, 300)
+
+        assert cwd == ["/"]
+
+    def test_cron_start_spawns_detached_cli(self, macbot_dir):
+        """'cron start --background' hands the scheduler to a fresh interpreter."""
+        job = MagicMock()
+        job.schedule.kind = "every"
+        job.payload.message = "Check emails"
+        service = MagicMock()
+        service.list_enabled_jobs.return_value = [job]
+        args = argparse.Namespace(background=True, daemon_child=False, verbose=False)
+        with (
+            patch.object(cli, "_get_cron_service", return_value=service),
+            patch.dict(cli._SCHED_FORMATTERS, {"every": lambda s: "every 5m"}),
+            patch("subprocess.Popen") as popen,
+        ):
+            popen.return_value.pid = 4343
+            cli.cmd_cron_start(args)
+
+        assert popen.call_args.args[0][-3:] == ["cron", "start", "--daemon-child"]
+        assert "cwd" not in popen.call_args.kwargs
+        assert (macbot_dir / "scheduler.pid").read_text() == "4343"
+
+    def test_telegram_uses_its_own_pid_and_log(self, macbot_dir, monkeypatch):
+        """The Telegram daemon never touches the scheduler's PID file."""
+        monkeypatch.setattr(cli, "TELEGRAM_PID_FILE", macbot_dir / "telegram.pid")
+        monkeypatch.setattr(cli, "TELEGRAM_LOG_FILE", macbot_dir / "telegram.log")
+        monkeypatch.setattr(cli.settings, "telegram_bot_token", "token")
+        monkeypatch.setattr(cli.settings, "telegram_chat_id", "1")
+        args = argparse.Namespace(daemon=True, daemon_child=False, verbose=True)
+        with (
+            patch("macbot.telegram.bot.validate_token", AsyncMock(return_value=(True, "bot"))),
+            patch("subprocess.Popen") as popen,
+        ):
+            popen.return_value.pid = 4444
+            cli.cmd_telegram_start(args)
+
+        assert popen.call_args.args[0][-4:] == ["-v", "telegram", "start", "--daemon-child"]
+        # Started where the token was loaded from, so the child finds it too
+        assert "cwd" not in popen.call_args.kwargs
+        assert popen.call_args.kwargs["stdout"].name == str(macbot_dir / "telegram.log")
+        assert (macbot_dir / "telegram.pid").read_text() == "4444"
+        assert not (macbot_dir / "scheduler.pid").exists()
+
+
+class TestBuildScheduler:
+    """Tests for the scheduler shared by foreground and background 'schedule'."""
+
+    @pytest.fixture(autouse=True)
+    def registry(self, monkeypatch):
+        monkeypatch.setattr(cli, "_get_registry", MagicMock())
+
+    def test_goal_job(self):
+        scheduler = cli._build_scheduler("Check emails", None, 300)
+        job = scheduler.jobs["scheduled_goal"]
+        assert job.goal == "Check emails"
+        assert job.interval_seconds == 300
+
+    def test_task_job(self):
+        scheduler = cli._build_scheduler(None, "get_system_info", 60)
+        job = scheduler.jobs["scheduled_task"]
+        assert job.task_name == "get_system_info"
+        assert job.interval_seconds == 60
+
+
+class TestFindJobGoal:
+    """Tests for find_job_goal."""
+
+    def test_multiline_prompt_skips_jobs_file(self, tmp_path, monkeypatch):
+        """Multi-line prompts are never job names, so no file is read."""
+        monkeypatch.setattr(cli, "load_jobs_from_file", lambda *a: pytest.fail("jobs loaded"))
+
+        assert cli.find_job_goal("Check my emails\nand reply", tmp_path / "jobs.yaml") is None
+
+    def test_missing_file_does_not_import_yaml(self, tmp_path, monkeypatch):
+        """Without a jobs file the YAML parser is never needed."""
+        monkeypatch.setitem(sys.modules, "yaml", None)
+
+        assert cli.find_job_goal("morning", tmp_path / "jobs.yaml") is None
+
+
+class TestIsoToMs:
+    """Tests for _iso_to_ms."""
+
+    def test_aware_datetime(self):
+        assert cli._iso_to_ms("2026-02-01T14:00:00+00:00") == 1769954400000
+        assert cli._iso_to_ms("2026-02-01T15:00:00.123+01:00") == 1769954400123
+
+    def test_naive_is_local_time(self):
+        expected = int(datetime(2026, 2, 1, 14, 0).timestamp() * 1000)
+        assert cli._iso_to_ms("2026-02-01T14:00:00") == expected
+
+    def test_parsed_datetime(self):
+        """Unquoted timestamps arrive from YAML as datetime objects."""
+        value = datetime(2026, 2, 1, 14, 0, tzinfo=timezone.utc)
+        assert cli._iso_to_ms(value) == 1769954400000
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            cli._iso_to_ms("tomorrow")
+
+
+class TestYamlSafeLoad:
+    """Tests for yaml_safe_load."""
+
+    def test_prefers_libyaml_loader(self, monkeypatch):
+        seen = {}
+        real_load = yaml.load
+
+        def spy(stream, **kwargs):
+            seen["loader"] = kwargs["Loader"]
+            return real_load(stream, **kwargs)
+
+        monkeypatch.setattr(yaml, "load", spy)
+        assert yaml_safe_load("jobs: []") == {"jobs": []}
+        assert seen["loader"] is getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    def test_rejects_unsafe_tags(self):
+        with pytest.raises(yaml.YAMLError):
+            yaml_safe_load("!!python/object/apply:os.system ['true']")
+
+
+class TestCronRunUntilStopped:
+    """Tests for _cron_run_until_stopped."""
+
+    async def test_stops_service_on_sigterm(self):
+        import asyncio
+        import signal
+
+        service = MagicMock()
+        started = asyncio.Event()
+
+        async def start():
+            started.set()
+            os.kill(os.getpid(), signal.SIGTERM)
+
+        async def stop():
+            service.stopped = True
+
+        service.start = start
+        service.stop = stop
+        service.stopped = False
+
+        await asyncio.wait_for(cli._cron_run_until_stopped(service), timeout=5)
+
+        assert started.is_set()
+        assert service.stopped
+
+
+class TestAtMsIso:
+    """Tests for _at_ms_iso."""
+
+    def test_matches_local_isoformat(self):
+        at_ms = 1_700_000_000_123
+        assert cli._at_ms_iso(at_ms) == datetime.fromtimestamp(at_ms / 1000).isoformat()
+
+
+class TestCronImport:
+    """Tests for 'cron import'."""
+
+    @pytest.fixture
+    def service(self, tmp_path, monkeypatch):
+        from macbot.cron import CronService
+
+        monkeypatch.setattr(cli, "PID_FILE", tmp_path / "scheduler.pid")
+        service = CronService(storage_path=tmp_path / "cron.json")
+        monkeypatch.setattr(cli, "_get_cron_service", lambda: service)
+        return service
+
+    def test_replaces_jobs_with_one_write(self, tmp_path, service):
+        service.schedule_every("Old", 60, "old goal")
+        config = tmp_path / "jobs.yaml"
+        config.write_text(
+            "jobs:\n"
+            "  - name: Hourly\n"
+            "    goal: check mail\n"
+            "    interval: 3600\n"
+            "  - name: Broken\n"
+            "    goal: no schedule\n"
+            "  - name: Morning\n"
+            "    goal: summarise\n"
+            "    cron: '0 9 * * *'\n"
+            "  - name: Typo\n"
+            "    goal: never runs\n"
+            "    cron: '0 25 * * *'\n"
+        )
+
+        with patch.object(service._storage, "_write_data", wraps=service._storage._write_data) as write:
+            cli.cmd_cron_import(argparse.Namespace(file=str(config)))
+
+        # One write to clear the old jobs and one to store the imported ones
+        assert write.call_count == 2
+        assert [job.name for job in service.list_jobs()] == ["Hourly", "Morning"]
+
+    def test_job_lines_printed_together(self, tmp_path, service):
+        config = tmp_path / "jobs.yaml"
+        config.write_text(
+            "jobs:\n"
+            "  - name: Hourly\n"
+            "    goal: check mail\n"
+            "    interval: 3600\n"
+            "  - goal: nameless\n"
+            "    interval: 60\n"
+            "  - just a string\n"
+            "  - name: Daily\n"
+            "    goal: summarise\n"
+            "    interval: 86400\n"
+        )
+
+        with patch.object(cli.console, "print") as print_:
+            cli.cmd_cron_import(argparse.Namespace(file=str(config)))
+
+        job_output = [c.args[0] for c in print_.call_args_list if "Hourly" in str(c.args)]
+        assert len(job_output) == 1
+        assert job_output[0].splitlines() == [
+            "[red]Skipping job without name[/red]",
+            "[red]Skipping invalid entry:[/red] 'just a string'",
+            "  [green]✓[/green] Hourly (every 3600s)",
+            "  [green]✓[/green] Daily (every 86400s)",
+        ]
+
+    def test_import_keeps_pid_file_of_unstopped_scheduler(self, tmp_path, service, monkeypatch):
+        pid_file = tmp_path / "scheduler.pid"
+        pid_file.write_text("4242")
+        monkeypatch.setattr(cli, "_get_scheduler_pid", lambda: 4242)
+        monkeypatch.setattr(cli, "_wait_for_exit", lambda pid, timeout=2.0: False)
+        config = tmp_path / "jobs.yaml"
+        config.write_text("jobs:\n  - name: Hourly\n    goal: check mail\n    interval: 3600\n")
+
+        with patch("os.kill") as kill:
+            cli.cmd_cron_import(argparse.Namespace(file=str(config)))
+
+        kill.assert_called_once()
+        assert pid_file.exists()
+
+
+class TestMainParsers:
+    """Tests for on-demand subcommand parser construction in main()."""
+
+    @pytest.fixture
+    def builders(self, monkeypatch):
+        spies = {
+            name: MagicMock(side_effect=build) for name, build in cli._COMMAND_PARSERS.items()
+        }
+        monkeypatch.setattr(cli, "_COMMAND_PARSERS", spies)
+        return spies
+
+    def test_builds_only_requested_command(self, builders, monkeypatch):
+        monkeypatch.setattr(sys, "argv", ["son", "-v", "version"])
+        with patch.object(cli, "cmd_version") as cmd_version, pytest.raises(SystemExit):
+            cli.main()
+
+        cmd_version.assert_called_once()
+        assert [name for name, spy in builders.items() if spy.called] == ["version"]
+
+    def test_bare_version_skips_argparse(self, builders, monkeypatch):
+        monkeypatch.setattr(sys, "argv", ["son", "version"])
+        with patch.object(cli, "cmd_version") as cmd_version, pytest.raises(SystemExit):
+            cli.main()
+
+        args = cmd_version.call_args.args[0]
+        assert args.command == "version" and args.verbose is False
+        assert not any(spy.called for spy in builders.values())
+
+    def test_unknown_command_builds_all(self, builders, monkeypatch, capsys):
+        monkeypatch.setattr(sys, "argv", ["son", "nonsense"])
+        with pytest.raises(SystemExit):
+            cli.main()
+
+        assert all(spy.called for spy in builders.values())
+        assert "invalid choice" in capsys.readouterr().err
+
+    @pytest.mark.parametrize("argv", [["son"], ["son", "version"]])
+    def test_skips_heavy_imports(self, argv, tmp_path):
+        code = (
+            "import sys\n"
+            f"sys.argv = {argv!r}\n"
+            "from macbot import cli\n"
+            "try:\n"
+            "    cli.main()\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print('rich.markdown' in sys.modules, 'macbot.core.agent' in sys.modules)\n"
+        )
+        env = {**os.environ, "HOME": str(tmp_path)}
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True
+        )
+        assert result.stdout.splitlines()[-1] == "False False"
+
+
+class TestCronStop:
+    """Tests for 'cron stop'."""
+
+    def test_waits_on_pid_and_removes_pid_file(self, tmp_path, monkeypatch):
+        pid_file = tmp_path / "scheduler.pid"
+        monkeypatch.setattr(cli, "PID_FILE", pid_file)
+        proc = subprocess.Popen(["sleep", "30"])
+        pid_file.write_text(str(proc.pid))
+
+        def reap_after_signal(pid, timeout=2.0):
+            proc.wait()
+            return True
+
+        monkeypatch.setattr(cli, "_wait_for_exit", reap_after_signal)
+        cli.cmd_cron_stop(argparse.Namespace())
+
+        assert proc.returncode == -15
+        assert not pid_file.exists()
+
+
+class TestSchedFormatters:
+    """Tests for the cron schedule display table."""
+
+    def test_every_kind_is_covered(self):
+        from macbot.cron import CronSchedule, ScheduleKind
+
+        schedules = {
+            ScheduleKind.AT: CronSchedule(kind=ScheduleKind.AT, at_ms=1_700_000_000_000),
+            ScheduleKind.EVERY: CronSchedule(kind=ScheduleKind.EVERY, every_ms=90_000),
+            ScheduleKind.CRON: CronSchedule(kind=ScheduleKind.CRON, cron_expr="0 9 * * *"),
+        }
+        assert set(cli._SCHED_FORMATTERS) == set(ScheduleKind)
+
+        rendered = {kind: cli._SCHED_FORMATTERS[kind](s) for kind, s in schedules.items()}
+        assert rendered[ScheduleKind.AT] == f"at {cli._at_ms_iso(1_700_000_000_000)}"
+        assert rendered[ScheduleKind.EVERY] == "every 90s"
+        assert rendered[ScheduleKind.CRON] == "0 9 * * *"
+
+
+class TestWritePidFile:
+    """Tests for _write_pid_file."""
+
+    def test_replaces_existing_file(self, tmp_path):
+        pid_file = tmp_path / "scheduler.pid"
+        pid_file.write_text("99999")
+
+        cli._write_pid_file(pid_file, 4242)
+
+        assert pid_file.read_text() == "4242"
+        assert [p.name for p in tmp_path.iterdir()] == ["scheduler.pid"]
+
+
+class TestReadLivePid:
+    """Tests for _read_live_pid."""
+
+    def test_missing_file(self, tmp_path):
+        assert cli._read_live_pid(tmp_path / "scheduler.pid") is None
+
+    def test_running_process(self, tmp_path):
+        pid_file = tmp_path / "scheduler.pid"
+        pid_file.write_text(f"{os.getpid()}\n")
+
+        assert cli._read_live_pid(pid_file) == os.getpid()
+
+    @pytest.mark.parametrize("content", ["", "garbage"])
+    def test_invalid_file_is_removed(self, tmp_path, content):
+        pid_file = tmp_path / "scheduler.pid"
+        pid_file.write_text(content)
+
+        assert cli._read_live_pid(pid_file) is None
+        assert not pid_file.exists()
+
+    def test_dead_process_is_removed(self, tmp_path):
+        proc = subprocess.Popen(["true"])
+        proc.wait()
+        pid_file = tmp_path / "scheduler.pid"
+        pid_file.write_text(str(proc.pid))
+
+        assert cli._read_live_pid(pid_file) is None
+        assert not pid_file.exists()
@@ -87,6 +87,16 @@ class TestComputeNextRun:
         assert next_run > now
         assert next_run.minute == 0  # Should be at minute 0
 
+    def test_cron_schedule_reuses_parsed_expression(self) -> None:
+        """Test that repeated computations from different times stay independent."""
+        schedule = CronSchedule(kind=ScheduleKind.CRON, cron_expr="30 9 * * *")
+        early = datetime(2026, 3, 2, 8, 0, tzinfo=timezone.utc)
+        late = datetime(2026, 3, 2, 10, 0, tzinfo=timezone.utc)
+
+        assert compute_next_run(schedule, now=late) == datetime(2026, 3, 3, 9, 30, tzinfo=timezone.utc)
+        assert compute_next_run(schedule, now=early) == datetime(2026, 3, 2, 9, 30, tzinfo=timezone.utc)
+        assert compute_next_run(schedule, now=late) == datetime(2026, 3, 3, 9, 30, tzinfo=timezone.utc)
+
     def test_cron_schedule_with_timezone(self) -> None:
         """Test cron schedule respects timezone."""
         schedule = CronSchedule(
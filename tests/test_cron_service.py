@@ -0,0 +1,60 @@
+"""Tests for the cron service."""
+
+import tempfile
+from pathlib import Path
+
+from macbot.cron.service import CronService
+from macbot.cron.storage import CronStorage
+from macbot.cron.types import CronJobCreate, CronPayload, CronSchedule, ScheduleKind
+
+
+def create_test_job(name: str = "Test Job") -> CronJobCreate:
+    """Create job parameters for a test job."""
+    return CronJobCreate(
+        name=name,
+        schedule=CronSchedule(kind=ScheduleKind.EVERY, every_ms=60000),
+        payload=CronPayload(message="Test message"),
+    )
+
+
+class TestCronService:
+    """Tests for CronService."""
+
+    def test_clear_jobs(self) -> None:
+        """Test clearing all jobs in one storage write."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "cron.json"
+            service = CronService(storage_path=path)
+
+            service.create_job(create_test_job("job1"))
+            service.create_job(create_test_job("job2"))
+
+            count = service.clear_jobs()
+
+            assert count == 2
+            assert service.list_jobs() == []
+            assert CronStorage(path).count() == 0
+
+    def test_create_jobs(self) -> None:
+        """Test creating several jobs at once."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "cron.json"
+            service = CronService(storage_path=path)
+
+            jobs = service.create_jobs([create_test_job("job1"), create_test_job("job2")])
+
+            assert [job.name for job in jobs] == ["job1", "job2"]
+            assert all(job.state.next_run_at is not None for job in jobs)
+            assert {job.id for job in service.list_jobs()} == {job.id for job in jobs}
+            assert [job.id for job in CronStorage(path).load()] == [job.id for job in jobs]
+
+    def test_list_enabled_jobs(self) -> None:
+        """Test listing only enabled jobs."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            service = CronService(storage_path=Path(tmpdir) / "cron.json")
+
+            job1 = service.create_job(create_test_job("job1"))
+            job2 = service.create_job(create_test_job("job2"))
+            service.disable_job(job1.id)
+
+            assert service.list_enabled_jobs() == [job2]
@@ -1,5 +1,7 @@
 """Tests for cron job storage."""
 
+import json
+import sys
 import tempfile
 from pathlib import Path
 
@@ -80,6 +82,30 @@ class TestCronStorage:
             with pytest.raises(ValueError, match="already exists"):
                 storage.add(create_test_job("job1"))
 
+    def test_add_many_jobs(self) -> None:
+        """Test adding several jobs at once."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "cron.json"
+            storage = CronStorage(path)
+
+            storage.add(create_test_job("job1"))
+            storage.add_many([create_test_job("job2"), create_test_job("job3")])
+
+            assert [job.id for job in storage.load()] == ["job1", "job2", "job3"]
+
+    def test_add_many_duplicate_fails(self) -> None:
+        """Test that add_many rejects duplicate IDs without writing."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "cron.json"
+            storage = CronStorage(path)
+
+            storage.add(create_test_job("job1"))
+
+            with pytest.raises(ValueError, match="already exists"):
+                storage.add_many([create_test_job("job2"), create_test_job("job1")])
+
+            assert storage.count() == 1
+
     def test_get_job(self) -> None:
         """Test getting a specific job."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -205,6 +231,40 @@ class TestCronStorage:
             assert len(loaded) == 1
             assert loaded[0].id == "persistent_job"
 
+    def test_unicode_round_trip(self) -> None:
+        """Test that non-ASCII job data survives a save and load."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "cron.json"
+            storage = CronStorage(path)
+
+            job = create_test_job("job1")
+            job.payload.message = "Grüße an Zoë ☕"
+            storage.save([job])
+
+            assert storage.load()[0].payload.message == "Grüße an Zoë ☕"
+
+    def test_load_file_written_by_stdlib_json(self) -> None:
+        """Test loading a file written with json.dumps and ASCII escapes."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "cron.json"
+            job = create_test_job("job1")
+            job.name = "Café"
+            data = {"version": 1, "jobs": [job.model_dump(mode="json")]}
+            path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+            assert CronStorage(path).load()[0].name == "Café"
+
+    def test_round_trip_without_orjson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the stdlib fallback writes the same indented JSON."""
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "cron.json"
+            storage = CronStorage(path)
+            storage.save([create_test_job("job1")])
+
+            assert path.read_text().startswith('{\n  "version": 1')
+            assert storage.load()[0].id == "job1"
+
     def test_file_not_found_without_create(self) -> None:
         """Test that FileNotFoundError is raised when create_if_missing=False."""
         with tempfile.TemporaryDirectory() as tmpdir:
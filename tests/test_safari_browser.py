@@ -0,0 +1,506 @@
+"""Tests for the Safari browser controller."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from macbot.browser import safari
+from macbot.browser.safari import BrowserError, SafariBrowser
+
+# Stand-in for js-worker.js: evaluates nothing, just echoes the code back
+FAKE_WORKER = """
+import json, sys
+for line in sys.stdin:
+    code = json.loads(line)["code"]
+    if code == "exit":
+        break
+    if code == "fail":
+        print(json.dumps({"success": False, "error": "JavaScript error: boom"}), flush=True)
+    elif code.startswith("typeof window.__ariaGetText"):
+        print(json.dumps({"success": True, "result": json.dumps({"success": True, "text": "hi"})}), flush=True)
+    else:
+        print(json.dumps({"success": True, "result": code}), flush=True)
+"""
+
+SNAPSHOT_JSON = {
+    "success": True,
+    "snapshot": '[e1] button "Submit"',
+    "refs": {"e1": {"role": "button", "name": "Submit", "tag": "button"}},
+    "url": "https://example.com",
+    "title": "Example",
+}
+
+
+@pytest.fixture
+def run_script():
+    """Patch the script runner so no subprocesses are spawned."""
+
+    async def fake(script_name, args=None, timeout=30):
+        if script_name == "snapshot.sh":
+            return dict(SNAPSHOT_JSON)
+        return {"success": True}
+
+    with (
+        patch("macbot.browser.safari._run_script", AsyncMock(side_effect=fake)) as mock,
+        patch.object(SafariBrowser, "_eval_js", AsyncMock(return_value=None)),
+    ):
+        yield mock
+
+
+def _snapshot_calls(mock: AsyncMock) -> int:
+    return sum(1 for c in mock.call_args_list if c.args[0] == "snapshot.sh")
+
+
+class TestSnapshotCache:
+    async def test_repeated_snapshot_is_cached(self, run_script):
+        browser = SafariBrowser()
+        first = await browser.snapshot()
+        second = await browser.snapshot()
+        assert first is second
+        assert _snapshot_calls(run_script) == 1
+
+    async def test_different_args_miss_cache(self, run_script):
+        browser = SafariBrowser()
+        await browser.snapshot()
+        await browser.snapshot(max_elements=50)
+        assert _snapshot_calls(run_script) == 2
+
+    async def test_inject_bypasses_cache(self, run_script):
+        browser = SafariBrowser()
+        await browser.snapshot()
+        await browser.snapshot(inject=True)
+        assert _snapshot_calls(run_script) == 2
+
+    async def test_navigate_invalidates(self, run_script):
+        browser = SafariBrowser()
+        await browser.snapshot()
+        await browser.navigate("https://example.com/other")
+        await browser.snapshot()
+        assert _snapshot_calls(run_script) == 2
+
+    @pytest.mark.parametrize(
+        "action",
+        [
+            lambda b: b.click("e1"),
+            lambda b: b.type("e1", "hello"),
+            lambda b: b.select("e1", "x"),
+            lambda b: b.press_key("enter"),
+            lambda b: b.physical_click("e1"),
+            lambda b: b.execute_js("document.title"),
+            lambda b: b.dismiss_cookies(),
+        ],
+    )
+    async def test_mutation_invalidates(self, run_script, action):
+        browser = SafariBrowser()
+        await browser.snapshot()
+        await action(browser)
+        await browser.snapshot()
+        assert _snapshot_calls(run_script) == 2
+
+    async def test_mutation_during_snapshot_invalidates(self, run_script):
+        """A click that starts while snapshot.sh runs isn't hidden by the result."""
+        browser = SafariBrowser()
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow(script_name, args=None, timeout=30):
+            if script_name == "snapshot.sh":
+                started.set()
+                await release.wait()
+                return dict(SNAPSHOT_JSON)
+            return {"success": True}
+
+        run_script.side_effect = slow
+        snap = asyncio.ensure_future(browser.snapshot())
+        await started.wait()
+        click = asyncio.ensure_future(browser.click("e1"))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(snap, click)
+
+        await browser.snapshot()
+        assert _snapshot_calls(run_script) == 2
+
+
+class TestSnapshotRange:
+    async def test_range_args_passed_to_script(self, run_script):
+        browser = SafariBrowser()
+        await browser.snapshot(start_ref=201, end_ref=400)
+        args = run_script.call_args.args[1]
+        assert args[args.index("--start-ref") + 1] == "201"
+        assert args[args.index("--end-ref") + 1] == "400"
+
+    async def test_default_range_omits_args(self, run_script):
+        browser = SafariBrowser()
+        await browser.snapshot()
+        args = run_script.call_args.args[1]
+        assert "--start-ref" not in args
+        assert "--end-ref" not in args
+
+    async def test_truncated_flag(self, run_script):
+        browser = SafariBrowser()
+        snap = await browser.snapshot()
+        assert snap.truncated is False
+
+        run_script.side_effect = None
+        run_script.return_value = {**SNAPSHOT_JSON, "truncated": True}
+        snap = await browser.snapshot(start_ref=2)
+        assert snap.truncated is True
+
+
+@pytest.fixture
+def no_worker():
+    """Force the script fallback instead of the JavaScript worker."""
+    with patch.object(SafariBrowser, "_eval_js", AsyncMock(return_value=None)):
+        yield
+
+
+@pytest.mark.usefixtures("no_worker")
+class TestConcurrency:
+    async def test_get_texts_preserves_order(self):
+        async def fake(script_name, args=None, timeout=30):
+            return {"success": True, "text": f"text-{args[0]}"}
+
+        with patch("macbot.browser.safari._run_script", AsyncMock(side_effect=fake)):
+            browser = SafariBrowser()
+            texts = await browser.get_texts(["e1", "e2", "e3"])
+        assert texts == ["text-e1", "text-e2", "text-e3"]
+
+    async def test_concurrency_is_bounded(self):
+        running = 0
+        peak = 0
+
+        async def fake(script_name, args=None, timeout=30):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"success": True, "text": ""}
+
+        with patch("macbot.browser.safari._run_script", AsyncMock(side_effect=fake)):
+            browser = SafariBrowser()
+            await browser.get_texts([f"e{i}" for i in range(10)])
+        assert peak == SafariBrowser.MAX_CONCURRENT_SCRIPTS
+
+
+@pytest.fixture
+def fake_worker():
+    with patch(
+        "macbot.browser.safari._js_worker_command",
+        return_value=[sys.executable, "-c", FAKE_WORKER],
+    ):
+        yield
+
+
+@pytest.mark.usefixtures("fake_worker")
+class TestJsWorker:
+    async def test_execute_js_reuses_worker(self):
+        browser = SafariBrowser()
+        first = await browser.execute_js("document.title")
+        worker = browser._worker
+        second = await browser.execute_js("location.href")
+        assert first["result"] == "document.title"
+        assert second["result"] == "location.href"
+        assert browser._worker is worker
+        await browser._stop_worker()
+
+    async def test_execute_js_parses_json_results(self):
+        browser = SafariBrowser()
+        result = await browser.execute_js('{"a": 1}')
+        assert result["result"] == {"a": 1}
+        await browser._stop_worker()
+
+    async def test_execute_js_error(self):
+        browser = SafariBrowser()
+        with pytest.raises(BrowserError, match="boom"):
+            await browser.execute_js("fail")
+        await browser._stop_worker()
+
+    async def test_get_text(self):
+        browser = SafariBrowser()
+        assert await browser.get_text("e1") == "hi"
+        await browser._stop_worker()
+
+    async def test_falls_back_to_script_when_worker_cannot_start(self):
+        browser = SafariBrowser()
+        with (
+            patch("macbot.browser.safari._js_worker_command", return_value=["/nonexistent/osascript"]),
+            patch(
+                "macbot.browser.safari._run_script",
+                AsyncMock(return_value={"success": True, "result": "from-script"}),
+            ) as run_script,
+        ):
+            result = await browser.execute_js("document.title")
+        assert result["result"] == "from-script"
+        assert run_script.call_args.args[0] == "execute-js.sh"
+        assert browser._worker_disabled
+
+    async def test_worker_exit_after_request_is_not_retried(self):
+        """Code the worker may already have run is never run again by a script."""
+        browser = SafariBrowser()
+        with patch("macbot.browser.safari._run_script", AsyncMock()) as run_script:
+            with pytest.raises(BrowserError, match="exited during evaluation"):
+                await browser.execute_js("exit")
+        run_script.assert_not_called()
+        assert browser._worker is None
+        assert browser._worker_disabled
+
+    async def test_result_over_64k(self):
+        """Results longer than asyncio's default line limit come through whole."""
+        browser = SafariBrowser()
+        code = "x" * (200 * 1024)
+        result = await browser.execute_js(code)
+        assert result["result"] == code
+        await browser._stop_worker()
+
+    async def test_oversized_result_raises_and_restarts_worker(self):
+        """A line over the limit is an error and never leaks into the next eval."""
+        browser = SafariBrowser()
+        with (
+            patch("macbot.browser.safari._WORKER_LINE_LIMIT", 1024),
+            patch("macbot.browser.safari._run_script", AsyncMock()) as run_script,
+        ):
+            with pytest.raises(BrowserError, match="larger than"):
+                await browser.execute_js("x" * 4096)
+            run_script.assert_not_called()
+            assert browser._worker is None
+            assert not browser._worker_disabled
+
+            assert (await browser.execute_js("document.title"))["result"] == "document.title"
+        await browser.aclose()
+
+    async def test_aclose_stops_worker(self):
+        browser = SafariBrowser()
+        await browser.execute_js("document.title")
+        worker = browser._worker
+        await browser.aclose()
+        assert browser._worker is None
+        assert worker.returncode is not None
+
+    def test_reused_across_event_loops(self):
+        """A browser kept between asyncio.run() calls starts a fresh worker."""
+        browser = SafariBrowser()
+        assert asyncio.run(browser.execute_js("one"))["result"] == "one"
+
+        async def second():
+            result = await browser.execute_js("two")
+            await browser.aclose()
+            return result
+
+        assert asyncio.run(second())["result"] == "two"
+
+
+class TestElementInfo:
+    async def test_info_is_memoized_per_snapshot(self, run_script):
+        browser = SafariBrowser()
+        assert browser.get_element_info("e1") is None
+
+        await browser.snapshot()
+        info = browser.get_element_info("e1")
+        assert info == {
+            "ref": "e1",
+            "role": "button",
+            "name": "Submit",
+            "value": None,
+            "tag": "button",
+            "interactive": True,
+        }
+        assert browser.get_element_info("e1") is info
+        assert browser.get_element_info("e99") is None
+
+        await browser.click("e1")
+        await browser.snapshot()
+        assert browser.get_element_info("e1") is not info
+
+
+class TestScreenshot:
+    async def test_screenshot_bytes_read_from_temp_file(self):
+        async def fake(script_name, args=None, timeout=30):
+            path = args[args.index("--output") + 1]
+            with open(path, "wb") as f:
+                f.write(b"\x89PNG data")
+            return {"success": True, "path": path}
+
+        with patch("macbot.browser.safari._run_script", AsyncMock(side_effect=fake)) as mock:
+            browser = SafariBrowser()
+            data = await browser.screenshot()
+
+        assert data == b"\x89PNG data"
+        temp_path = mock.call_args.args[1][1]
+        assert not os.path.exists(temp_path)
+
+    async def test_screenshot_to_path(self, tmp_path):
+        target = str(tmp_path / "shot.png")
+        with patch(
+            "macbot.browser.safari._run_script",
+            AsyncMock(return_value={"success": True, "path": target}),
+        ) as mock:
+            browser = SafariBrowser()
+            assert await browser.screenshot(target) == target
+        assert mock.call_args.args[1] == ["--output", target, "--no-interactive"]
+
+    async def test_screenshot_is_never_interactive(self):
+        with patch(
+            "macbot.browser.safari._run_script",
+            AsyncMock(return_value={"success": False}),
+        ) as mock:
+            browser = SafariBrowser()
+            with pytest.raises(BrowserError):
+                await browser.screenshot()
+        assert "--no-interactive" in mock.call_args.args[1]
+
+    async def test_script_does_not_wait_for_a_click(self, tmp_path, monkeypatch):
+        """With --no-interactive a failed window capture isn't retried with -w."""
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        calls = tmp_path / "calls"
+        _write_script(bin_dir, "osascript", "echo 42")
+        _write_script(bin_dir, "screencapture", f'echo "$@" >> "{calls}"')
+        monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+        with pytest.raises(BrowserError, match="Failed to capture screenshot"):
+            await safari._run_script(
+                "screenshot.sh", ["--output", str(tmp_path / "shot.png"), "--no-interactive"]
+            )
+        assert calls.read_text().split("\n")[0].startswith("-l42")
+        assert "-w" not in calls.read_text().split()
+
+
+class TestNavigateInjection:
+    async def test_same_origin_skips_inject(self, run_script):
+        browser = SafariBrowser()
+        await browser.navigate("https://example.com/a")
+        assert "--skip-inject" not in run_script.call_args.args[1]
+        await browser.navigate("https://example.com/b#top")
+        assert "--skip-inject" in run_script.call_args.args[1]
+
+    async def test_cross_origin_and_close_reinject(self, run_script):
+        browser = SafariBrowser()
+        await browser.navigate("https://example.com/a")
+        await browser.navigate("https://other.example/a")
+        assert "--skip-inject" not in run_script.call_args.args[1]
+
+        await browser.close()
+        await browser.navigate("https://other.example/b")
+        assert "--skip-inject" not in run_script.call_args.args[1]
+
+    async def test_new_tab_reinjects(self, run_script):
+        browser = SafariBrowser()
+        await browser.navigate("https://example.com/a")
+        await browser.navigate("https://example.com/b", new_tab=True)
+        assert "--skip-inject" not in run_script.call_args.args[1]
+
+
+class TestRegisteredJs:
+    @pytest.fixture
+    def page(self):
+        """Emulate window.__macbot_fns on the page."""
+        page = {"fns": set(), "sent": []}
+
+        async def fake(self, code):
+            page["sent"].append(code)
+            if code.startswith("(function() { window.__macbot_fns"):
+                page["fns"].add("title")
+                return {"success": True, "result": "ok"}
+            if code.startswith("(window.__macbot_fns"):
+                if "title" in page["fns"]:
+                    return {"success": True, "result": "Example"}
+                return {"success": True, "result": "__macbot_fn_missing__"}
+            return {"success": True, "result": "full"}
+
+        with patch.object(SafariBrowser, "_execute_js_code", fake):
+            yield page
+
+    async def test_registered_code_sends_short_call(self, page):
+        browser = SafariBrowser()
+        await browser.register_js("title", "document.title")
+        page["sent"].clear()
+
+        result = await browser.execute_js("document.title")
+        assert result["result"] == "Example"
+        assert page["sent"] == [
+            '(window.__macbot_fns && window.__macbot_fns["title"])'
+            ' ? window.__macbot_fns["title"]() : "__macbot_fn_missing__"'
+        ]
+
+    async def test_unregistered_code_is_sent_in_full(self, page):
+        browser = SafariBrowser()
+        result = await browser.execute_js("document.title")
+        assert result["result"] == "full"
+        assert page["sent"] == ["document.title"]
+
+    async def test_redefines_after_reload(self, page):
+        browser = SafariBrowser()
+        await browser.register_js("title", "document.title")
+        page["fns"].clear()  # page reloaded
+
+        result = await browser.execute_js("document.title")
+        assert result["result"] == "Example"
+        assert len(page["sent"]) == 4
+
+
+@pytest.fixture
+def scripts_dir(tmp_path):
+    """Point the script runner at a temporary scripts directory."""
+    with (
+        patch.object(safari, "SCRIPTS_BASE", str(tmp_path)),
+        patch.dict(safari._SCRIPT_PATHS, clear=True),
+    ):
+        yield tmp_path
+
+
+def _write_script(directory, name: str, body: str) -> None:
+    path = directory / name
+    path.write_text("#!/bin/sh\n" + body + "\n")
+    path.chmod(0o755)
+
+
+class TestRunScript:
+    async def test_parses_json_output(self, scripts_dir):
+        _write_script(scripts_dir, "ok.sh", """echo '{"success": true, "arg": "'"$1"'"}'""")
+        result = await safari._run_script("ok.sh", ["a b"])
+        assert result == {"success": True, "arg": "a b"}
+
+    @pytest.mark.parametrize("orjson_installed", [True, False])
+    async def test_invalid_json(self, scripts_dir, monkeypatch, orjson_installed):
+        if not orjson_installed:
+            monkeypatch.setitem(sys.modules, "orjson", None)
+        _write_script(scripts_dir, "bad.sh", "echo not-json")
+        with pytest.raises(BrowserError, match="Invalid JSON response"):
+            await safari._run_script("bad.sh")
+
+    async def test_error_response(self, scripts_dir):
+        _write_script(scripts_dir, "err.sh", """echo '{"success": false, "error": "nope"}'""")
+        with pytest.raises(BrowserError, match="nope"):
+            await safari._run_script("err.sh")
+
+    async def test_empty_output(self, scripts_dir):
+        _write_script(scripts_dir, "empty.sh", "true")
+        with pytest.raises(BrowserError, match="no output"):
+            await safari._run_script("empty.sh")
+
+    async def test_missing_script(self, scripts_dir):
+        with pytest.raises(BrowserError, match="Script not found"):
+            await safari._run_script("missing.sh")
+
+
+def test_mutators_are_marked():
+    """Every page-changing action must invalidate the snapshot cache."""
+    for name in (
+        "click",
+        "type",
+        "select",
+        "scroll_to",
+        "close",
+        "dismiss_cookies",
+        "press_key",
+        "physical_click",
+        "execute_js",
+    ):
+        assert getattr(SafariBrowser, name).__wrapped__, name
@@ -143,6 +143,25 @@ class TestTaskRegistry:
         tasks = registry.list_tasks()
         assert len(tasks) == 2
 
+    def test_sorted_tasks(self) -> None:
+        """Tasks are listed by name, and the ordering follows registry changes."""
+        registry = TaskRegistry()
+        registry.register(SimpleTask())
+
+        @registry.task()
+        def another_task() -> None:
+            pass
+
+        assert [t.name for t in registry.sorted_tasks()] == ["another_task", "simple_task"]
+        assert registry.sorted_tasks() is registry.sorted_tasks()
+
+        @registry.task()
+        def zebra_task() -> None:
+            pass
+
+        registry.unregister("another_task")
+        assert [t.name for t in registry.sorted_tasks()] == ["simple_task", "zebra_task"]
+
     @pytest.mark.asyncio
     async def test_execute_task(self) -> None:
         """Test executing a task through the registry."""
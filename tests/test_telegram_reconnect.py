@@ -6,7 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from macbot.telegram.bot import TelegramBot, _make_bot
+from macbot.telegram.bot import TelegramBot, _make_bot, validate_token
 
 
 class TestTelegramBotTimeouts:
@@ -72,6 +72,36 @@ class TestTelegramBotRefresh:
             assert bot._bot is new_bot
 
 
+class TestValidateToken:
+    """Verify token validation with a temporary or caller-owned bot."""
+
+    @staticmethod
+    def _ptb_bot() -> AsyncMock:
+        ptb_bot = AsyncMock()
+        ptb_bot.get_me.return_value = MagicMock(id=1, username="simon_bot", first_name="Simon")
+        return ptb_bot
+
+    @pytest.mark.asyncio
+    async def test_temporary_bot_is_closed(self) -> None:
+        """Without a bot, validate_token checks with its own and shuts it down."""
+        with patch("macbot.telegram.bot._make_bot") as mock_make:
+            mock_make.return_value = self._ptb_bot()
+
+            assert await validate_token("123:abc") == (True, "@simon_bot")
+            mock_make.return_value.shutdown.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_given_bot_stays_open(self) -> None:
+        """A caller's bot is used for getMe and left open for further calls."""
+        with patch("macbot.telegram.bot._make_bot") as mock_make:
+            mock_make.return_value = self._ptb_bot()
+            bot = TelegramBot("123:abc")
+
+            assert await validate_token("123:abc", bot=bot) == (True, "@simon_bot")
+            mock_make.assert_called_once()
+            mock_make.return_value.shutdown.assert_not_awaited()
+
+
 class TestPollingLoopReconnect:
     """Verify that the polling loop detects sleep gaps and reconnects."""
 